@@ -0,0 +1,97 @@
+"""Maintenance commands.
+
+Usage:
+    python -m app.cli rebuild-rollups [--chunk-size N]
+    python -m app.cli reenrich [--limit N] [--concurrency N]
+    python -m app.cli record-reddit --keywords K [K ...] --output FILE.jsonl.gz
+"""
+
+import argparse
+import asyncio
+
+from app.db.indexes import ensure_indexes
+from app.db.mongodb import mongodb
+from app.integrations.reddit_replay import RedditRecorder
+from app.services.product_dna import product_dna_service
+from app.services.rollups import rollup_service
+from app.utils.logging import logger, setup_logging
+
+
+async def rebuild_rollups(args: argparse.Namespace) -> None:
+    """Recompute the trend rollups from the raw product_dna collection."""
+    processed = await rollup_service.rebuild(
+        product_dna_service.collection, chunk_size=args.chunk_size
+    )
+    logger.info(f"Rebuilt rollups from {processed} posts")
+
+
+async def reenrich(args: argparse.Namespace) -> None:
+    """Re-run enrichment for records stored with fallback values."""
+    counts = await product_dna_service.reenrich_degraded(
+        limit=args.limit, concurrency=args.concurrency
+    )
+    logger.info(f"Re-enrichment: {counts}")
+
+
+async def record_reddit(args: argparse.Namespace) -> None:
+    """Snapshot a live Reddit search to a replayable corpus."""
+    recorder = RedditRecorder(args.output, comments_per_post=args.comments)
+    async for _ in recorder.iter_search_pages(
+        keywords=args.keywords,
+        subreddits=args.subreddits,
+        limit=args.limit,
+        time_filter=args.time_filter,
+    ):
+        pass
+    logger.info(f"Recorded {recorder.recorded} posts to {args.output}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subcommand per maintenance task."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-rollups", help="Backfill trend rollups")
+    rebuild.add_argument("--chunk-size", type=int, default=None, help="Posts per flush")
+    rebuild.set_defaults(handler=rebuild_rollups)
+
+    repair = commands.add_parser("reenrich", help="Re-enrich records stored with fallbacks")
+    repair.add_argument("--limit", type=int, default=None, help="Maximum records to process")
+    repair.add_argument("--concurrency", type=int, default=None, help="Posts enriched at once")
+    repair.set_defaults(handler=reenrich)
+
+    record = commands.add_parser("record-reddit", help="Record a Reddit search for replay")
+    record.add_argument("--keywords", nargs="+", required=True, help="Search keywords")
+    record.add_argument("--subreddits", nargs="+", default=None, help="Subreddits to search")
+    record.add_argument("--limit", type=int, default=100, help="Maximum posts to record")
+    record.add_argument("--time-filter", default="week", help="hour/day/week/month/year/all")
+    record.add_argument("--comments", type=int, default=0, help="Top comments stored per post")
+    record.add_argument("--output", required=True, help="Gzipped JSONL file to append to")
+    record.set_defaults(handler=record_reddit, needs_db=False)
+
+    return parser
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Connect to MongoDB (if the command needs it), run the command, and disconnect."""
+    if not getattr(args, "needs_db", True):
+        await args.handler(args)
+        return
+
+    await mongodb.connect()
+    try:
+        await ensure_indexes(mongodb.db)
+        await args.handler(args)
+    finally:
+        await mongodb.disconnect()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    setup_logging()
+    args = build_parser().parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
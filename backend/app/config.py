@@ -22,14 +22,27 @@ class Settings(BaseSettings):
         default="mongodb://localhost:27017", description="MongoDB connection URI"
     )
     MONGODB_DB_NAME: str = Field(default="pulse", description="MongoDB database name")
+    MONGO_BULK_CHUNK_SIZE: int = Field(
+        default=500, ge=1, description="Maximum operations per MongoDB bulk_write call"
+    )
 
-    # Cache configuration (for Sprint 1)
+    # Cache configuration (optional LLM cache tier and shared rate limits)
     REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
 
     # Reddit API
     REDDIT_CLIENT_ID: str = Field(default="", description="Reddit API client ID")
     REDDIT_CLIENT_SECRET: str = Field(default="", description="Reddit API client secret")
     REDDIT_USER_AGENT: str = Field(default="PulsePlatform/1.0", description="Reddit API user agent")
+    REDDIT_PAGE_SIZE: int = Field(
+        default=25, ge=1, le=100, description="Posts per page when streaming search results"
+    )
+    REDDIT_REQUESTS_PER_MINUTE: float = Field(
+        default=60, gt=0, description="Sustained Reddit request rate"
+    )
+    REDDIT_SEARCH_FANOUT: str = Field(
+        default="none",
+        description="Split searches per keyword, subreddit or both (none, keywords, subreddits, both)",
+    )
 
     # LLM Configuration (GitHub Models or OpenAI)
     GITHUB_TOKEN: str = Field(default="", description="GitHub token for GitHub Models API")
@@ -41,6 +54,176 @@ class Settings(BaseSettings):
         default="https://models.inference.ai.azure.com",
         description="LLM API base URL (GitHub Models endpoint)",
     )
+    LLM_SMALL_MODEL: str = Field(
+        default="gpt-4o-mini", description="Model for cheap tasks such as sentiment"
+    )
+    LLM_COMBINED_ENRICHMENT: bool = Field(
+        default=True,
+        description="Get sentiment and summary from one structured-output call per post",
+    )
+    LLM_CONTEXT_TOKENS: int = Field(
+        default=8000, ge=1000, description="Model context window used to size batched prompts"
+    )
+    LLM_BATCH_SIZE: int = Field(
+        default=10, ge=1, description="Maximum posts packed into one batched completion"
+    )
+    LLM_BATCH_CONCURRENCY: int = Field(
+        default=2, ge=1, description="Batched completions in flight at once"
+    )
+    LLM_REQUESTS_PER_MINUTE: float = Field(
+        default=300, gt=0, description="Sustained LLM request rate"
+    )
+    LLM_TOKENS_PER_MINUTE: float = Field(
+        default=0, ge=0, description="Sustained LLM token rate (0 disables token limiting)"
+    )
+    LLM_RETRY_ATTEMPTS: int = Field(
+        default=4, ge=1, description="Attempts per LLM call, including the first"
+    )
+    LLM_RETRY_BASE_DELAY: float = Field(
+        default=0.5, ge=0, description="Backoff before the first LLM retry in seconds"
+    )
+    LLM_RETRY_MAX_DELAY: float = Field(
+        default=20.0, gt=0, description="Cap on a single LLM retry backoff in seconds"
+    )
+    LLM_CALL_DEADLINE_SECONDS: float = Field(
+        default=45.0, gt=0, description="Time allowed for an LLM call including all retries"
+    )
+
+    # Rate limiting
+    RATE_LIMIT_BACKEND: str = Field(
+        default="memory", description="Rate limit state: memory (per process) or redis (shared)"
+    )
+    RATE_LIMIT_BURST_SECONDS: float = Field(
+        default=10, gt=0, description="Seconds of quota a limiter may spend in one burst"
+    )
+
+    # LLM providers (routing and failover)
+    LLM_PROVIDERS: str = Field(
+        default="",
+        description=(
+            "Comma-separated providers in priority order (github, openai, local); "
+            "blank uses LLM_BASE_URL/LLM_MODEL only"
+        ),
+    )
+    OPENAI_BASE_URL: str = Field(
+        default="https://api.openai.com/v1", description="OpenAI API base URL"
+    )
+    OPENAI_MODEL: str = Field(default="gpt-4o", description="OpenAI model for summaries")
+    OPENAI_SMALL_MODEL: str = Field(default="gpt-4o-mini", description="OpenAI model for sentiment")
+    LOCAL_LLM_BASE_URL: str = Field(
+        default="http://localhost:8001/v1", description="Local OpenAI-compatible server URL"
+    )
+    LOCAL_LLM_API_KEY: str = Field(default="local", description="API key for the local server")
+    LOCAL_LLM_MODEL: str = Field(default="", description="Local model for summaries")
+    LOCAL_LLM_SMALL_MODEL: str = Field(
+        default="", description="Local model for sentiment (blank uses LOCAL_LLM_MODEL)"
+    )
+    LLM_LATENCY_WINDOW: int = Field(
+        default=200, ge=1, description="Recent calls kept per provider for latency percentiles"
+    )
+    LLM_LATENCY_MIN_SAMPLES: int = Field(
+        default=20, ge=1, description="Samples before a provider is ranked by its latency"
+    )
+    LLM_QUOTA_FAILOVER_SECONDS: float = Field(
+        default=60,
+        gt=0,
+        description="Rate-limit waits longer than this take a provider out of rotation",
+    )
+    LLM_DEMOTE_AFTER_FAILURES: int = Field(
+        default=3,
+        ge=1,
+        description="Consecutive failed calls that move a provider behind the others for a while",
+    )
+
+    # Circuit breakers
+    CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        default=5, ge=1, description="Consecutive provider failures that open a circuit"
+    )
+    CIRCUIT_RECOVERY_SECONDS: float = Field(
+        default=30.0, gt=0, description="Seconds an open circuit rejects calls before probing"
+    )
+    CIRCUIT_HALF_OPEN_MAX_CALLS: int = Field(
+        default=1, ge=1, description="Probe calls allowed at once while a circuit is half-open"
+    )
+
+    # LLM result cache
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="Cache LLM enrichment results")
+    LLM_CACHE_BACKEND: str = Field(
+        default="memory", description="Persistent cache tier: memory (none), mongo or redis"
+    )
+    LLM_CACHE_MAX_ENTRIES: int = Field(
+        default=10000, ge=1, description="In-process LRU cache capacity"
+    )
+    LLM_CACHE_TTL_SECONDS: int = Field(
+        default=7 * 24 * 3600, ge=1, description="Cached LLM result time-to-live in seconds"
+    )
+
+    # Product DNA pipeline
+    ENRICHMENT_CONCURRENCY: int = Field(
+        default=5, ge=1, description="Maximum posts enriched concurrently per collection"
+    )
+    ENRICHMENT_TIMEOUT_SECONDS: float = Field(
+        default=60.0, gt=0, description="Per-post enrichment timeout in seconds"
+    )
+    PIPELINE_QUEUE_SIZE: int = Field(
+        default=100, ge=1, description="Capacity of each bounded pipeline queue (backpressure)"
+    )
+    PIPELINE_STORE_BATCH_SIZE: int = Field(
+        default=50, ge=1, description="Enriched posts written per MongoDB batch"
+    )
+    PIPELINE_FLUSH_SECONDS: float = Field(
+        default=1.0, gt=0, description="Maximum delay before a partial batch is written"
+    )
+
+    STATS_CACHE_SECONDS: float = Field(
+        default=10.0, ge=0, description="How long /stats results are served from memory"
+    )
+    EXPORT_BATCH_SIZE: int = Field(
+        default=1000, ge=1, description="Documents fetched per cursor batch during exports"
+    )
+    ROLLUP_REBUILD_CHUNK_SIZE: int = Field(
+        default=1000, ge=1, description="Posts aggregated per flush when rebuilding rollups"
+    )
+    WATERMARK_OVERLAP_SECONDS: int = Field(
+        default=900,
+        ge=0,
+        description="Incremental runs re-scan this far behind the watermark for late-indexed posts",
+    )
+    WATERMARK_SEEN_IDS: int = Field(
+        default=1000, ge=0, description="Newest post IDs remembered per watermark"
+    )
+
+    # Background collection jobs
+    JOB_WORKERS: int = Field(default=2, ge=1, description="Collection jobs run concurrently")
+    JOB_LEASE_SECONDS: int = Field(
+        default=120, ge=10, description="Seconds before an unrenewed running job is reclaimed"
+    )
+    JOB_POLL_INTERVAL_SECONDS: float = Field(
+        default=5.0, gt=0, description="Idle worker poll interval for queued jobs"
+    )
+    JOB_PROGRESS_FLUSH_SECONDS: float = Field(
+        default=1.0, ge=0, description="Minimum interval between job progress writes"
+    )
+    JOB_MAX_ATTEMPTS: int = Field(
+        default=3, ge=1, description="Times a job is started before it is abandoned"
+    )
+
+    # Scheduled collections
+    SCHEDULER_ENABLED: bool = Field(
+        default=True, description="Run due collection schedules from this process"
+    )
+    SCHEDULER_POLL_SECONDS: float = Field(
+        default=15.0, gt=0, description="How often the scheduler checks for due schedules"
+    )
+    SCHEDULE_JITTER_FRACTION: float = Field(
+        default=0.1,
+        ge=0,
+        le=0.5,
+        description="Default random spread of each run, as a fraction of the schedule interval",
+    )
+    SCHEDULE_LOCK_SECONDS: int = Field(
+        default=60, ge=5, description="Seconds a replica holds a schedule while dispatching it"
+    )
 
     # CORS configuration
     CORS_ORIGINS: str = Field(
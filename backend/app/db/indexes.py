@@ -0,0 +1,149 @@
+"""MongoDB index declarations and management.
+
+Every index the application relies on is declared here, next to the query
+shape it serves, and created at startup from `main.lifespan`.
+"""
+
+from typing import Any
+
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+# Sort order shared by Product DNA list queries (keyset pagination)
+KEYSET = [("enriched_at", DESCENDING), ("post_id", DESCENDING)]
+
+INDEXES: dict[str, list[IndexModel]] = {
+    "product_dna": [
+        # Upserts by post_id and the pre-enrichment dedup $in lookup
+        IndexModel([("post_id", ASCENDING)], unique=True),
+        # get_product_dna without filters
+        IndexModel(KEYSET),
+        # get_product_dna filtered by sentiment
+        IndexModel([("sentiment", ASCENDING), *KEYSET]),
+        # get_product_dna filtered by subreddit
+        IndexModel([("metadata.subreddit", ASCENDING), *KEYSET]),
+        # get_product_dna filtered by sentiment and subreddit
+        IndexModel([("sentiment", ASCENDING), ("metadata.subreddit", ASCENDING), *KEYSET]),
+        # Re-enrichment scan; only degraded records are indexed
+        IndexModel(
+            [("enrichment_status", ASCENDING)],
+            partialFilterExpression={"enrichment_status": "fallback"},
+        ),
+    ],
+    "product_dna_rollups": [
+        # $inc upserts per bucket; trends filtered by subreddit over a bucket range
+        IndexModel(
+            [
+                ("granularity", ASCENDING),
+                ("keyword", ASCENDING),
+                ("subreddit", ASCENDING),
+                ("bucket", ASCENDING),
+            ],
+            unique=True,
+        ),
+        # Trends across all subreddits over a bucket range
+        IndexModel([("granularity", ASCENDING), ("keyword", ASCENDING), ("bucket", ASCENDING)]),
+    ],
+    "collection_jobs": [
+        # Job lookups by ID
+        IndexModel([("job_id", ASCENDING)], unique=True),
+        # Workers claiming the oldest queued or expired job
+        IndexModel([("status", ASCENDING), ("created_at", ASCENDING)]),
+        # Run history of a schedule, newest first; ad-hoc jobs store a null
+        # schedule_id and are left out
+        IndexModel(
+            [("schedule_id", ASCENDING), ("created_at", DESCENDING)],
+            name="schedule_id_created_at_scheduled",
+            partialFilterExpression={"schedule_id": {"$type": "string"}},
+        ),
+    ],
+    "collection_schedules": [
+        # Schedule lookups by ID
+        IndexModel([("schedule_id", ASCENDING)], unique=True),
+        # Schedulers claiming due schedules
+        IndexModel([("enabled", ASCENDING), ("next_run_at", ASCENDING)]),
+    ],
+    "collection_watermarks": [
+        # Watermark lookups and upserts per normalized query
+        IndexModel([("query_key", ASCENDING)], unique=True),
+    ],
+    "llm_cache": [
+        # Expire persistent cache entries
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+}
+
+# Indexes from earlier releases that the declarations above replace; dropped
+# so writes stop maintaining them
+SUPERSEDED_INDEXES: dict[str, list[str]] = {
+    "product_dna": ["sentiment_1", "metadata.subreddit_1", "enriched_at_1"],
+    # Partial on $exists, which matched the null schedule_id of every ad-hoc job
+    "collection_jobs": ["schedule_id_1_created_at_-1"],
+}
+
+
+async def ensure_collection_indexes(collection, name: str | None = None) -> list[str]:
+    """
+    Create the declared indexes for one collection and drop superseded ones.
+
+    Args:
+        collection: Motor collection
+        name: Key in INDEXES (defaults to the collection's name)
+
+    Returns:
+        Names of the indexes ensured
+    """
+    name = name or collection.name
+
+    # Dropped first: a replacement with the same keys but other options
+    # cannot be created while the old index exists
+    superseded = SUPERSEDED_INDEXES.get(name, [])
+    if superseded:
+        existing = await collection.index_information()
+        for index_name in superseded:
+            if index_name in existing:
+                await collection.drop_index(index_name)
+                logger.info(f"Dropped superseded index {index_name} on {name}")
+
+    created = await collection.create_indexes(INDEXES[name])
+    logger.info(f"MongoDB indexes ensured for {name}: {created}")
+    return created
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> dict[str, list[str]]:
+    """
+    Create every declared index (idempotent).
+
+    Args:
+        db: Motor database
+
+    Returns:
+        Mapping of collection name to the indexes ensured
+    """
+    return {name: await ensure_collection_indexes(db[name], name) for name in INDEXES}
+
+
+async def index_usage(collection) -> list[dict[str, Any]]:
+    """
+    Report how often each index on a collection has been used.
+
+    Counters come from `$indexStats` and reset when mongod restarts.
+
+    Args:
+        collection: Motor collection
+
+    Returns:
+        One entry per index with its key, access count and counting start time
+    """
+    usage = []
+    async for stat in collection.aggregate([{"$indexStats": {}}]):
+        usage.append(
+            {
+                "name": stat["name"],
+                "key": dict(stat.get("key", {})),
+                "accesses": stat.get("accesses", {}).get("ops", 0),
+                "since": stat.get("accesses", {}).get("since"),
+            }
+        )
+    return sorted(usage, key=lambda entry: entry["name"])
@@ -0,0 +1,169 @@
+"""Circuit breakers that fail fast while a provider is down."""
+
+import time
+from enum import Enum
+from typing import Any
+
+from loguru import logger
+from prawcore.exceptions import RequestException, ServerError, TooManyRequests
+
+from app.config import settings
+from app.integrations.retry import RETRYABLE_ERRORS
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} circuit is open; retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for one provider.
+
+    After `failure_threshold` consecutive provider failures the circuit
+    opens and calls are rejected with CircuitOpenError for
+    `recovery_seconds`. It then lets up to `half_open_max_calls` probe calls
+    through: a success closes the circuit, a failure re-opens it.
+
+    Callers wrap each request with `before_call` and `record_success` /
+    `record_failure`. Only errors listed in `failure_types` count, so bad
+    requests do not trip the breaker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int | None = None,
+        recovery_seconds: float | None = None,
+        half_open_max_calls: int | None = None,
+        failure_types: tuple[type[BaseException], ...] = (Exception,),
+    ):
+        """
+        Initialize the breaker (closed).
+
+        Args:
+            name: Provider name used in logs and errors
+            failure_threshold: Consecutive failures that open the circuit (defaults to settings)
+            recovery_seconds: Time the circuit stays open before probing (defaults to settings)
+            half_open_max_calls: Concurrent probe calls while half-open (defaults to settings)
+            failure_types: Exception types that count as provider failures
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_seconds = recovery_seconds or settings.CIRCUIT_RECOVERY_SECONDS
+        self.half_open_max_calls = half_open_max_calls or settings.CIRCUIT_HALF_OPEN_MAX_CALLS
+        self.failure_types = failure_types
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._open_for = self.recovery_seconds
+        self._probes = 0
+        self._counters = {"rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open once recovery time passes."""
+        if self._state == CircuitState.OPEN and self.retry_in() == 0:
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+            logger.info(f"{self.name} circuit half-open, probing")
+        return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit allows a probe (0 if not open)."""
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._open_for - time.monotonic())
+
+    def allows_call(self) -> bool:
+        """Whether `before_call` would let a call through right now."""
+        state = self.state
+        if state == CircuitState.OPEN:
+            return False
+        return state == CircuitState.CLOSED or self._probes < self.half_open_max_calls
+
+    def before_call(self) -> None:
+        """
+        Admit a call or reject it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or its probe slots are taken
+        """
+        if not self.allows_call():
+            self._counters["rejected"] += 1
+            raise CircuitOpenError(self.name, self.retry_in())
+        if self._state == CircuitState.HALF_OPEN:
+            self._probes += 1
+
+    def record_success(self) -> None:
+        """Record a successful call; closes a half-open circuit."""
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info(f"{self.name} circuit closed")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probes = 0
+
+    def record_failure(self, error: BaseException) -> None:
+        """Record a failed call; opens the circuit past the threshold."""
+        if not isinstance(error, self.failure_types):
+            # Not the provider's fault (bad request, cancellation): free the probe slot
+            if self._state == CircuitState.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+            return
+
+        self._failures += 1
+        if self._state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._open(self.recovery_seconds, f"{self._failures} failures ({type(error).__name__})")
+
+    def trip(self, seconds: float, reason: str) -> None:
+        """
+        Open the circuit immediately, e.g. when a provider's quota is exhausted.
+
+        Args:
+            seconds: Time to stay open (at least `recovery_seconds`)
+            reason: Why the circuit was opened, for the log
+        """
+        self._open(max(seconds, self.recovery_seconds), reason)
+
+    def _open(self, seconds: float, reason: str) -> None:
+        """Move to the open state for `seconds`."""
+        if self._state != CircuitState.OPEN:
+            self._counters["opened"] += 1
+            logger.warning(
+                f"{self.name} circuit opened after {reason}; pausing calls for {seconds:.0f}s"
+            )
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._open_for = seconds
+        self._probes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """State and counters for status reporting."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_in_seconds": round(self.retry_in(), 1),
+            **self._counters,
+        }
+
+
+# Shared instances, one per provider
+llm_breaker = CircuitBreaker("llm", failure_types=RETRYABLE_ERRORS)
+reddit_breaker = CircuitBreaker(
+    "reddit",
+    failure_types=(ServerError, RequestException, TooManyRequests, TimeoutError, ConnectionError),
+)
@@ -1,13 +1,18 @@
 """LLM integration using GitHub Models (Azure OpenAI endpoint)."""
 
 import asyncio
+import json
 from enum import Enum
 
 from loguru import logger
-from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 from app.config import settings
+from app.integrations.circuit_breaker import CircuitBreaker, llm_breaker
+from app.integrations.llm_cache import LLMCache, cache_key, llm_cache
+from app.integrations.llm_router import TASK_TIERS, LLMProvider, LLMRouter, configured_providers
+from app.integrations.rate_limiter import RateLimiter, llm_rate_limiter
+from app.integrations.retry import RetryPolicy
 
 
 class Sentiment(str, Enum):
@@ -25,6 +30,15 @@ class SentimentResult(BaseModel):
     confidence: float | None = None
 
 
+class EnrichmentResult(BaseModel):
+    """Result of combined sentiment and summary enrichment."""
+
+    sentiment: SentimentResult
+    summary: str
+    # True when the LLM could not be reached and placeholder values were used
+    fallback: bool = False
+
+
 # Prompt templates
 SENTIMENT_PROMPT = """Analyze the sentiment of the following social media post.
 Respond with exactly one word: positive, neutral, or negative.
@@ -42,6 +56,40 @@ Content: {body}
 
 Summary:"""
 
+ENRICHMENT_PROMPT = """Analyze the following social media post.
+Respond with a JSON object with exactly these keys:
+- "sentiment": one of "positive", "neutral", "negative"
+- "confidence": your confidence in the sentiment, a number between 0 and 1
+- "summary": one concise sentence (maximum {max_words} words) on the main topic, user intent, and any key insights
+
+Title: {title}
+Content: {body}"""
+
+BATCH_ENRICHMENT_PROMPT = """Analyze each of the following social media posts.
+Respond with a JSON object {{"results": [...]}} where "results" is an array with one object per post and these keys:
+- "post_id": the post ID exactly as given
+- "sentiment": one of "positive", "neutral", "negative"
+- "confidence": your confidence in the sentiment, a number between 0 and 1
+- "summary": one concise sentence (maximum {max_words} words) on the main topic, user intent, and any key insights
+
+{posts}"""
+
+BATCH_POST_TEMPLATE = """[post_id: {post_id}]
+Title: {title}
+Content: {body}
+"""
+
+# Bump a version whenever its prompt changes so cached results are not reused
+PROMPT_VERSIONS = {"sentiment": "v1", "summary": "v1", "enrichment": "v1", "batch": "v1"}
+
+ENRICHMENT_BODY_CHARS = 2000
+
+# Rough token accounting used to size batches (about 4 characters per token)
+CHARS_PER_TOKEN = 4
+BATCH_BODY_CHARS = 1000
+BATCH_OUTPUT_TOKENS_PER_POST = 80
+BATCH_PROMPT_OVERHEAD_TOKENS = 200
+
 
 class LLMService:
     """LLM integration service using GitHub Models GPT-4o."""
@@ -51,6 +99,11 @@ class LLMService:
         api_key: str | None = None,
         model: str | None = None,
         base_url: str | None = None,
+        cache: LLMCache | None = None,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        providers: list[LLMProvider] | None = None,
     ):
         """
         Initialize LLM service.
@@ -59,29 +112,39 @@ class LLMService:
             api_key: GitHub token or OpenAI API key
             model: Model name (defaults to gpt-4o)
             base_url: API base URL (defaults to GitHub Models endpoint)
+            cache: Result cache (no caching if omitted)
+            limiter: Request/token rate limiter (no throttling if omitted)
+            retry: Retry policy for transient API errors (defaults to settings)
+            breaker: Circuit breaker that fails calls fast during outages (none if omitted)
+            providers: Endpoints to route between; if omitted, a single provider
+                is built from api_key/base_url/model with the limiter and breaker
         """
         self.api_key = api_key or settings.GITHUB_TOKEN or settings.OPENAI_API_KEY
         self.model = model or settings.LLM_MODEL
         self.base_url = base_url or settings.LLM_BASE_URL
-
-        self._client: AsyncOpenAI | None = None
-
-    @property
-    def client(self) -> AsyncOpenAI:
-        """Lazy initialization of OpenAI client."""
-        if self._client is None:
-            if not self.api_key:
-                raise ValueError(
-                    "LLM API key not configured. Set GITHUB_TOKEN or OPENAI_API_KEY in .env"
+        self.cache = cache
+        self.limiter = limiter
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker
+        self.router = LLMRouter(
+            providers
+            or [
+                LLMProvider(
+                    "default",
+                    base_url=self.base_url,
+                    api_key=self.api_key,
+                    model=self.model,
+                    small_model=settings.LLM_SMALL_MODEL or None,
+                    limiter=limiter,
+                    breaker=breaker,
                 )
+            ]
+        )
 
-            self._client = AsyncOpenAI(
-                api_key=self.api_key,
-                base_url=self.base_url,
-            )
-            logger.info(f"LLM client initialized with model: {self.model}")
-
-        return self._client
+    @property
+    def providers(self) -> list[LLMProvider]:
+        """Configured providers in priority order."""
+        return self.router.providers
 
     async def analyze_sentiment(self, title: str, body: str = "") -> SentimentResult:
         """
@@ -92,13 +155,23 @@ class LLMService:
             body: Post body/content
 
         Returns:
-            SentimentResult with classification
+            SentimentResult with classification (neutral if the LLM is unavailable)
         """
-        prompt = SENTIMENT_PROMPT.format(title=title, body=body[:1000] if body else "(no content)")
+        result = await self._classify_sentiment(title, body)
+        # Default to neutral on error
+        return result or SentimentResult(sentiment=Sentiment.NEUTRAL)
+
+    async def _classify_sentiment(self, title: str, body: str) -> SentimentResult | None:
+        """Run the sentiment completion; returns None if it fails."""
+        body_text = body[:1000] if body else "(no content)"
+        cached = await self._cache_get(self._cache_key("sentiment", title, body_text))
+        if cached is not None:
+            return SentimentResult(**cached)
+
+        prompt = SENTIMENT_PROMPT.format(title=title, body=body_text)
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response, model = await self._complete(
                 messages=[
                     {
                         "role": "system",
@@ -108,6 +181,7 @@ class LLMService:
                 ],
                 max_tokens=10,
                 temperature=0.1,
+                task="sentiment",
             )
 
             result = response.choices[0].message.content.strip().lower()
@@ -121,12 +195,16 @@ class LLMService:
                 sentiment = Sentiment.NEUTRAL
 
             logger.debug(f"Sentiment for '{title[:50]}...': {sentiment.value}")
-            return SentimentResult(sentiment=sentiment)
+            result = SentimentResult(sentiment=sentiment)
+            await self._cache_set(
+                self._cache_key("sentiment", title, body_text, model),
+                result.model_dump(mode="json"),
+            )
+            return result
 
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {e}")
-            # Default to neutral on error
-            return SentimentResult(sentiment=Sentiment.NEUTRAL)
+            return None
 
     async def generate_summary(self, title: str, body: str = "", max_words: int = 25) -> str:
         """
@@ -138,13 +216,23 @@ class LLMService:
             max_words: Maximum words in summary
 
         Returns:
-            One-sentence summary
+            One-sentence summary (the title if the LLM is unavailable)
         """
-        prompt = SUMMARY_PROMPT.format(title=title, body=body[:2000] if body else "(no content)")
+        summary = await self._summarize(title, body, max_words)
+        # Return title as fallback
+        return summary if summary is not None else _fallback_summary(title)
+
+    async def _summarize(self, title: str, body: str, max_words: int = 25) -> str | None:
+        """Run the summary completion; returns None if it fails."""
+        body_text = body[:2000] if body else "(no content)"
+        cached = await self._cache_get(self._cache_key("summary", title, body_text))
+        if cached is not None:
+            return cached["summary"]
+
+        prompt = SUMMARY_PROMPT.format(title=title, body=body_text)
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response, model = await self._complete(
                 messages=[
                     {
                         "role": "system",
@@ -154,6 +242,7 @@ class LLMService:
                 ],
                 max_tokens=100,
                 temperature=0.3,
+                task="summary",
             )
 
             summary = response.choices[0].message.content.strip()
@@ -163,38 +252,433 @@ class LLMService:
                 summary += "."
 
             logger.debug(f"Summary for '{title[:50]}...': {summary[:50]}...")
+            await self._cache_set(
+                self._cache_key("summary", title, body_text, model), {"summary": summary}
+            )
             return summary
 
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
-            # Return title as fallback
-            return f"{title[:100]}..."
+            return None
 
-    async def enrich_post(self, post: dict) -> dict:
+    async def analyze_post(
+        self, title: str, body: str = "", combined: bool | None = None
+    ) -> EnrichmentResult:
+        """
+        Analyze sentiment and summarize a post.
+
+        Args:
+            title: Post title
+            body: Post body/content
+            combined: Use one structured-output call instead of two separate
+                calls (defaults to LLM_COMBINED_ENRICHMENT)
+
+        Returns:
+            EnrichmentResult with sentiment and summary
+        """
+        if combined is None:
+            combined = settings.LLM_COMBINED_ENRICHMENT
+
+        if combined:
+            return await self._analyze_combined(title, body)
+        return await self._analyze_separately(title, body)
+
+    async def _analyze_separately(self, title: str, body: str) -> EnrichmentResult:
+        """Run sentiment and summary as two parallel completions."""
+        sentiment_result, summary = await asyncio.gather(
+            self._classify_sentiment(title, body),
+            self._summarize(title, body),
+        )
+        return EnrichmentResult(
+            sentiment=sentiment_result or SentimentResult(sentiment=Sentiment.NEUTRAL),
+            summary=summary if summary is not None else _fallback_summary(title),
+            fallback=sentiment_result is None or summary is None,
+        )
+
+    async def _analyze_combined(
+        self, title: str, body: str, max_words: int = 25
+    ) -> EnrichmentResult:
+        """
+        Get sentiment, confidence and summary from a single JSON completion.
+
+        Falls back to the two-call path if the response cannot be parsed.
+        """
+        body_text = body[:ENRICHMENT_BODY_CHARS] if body else "(no content)"
+        cached = await self._cache_get(self._cache_key("enrichment", title, body_text))
+        if cached is not None:
+            return EnrichmentResult(**cached)
+
+        prompt = ENRICHMENT_PROMPT.format(title=title, body=body_text, max_words=max_words)
+
+        try:
+            response, model = await self._complete(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": (
+                            "You are a social media analyst. Respond with only a JSON object."
+                        ),
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=150,
+                temperature=0.2,
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            logger.error(f"Error enriching post: {e}")
+            return EnrichmentResult(
+                sentiment=SentimentResult(sentiment=Sentiment.NEUTRAL),
+                summary=_fallback_summary(title),
+                fallback=True,
+            )
+
+        try:
+            result = parse_enrichment(response.choices[0].message.content)
+        except ValueError as e:
+            logger.warning(
+                f"Unparseable enrichment for '{title[:50]}...', retrying separately: {e}"
+            )
+            return await self._analyze_separately(title, body)
+
+        logger.debug(f"Enrichment for '{title[:50]}...': {result.sentiment.sentiment.value}")
+        await self._cache_set(
+            self._cache_key("enrichment", title, body_text, model), result.model_dump(mode="json")
+        )
+        return result
+
+    async def enrich_batch(
+        self,
+        posts: list[dict],
+        batch_size: int | None = None,
+        max_rounds: int = 2,
+    ) -> list[dict]:
+        """
+        Enrich many posts by packing several of them into each completion.
+
+        Posts missing or malformed in a batch response are re-queued into
+        smaller batches; anything still unresolved after `max_rounds` goes
+        through the single-post path.
+
+        Args:
+            posts: Raw post dictionaries (must carry a post_id)
+            batch_size: Maximum posts per completion (defaults to LLM_BATCH_SIZE);
+                batches are also capped by the model's context window
+            max_rounds: Batched attempts before falling back to per-post calls
+
+        Returns:
+            Enriched posts in input order, as returned by enrich_post
+        """
+        batch_size = batch_size or settings.LLM_BATCH_SIZE
+        semaphore = asyncio.Semaphore(settings.LLM_BATCH_CONCURRENCY)
+        results: dict[str, EnrichmentResult] = {}
+        for post in posts:
+            cached = await self._cache_get(self._post_batch_key(post))
+            if cached is not None:
+                results[post.get("post_id")] = EnrichmentResult(**cached)
+        pending = [post for post in posts if post.get("post_id") not in results]
+
+        async def run(batch: list[dict]) -> dict[str, EnrichmentResult]:
+            async with semaphore:
+                return await self._analyze_batch(batch)
+
+        for _ in range(max_rounds):
+            if not pending:
+                break
+            batches = self.plan_batches(pending, batch_size)
+            for parsed in await asyncio.gather(*(run(batch) for batch in batches)):
+                results.update(parsed)
+
+            pending = [post for post in pending if post.get("post_id") not in results]
+            if pending:
+                logger.info(f"Re-queuing {len(pending)} posts missing from batch responses")
+            batch_size = max(1, batch_size // 2)
+
+        if pending:
+            fallbacks = await asyncio.gather(
+                *(
+                    self.analyze_post(post.get("title", ""), post.get("body", ""))
+                    for post in pending
+                )
+            )
+            for post, result in zip(pending, fallbacks, strict=True):
+                results[post.get("post_id")] = result
+
+        return [
+            {
+                **post,
+                "sentiment": results[post.get("post_id")].sentiment.sentiment.value,
+                "confidence": results[post.get("post_id")].sentiment.confidence,
+                "summary": results[post.get("post_id")].summary,
+                "fallback": results[post.get("post_id")].fallback,
+            }
+            for post in posts
+        ]
+
+    def plan_batches(self, posts: list[dict], batch_size: int) -> list[list[dict]]:
+        """
+        Split posts into batches that fit the model's context window.
+
+        Args:
+            posts: Posts to enrich
+            batch_size: Maximum posts per batch
+
+        Returns:
+            List of batches, each holding at least one post
+        """
+        budget = settings.LLM_CONTEXT_TOKENS - BATCH_PROMPT_OVERHEAD_TOKENS
+        batches: list[list[dict]] = []
+        current: list[dict] = []
+        used = 0
+
+        for post in posts:
+            cost = _estimate_batch_tokens(post)
+            if current and (len(current) >= batch_size or used + cost > budget):
+                batches.append(current)
+                current, used = [], 0
+            current.append(post)
+            used += cost
+
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _analyze_batch(self, batch: list[dict]) -> dict[str, EnrichmentResult]:
+        """Enrich one batch with a single completion; returns only the valid items."""
+        posts_text = "\n".join(
+            BATCH_POST_TEMPLATE.format(
+                post_id=post.get("post_id", ""),
+                title=post.get("title", ""),
+                body=(post.get("body") or "(no content)")[:BATCH_BODY_CHARS],
+            )
+            for post in batch
+        )
+        prompt = BATCH_ENRICHMENT_PROMPT.format(posts=posts_text, max_words=25)
+
+        try:
+            response, model = await self._complete(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": (
+                            "You are a social media analyst. Respond with only a JSON object."
+                        ),
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=BATCH_OUTPUT_TOKENS_PER_POST * len(batch) + 50,
+                temperature=0.2,
+                response_format={"type": "json_object"},
+                task="batch",
+            )
+        except Exception as e:
+            logger.error(f"Error enriching batch of {len(batch)} posts: {e}")
+            return {}
+
+        expected_ids = {post.get("post_id") for post in batch}
+        try:
+            results = parse_batch_enrichment(response.choices[0].message.content, expected_ids)
+        except ValueError as e:
+            logger.warning(f"Unparseable batch response for {len(batch)} posts: {e}")
+            return {}
+
+        logger.debug(f"Batch enriched {len(results)}/{len(batch)} posts")
+        for post in batch:
+            if post.get("post_id") in results:
+                await self._cache_set(
+                    self._post_batch_key(post, model),
+                    results[post.get("post_id")].model_dump(mode="json"),
+                )
+        return results
+
+    async def _complete(
+        self, messages: list[dict], max_tokens: int, task: str = "enrichment", **kwargs
+    ):
+        """
+        Send one chat completion through the provider router and retry policy.
+
+        The task picks the model tier (sentiment goes to the small model).
+        Each attempt tries every provider once, fastest healthy one first, so
+        an outage or exhausted quota fails over immediately; the retry policy
+        only backs off when all providers failed. Providers whose circuit is
+        open raise CircuitOpenError without reaching the API.
+
+        Returns:
+            Tuple of (completion, model that produced it)
+        """
+        estimated = _estimate_tokens(messages) + max_tokens
+        tier = TASK_TIERS[task]
+        return await self.retry.run(
+            lambda: self.router.complete(tier, messages, max_tokens, estimated, **kwargs)
+        )
+
+    def _cache_key(self, kind: str, title: str, body: str, model: str | None = None) -> str | None:
+        """
+        Cache key for a prompt kind, or None when caching is disabled.
+
+        Lookups use the primary provider's model; results are stored under
+        the model that actually answered, so failover answers are only
+        served where that model is the one asked.
+        """
+        if self.cache is None:
+            return None
+        model = model or self.router.model_for(TASK_TIERS[kind])
+        return cache_key(model, kind, PROMPT_VERSIONS[kind], title, body)
+
+    def _post_batch_key(self, post: dict, model: str | None = None) -> str | None:
+        """Batch-enrichment cache key for a raw post, on the body the batch prompt sends."""
+        return self._cache_key(
+            "batch",
+            post.get("title", ""),
+            (post.get("body") or "(no content)")[:BATCH_BODY_CHARS],
+            model,
+        )
+
+    async def _cache_get(self, key: str | None) -> dict | None:
+        """Look up a cached result."""
+        if key is None or self.cache is None:
+            return None
+        return await self.cache.get(key)
+
+    async def _cache_set(self, key: str | None, value: dict) -> None:
+        """Store a successful result (fallbacks are never cached)."""
+        if key is not None and self.cache is not None:
+            await self.cache.set(key, value)
+
+    async def enrich_post(self, post: dict, combined: bool | None = None) -> dict:
         """
         Enrich a post with sentiment and summary.
 
         Args:
             post: Raw post data dictionary
+            combined: Use a single structured-output call (defaults to settings)
 
         Returns:
-            Enriched post with sentiment and summary fields
+            Enriched post with sentiment, confidence and summary fields
         """
         title = post.get("title", "")
         body = post.get("body", "")
 
-        # Run sentiment and summary in parallel
-        sentiment_result, summary = await asyncio.gather(
-            self.analyze_sentiment(title, body),
-            self.generate_summary(title, body),
-        )
+        result = await self.analyze_post(title, body, combined=combined)
 
         return {
             **post,
-            "sentiment": sentiment_result.sentiment.value,
-            "summary": summary,
+            "sentiment": result.sentiment.sentiment.value,
+            "confidence": result.sentiment.confidence,
+            "summary": result.summary,
+            "fallback": result.fallback,
         }
 
 
+def _fallback_summary(title: str) -> str:
+    """Summary used when the LLM is unavailable."""
+    return f"{title[:100]}..."
+
+
+def _estimate_tokens(messages: list[dict]) -> int:
+    """Rough prompt token count for rate limiting."""
+    return sum(len(message.get("content") or "") for message in messages) // CHARS_PER_TOKEN
+
+
+def _estimate_batch_tokens(post: dict) -> int:
+    """Estimate prompt plus output tokens a post adds to a batch."""
+    chars = len(post.get("title", "")) + min(len(post.get("body") or ""), BATCH_BODY_CHARS)
+    return chars // CHARS_PER_TOKEN + 20 + BATCH_OUTPUT_TOKENS_PER_POST
+
+
+def parse_enrichment(content: str | None) -> EnrichmentResult:
+    """
+    Parse a combined enrichment JSON response.
+
+    Args:
+        content: Raw message content from the model
+
+    Returns:
+        EnrichmentResult
+
+    Raises:
+        ValueError: If the content is not a valid enrichment object
+    """
+    try:
+        data = json.loads(content or "")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e}") from e
+    return _parse_enrichment_data(data)
+
+
+def parse_batch_enrichment(
+    content: str | None, expected_ids: set[str]
+) -> dict[str, EnrichmentResult]:
+    """
+    Parse a batched enrichment JSON response.
+
+    Items with an unknown post_id or invalid fields are dropped so the
+    caller can re-queue them.
+
+    Args:
+        content: Raw message content from the model
+        expected_ids: Post IDs that were sent in the batch
+
+    Returns:
+        Mapping of post_id to EnrichmentResult for the valid items
+
+    Raises:
+        ValueError: If the content is not a JSON array of results
+    """
+    try:
+        data = json.loads(content or "")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e}") from e
+    if isinstance(data, dict):
+        data = data.get("results")
+    if not isinstance(data, list):
+        raise ValueError("expected a results array")
+
+    results = {}
+    for item in data:
+        if not isinstance(item, dict) or item.get("post_id") not in expected_ids:
+            continue
+        try:
+            results[item["post_id"]] = _parse_enrichment_data(item)
+        except ValueError as e:
+            logger.debug(f"Dropping malformed batch item {item.get('post_id')}: {e}")
+    return results
+
+
+def _parse_enrichment_data(data: object) -> EnrichmentResult:
+    """Validate a decoded enrichment object."""
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object")
+
+    try:
+        sentiment = Sentiment(str(data.get("sentiment", "")).strip().lower())
+    except ValueError as e:
+        raise ValueError(f"invalid sentiment: {data.get('sentiment')!r}") from e
+
+    confidence = data.get("confidence")
+    if confidence is not None:
+        try:
+            confidence = min(max(float(confidence), 0.0), 1.0)
+        except (TypeError, ValueError):
+            confidence = None
+
+    summary = data.get("summary")
+    if not isinstance(summary, str) or not summary.strip():
+        raise ValueError("missing summary")
+    summary = summary.strip()
+    if not summary.endswith((".", "!", "?")):
+        summary += "."
+
+    return EnrichmentResult(
+        sentiment=SentimentResult(sentiment=sentiment, confidence=confidence),
+        summary=summary,
+    )
+
+
 # Singleton instance for reuse
-llm_service = LLMService()
+llm_service = LLMService(
+    cache=llm_cache if settings.LLM_CACHE_ENABLED else None,
+    limiter=llm_rate_limiter,
+    breaker=llm_breaker,
+    providers=configured_providers(limiter=llm_rate_limiter, breaker=llm_breaker),
+)
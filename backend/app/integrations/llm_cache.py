@@ -0,0 +1,168 @@
+"""Content-addressed cache for LLM enrichment results."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any
+
+from loguru import logger
+
+from app.config import settings
+from app.db.mongodb import mongodb
+
+
+def cache_key(model: str, kind: str, version: str, title: str, body: str) -> str:
+    """
+    Build a cache key from everything that determines an LLM result.
+
+    Args:
+        model: Model name
+        kind: Result kind (sentiment, summary, enrichment)
+        version: Prompt template version for this kind
+        title: Post title
+        body: Post body, truncated to the prompt's limit
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in (model, kind, version, title, body):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class LLMCache:
+    """
+    Two-tier cache: an in-process LRU in front of an optional persistent store.
+
+    The persistent tier is selected by LLM_CACHE_BACKEND ("memory", "mongo"
+    or "redis"). Persistent-tier failures are logged and treated as misses so
+    caching can never break enrichment.
+    """
+
+    COLLECTION_NAME = "llm_cache"
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        ttl_seconds: int | None = None,
+        backend: str | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: In-process LRU capacity (defaults to settings)
+            ttl_seconds: Entry time-to-live in seconds (defaults to settings)
+            backend: Persistent tier: memory, mongo or redis (defaults to settings)
+        """
+        self.max_entries = max_entries or settings.LLM_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or settings.LLM_CACHE_TTL_SECONDS
+        self.backend = (backend or settings.LLM_CACHE_BACKEND).lower()
+
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._redis = None
+        self._counters = {"memory_hits": 0, "persistent_hits": 0, "misses": 0, "sets": 0}
+
+    async def get(self, key: str) -> dict | None:
+        """Return a cached result, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return value
+            del self._entries[key]
+
+        value = await self._get_persistent(key)
+        if value is not None:
+            self._counters["persistent_hits"] += 1
+            self._remember(key, value)
+            return value
+
+        self._counters["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: dict) -> None:
+        """Store a result in both tiers."""
+        self._counters["sets"] += 1
+        self._remember(key, value)
+        await self._set_persistent(key, value)
+
+    def clear(self) -> None:
+        """Drop the in-process tier and reset counters."""
+        self._entries.clear()
+        self._counters = dict.fromkeys(self._counters, 0)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and tier information."""
+        hits = self._counters["memory_hits"] + self._counters["persistent_hits"]
+        lookups = hits + self._counters["misses"]
+        return {
+            "backend": self.backend,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            **self._counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, value: dict) -> None:
+        """Insert into the LRU tier, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_persistent(self, key: str) -> dict | None:
+        """Look up a key in the persistent tier."""
+        try:
+            if self.backend == "mongo":
+                doc = await mongodb.get_collection(self.COLLECTION_NAME).find_one(
+                    {"_id": key, "expires_at": {"$gt": datetime.utcnow()}}
+                )
+                return doc["value"] if doc else None
+            if self.backend == "redis":
+                raw = await self._get_redis().get(f"llm_cache:{key}")
+                return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed ({self.backend}): {e}")
+        return None
+
+    async def _set_persistent(self, key: str, value: dict) -> None:
+        """Write a key to the persistent tier."""
+        try:
+            if self.backend == "mongo":
+                # Expiry is enforced by the TTL index declared in app.db.indexes
+                await mongodb.get_collection(self.COLLECTION_NAME).replace_one(
+                    {"_id": key},
+                    {
+                        "_id": key,
+                        "value": value,
+                        "expires_at": datetime.utcnow() + timedelta(seconds=self.ttl_seconds),
+                    },
+                    upsert=True,
+                )
+            elif self.backend == "redis":
+                await self._get_redis().set(
+                    f"llm_cache:{key}", json.dumps(value), ex=self.ttl_seconds
+                )
+        except Exception as e:
+            logger.warning(f"LLM cache write failed ({self.backend}): {e}")
+
+    def _get_redis(self):
+        """Lazily create the Redis client (redis is an optional dependency)."""
+        if self._redis is None:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(settings.REDIS_URL)
+            logger.info("LLM cache using Redis persistent tier")
+        return self._redis
+
+
+# Singleton instance for reuse
+llm_cache = LLMCache()
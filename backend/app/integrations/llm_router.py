@@ -0,0 +1,366 @@
+"""Routing of LLM completions across OpenAI-compatible providers."""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any
+
+from loguru import logger
+from openai import APIStatusError, AsyncOpenAI, RateLimitError
+
+from app.config import settings
+from app.integrations.circuit_breaker import CircuitBreaker
+from app.integrations.rate_limiter import RateLimiter, retry_delay
+from app.integrations.retry import RETRYABLE_ERRORS
+
+
+class ModelTier(str, Enum):
+    """Model size classes a provider serves."""
+
+    SMALL = "small"
+    LARGE = "large"
+
+
+# Prompt kind -> model tier; classification is cheap, writing needs the strong model
+TASK_TIERS: dict[str, ModelTier] = {
+    "sentiment": ModelTier.SMALL,
+    "summary": ModelTier.LARGE,
+    "enrichment": ModelTier.LARGE,
+    "batch": ModelTier.LARGE,
+}
+
+
+class LatencyTracker:
+    """Sliding window of call latencies with percentile lookup."""
+
+    def __init__(self, window: int | None = None):
+        self._samples: deque[float] = deque(maxlen=window or settings.LLM_LATENCY_WINDOW)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add one successful call's latency."""
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """Nearest-rank percentile (0-100) of the window, or None if empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+class LLMProvider:
+    """
+    One OpenAI-compatible endpoint with a small and a large model.
+
+    Each provider has its own client, rate limiter, circuit breaker and
+    latency windows (one per model tier), since quotas and speed differ
+    between endpoints.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        api_key: str,
+        model: str,
+        small_model: str | None = None,
+        limiter: RateLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
+        """
+        Initialize a provider.
+
+        Args:
+            name: Provider name used in logs and status
+            base_url: API base URL
+            api_key: API key for the endpoint
+            model: Model for summaries and combined enrichment
+            small_model: Model for cheap tasks such as sentiment (defaults to `model`)
+            limiter: Request/token rate limiter (no throttling if omitted)
+            breaker: Circuit breaker (never skipped if omitted)
+        """
+        self.name = name
+        self.base_url = base_url
+        self.api_key = api_key
+        self.models = {ModelTier.LARGE: model, ModelTier.SMALL: small_model or model}
+        self.limiter = limiter
+        self.breaker = breaker
+        self.latency = {tier: LatencyTracker() for tier in ModelTier}
+        self._counters = {"calls": 0, "failures": 0}
+        self._consecutive_failures = 0
+        self._last_failure = 0.0
+
+        self._client: AsyncOpenAI | None = None
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Lazy initialization of the OpenAI client."""
+        if self._client is None:
+            if not self.api_key:
+                raise ValueError(
+                    "LLM API key not configured. Set GITHUB_TOKEN or OPENAI_API_KEY in .env"
+                )
+
+            # Retries are handled by the caller's RetryPolicy so they share its deadline
+            self._client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+            logger.info(f"LLM client initialized for {self.name} with model: {self.models}")
+
+        return self._client
+
+    def available(self) -> bool:
+        """Whether the provider's circuit currently admits calls."""
+        return self.breaker is None or self.breaker.allows_call()
+
+    def demoted(self) -> bool:
+        """
+        Whether the provider should be tried after the others.
+
+        True while its last LLM_DEMOTE_AFTER_FAILURES calls failed and the
+        latest failure is under CIRCUIT_RECOVERY_SECONDS old. This covers
+        errors the breaker ignores (wrong model name, bad credentials), which
+        would otherwise cost a failed round trip on every call.
+        """
+        return (
+            self._consecutive_failures >= settings.LLM_DEMOTE_AFTER_FAILURES
+            and time.monotonic() - self._last_failure < settings.CIRCUIT_RECOVERY_SECONDS
+        )
+
+    async def complete(
+        self, tier: ModelTier, messages: list[dict], max_tokens: int, estimated: int, **kwargs
+    ):
+        """
+        Send one chat completion to this provider.
+
+        Rate-limit headers on error responses pause the provider's limiter.
+        A quota error, or a pause longer than LLM_QUOTA_FAILOVER_SECONDS,
+        opens the provider's circuit so the router skips it until then.
+        """
+        # Wait for quota before claiming a half-open probe slot, so a call
+        # cancelled while throttled never leaves the slot taken
+        if self.limiter is not None:
+            await self.limiter.acquire(estimated)
+        if self.breaker is not None:
+            self.breaker.before_call()
+
+        self._counters["calls"] += 1
+        started = time.monotonic()
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.models[tier], messages=messages, max_tokens=max_tokens, **kwargs
+            )
+        except BaseException as e:
+            self._counters["failures"] += 1
+            if isinstance(e, Exception):
+                self._consecutive_failures += 1
+                self._last_failure = time.monotonic()
+            if self.breaker is not None:
+                self.breaker.record_failure(e)
+            if isinstance(e, APIStatusError):
+                await self._observe_limits(e)
+            raise
+
+        self.latency[tier].record(time.monotonic() - started)
+        self._consecutive_failures = 0
+        if self.breaker is not None:
+            self.breaker.record_success()
+        usage = getattr(response, "usage", None)
+        if self.limiter is not None and isinstance(getattr(usage, "total_tokens", None), int):
+            await self.limiter.settle(estimated, usage.total_tokens)
+        return response
+
+    async def _observe_limits(self, error: APIStatusError) -> None:
+        """Feed rate-limit headers to the limiter and bench the provider on quota exhaustion."""
+        headers = error.response.headers
+        if self.limiter is not None:
+            await self.limiter.observe(headers)
+
+        delay = retry_delay(headers)
+        quota_exhausted = isinstance(error, RateLimitError) and (
+            getattr(error, "code", None) == "insufficient_quota"
+            or delay > settings.LLM_QUOTA_FAILOVER_SECONDS
+        )
+        if quota_exhausted and self.breaker is not None:
+            self.breaker.trip(delay, reason="quota exhaustion")
+
+    def stats(self) -> dict[str, Any]:
+        """Models, health, rate limits, circuit state and latency percentiles."""
+        return {
+            "name": self.name,
+            "models": {tier.value: model for tier, model in self.models.items()},
+            "available": self.available(),
+            "demoted": self.demoted(),
+            "rate_limit": self.limiter.stats() if self.limiter is not None else None,
+            "circuit_breaker": self.breaker.stats() if self.breaker is not None else None,
+            "latency_ms": {
+                tier.value: {
+                    "samples": len(tracker),
+                    "p50": _ms(tracker.percentile(50)),
+                    "p95": _ms(tracker.percentile(95)),
+                }
+                for tier, tracker in self.latency.items()
+            },
+            **self._counters,
+        }
+
+
+class LLMRouter:
+    """
+    Picks a provider per call and fails over to the next on errors.
+
+    Candidates are ordered available-first, then with recently failing
+    (demoted) providers last, then by p50 latency for the requested tier
+    (p95 breaks ties). Providers with fewer than LLM_LATENCY_MIN_SAMPLES
+    samples sort as fastest so they get measured; otherwise the configured
+    order is kept.
+    """
+
+    def __init__(self, providers: list[LLMProvider]):
+        if not providers:
+            raise ValueError("LLMRouter needs at least one provider")
+        self.providers = providers
+
+    def model_for(self, tier: ModelTier) -> str:
+        """Model the primary (first configured) provider uses for a tier."""
+        return self.providers[0].models[tier]
+
+    def candidates(self, tier: ModelTier) -> list[LLMProvider]:
+        """Providers in the order they should be tried for a tier."""
+
+        def rank(provider: LLMProvider) -> tuple[bool, bool, float, float]:
+            health = (not provider.available(), provider.demoted())
+            tracker = provider.latency[tier]
+            if len(tracker) < settings.LLM_LATENCY_MIN_SAMPLES:
+                return (*health, 0.0, 0.0)
+            return (*health, tracker.percentile(50), tracker.percentile(95))
+
+        return sorted(self.providers, key=rank)
+
+    async def complete(
+        self, tier: ModelTier, messages: list[dict], max_tokens: int, estimated: int, **kwargs
+    ) -> tuple[Any, str]:
+        """
+        Try each candidate once until one succeeds.
+
+        Returns:
+            Tuple of (completion, model of the provider that answered)
+
+        Raises:
+            Exception: The first retryable error if every provider failed
+                (so the caller's retry policy backs off and tries again),
+                otherwise the last error
+        """
+        error: Exception | None = None
+        for provider in self.candidates(tier):
+            try:
+                response = await provider.complete(tier, messages, max_tokens, estimated, **kwargs)
+            except Exception as e:
+                if len(self.providers) > 1:
+                    logger.warning(f"LLM provider {provider.name} failed, failing over: {e}")
+                if error is None or not isinstance(error, RETRYABLE_ERRORS):
+                    error = e
+            else:
+                return response, provider.models[tier]
+        raise error
+
+    async def wait_until_available(self, timeout: float) -> bool:
+        """
+        Pause until at least one provider's circuit admits calls.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if a provider is available, False if the timeout elapsed first
+        """
+        deadline = time.monotonic() + timeout
+        while not any(provider.available() for provider in self.providers):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            reopen = min(p.breaker.retry_in() for p in self.providers if p.breaker is not None)
+            await asyncio.sleep(min(remaining, reopen or 0.1))
+        return True
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Per-provider stats in configured order."""
+        return [provider.stats() for provider in self.providers]
+
+
+def configured_providers(
+    limiter: RateLimiter | None = None, breaker: CircuitBreaker | None = None
+) -> list[LLMProvider]:
+    """
+    Build the providers listed in LLM_PROVIDERS, in priority order.
+
+    The first provider uses the given shared limiter and breaker; the others
+    get their own. Providers without credentials are skipped.
+
+    Args:
+        limiter: Rate limiter for the primary provider
+        breaker: Circuit breaker for the primary provider
+
+    Returns:
+        Providers to route between (empty if LLM_PROVIDERS is blank)
+    """
+    definitions = {
+        "github": (
+            settings.LLM_BASE_URL,
+            settings.GITHUB_TOKEN,
+            settings.LLM_MODEL,
+            settings.LLM_SMALL_MODEL,
+        ),
+        "openai": (
+            settings.OPENAI_BASE_URL,
+            settings.OPENAI_API_KEY,
+            settings.OPENAI_MODEL,
+            settings.OPENAI_SMALL_MODEL,
+        ),
+        "local": (
+            settings.LOCAL_LLM_BASE_URL,
+            settings.LOCAL_LLM_API_KEY,
+            settings.LOCAL_LLM_MODEL,
+            settings.LOCAL_LLM_SMALL_MODEL,
+        ),
+    }
+
+    providers: list[LLMProvider] = []
+    for name in (n.strip().lower() for n in settings.LLM_PROVIDERS.split(",") if n.strip()):
+        if name not in definitions:
+            logger.warning(f"Unknown LLM provider '{name}' in LLM_PROVIDERS, skipping")
+            continue
+        base_url, api_key, model, small_model = definitions[name]
+        if not api_key or not model:
+            logger.warning(f"LLM provider '{name}' has no API key or model configured, skipping")
+            continue
+
+        primary = not providers
+        providers.append(
+            LLMProvider(
+                name,
+                base_url=base_url,
+                api_key=api_key,
+                model=model,
+                small_model=small_model or None,
+                limiter=limiter
+                if primary
+                else RateLimiter(
+                    f"llm_{name}",
+                    requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+                    tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+                ),
+                breaker=breaker
+                if primary
+                else CircuitBreaker(f"llm_{name}", failure_types=RETRYABLE_ERRORS),
+            )
+        )
+    return providers
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
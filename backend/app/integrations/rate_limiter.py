@@ -0,0 +1,371 @@
+"""Token-bucket rate limiting shared by the Reddit and LLM integrations."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from loguru import logger
+
+from app.config import settings
+
+# Atomically refill a bucket and reserve `amount` from it.
+# Returns the seconds the caller must wait before using the reservation.
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local amount = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'paused_until')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+local paused_until = tonumber(state[3]) or 0
+tokens = math.min(capacity, tokens + (now - ts) * rate) - amount
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return tostring(math.max(0, -tokens / rate, paused_until - now))
+"""
+
+# Block every reservation on a bucket for ARGV[1] seconds
+_PAUSE_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local current = tonumber(redis.call('HGET', KEYS[1], 'paused_until')) or 0
+redis.call('HSET', KEYS[1], 'paused_until', math.max(current, now + tonumber(ARGV[1])))
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[1])) + 60)
+return 1
+"""
+
+
+class TokenBucket:
+    """
+    In-process token bucket using reservations.
+
+    A reservation always succeeds immediately and may drive the balance
+    negative; the caller then waits until the debt is refilled. This keeps
+    callers served in arrival order without holding a lock while sleeping.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1) -> float:
+        """
+        Take `amount` tokens.
+
+        Returns:
+            Seconds to wait before the reservation may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate, self._paused_until - now)
+
+    def credit(self, amount: float) -> None:
+        """Return (or, if negative, charge) tokens after the true cost is known."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def pause(self, seconds: float) -> None:
+        """Make every reservation wait at least `seconds` from now."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RedisTokenBucket:
+    """
+    Token bucket stored in Redis so several worker processes share one budget.
+
+    Uses Redis server time, so process clocks do not need to agree. If Redis
+    is unreachable the bucket degrades to a local one with the same rate.
+    """
+
+    def __init__(self, key: str, rate: float, capacity: float):
+        """
+        Initialize the bucket.
+
+        Args:
+            key: Redis hash key holding the bucket state
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.key = key
+        self.rate = rate
+        self.capacity = capacity
+        self.local = TokenBucket(rate, capacity)
+        self._redis = None
+
+    async def reserve(self, amount: float = 1) -> float:
+        """Take `amount` tokens; returns seconds to wait."""
+        try:
+            wait = await self._get_redis().eval(
+                _RESERVE_SCRIPT, 1, self.key, self.rate, self.capacity, amount
+            )
+            return float(wait)
+        except Exception as e:
+            logger.warning(f"Shared rate limit unavailable for {self.key}, using local: {e}")
+            return self.local.reserve(amount)
+
+    async def credit(self, amount: float) -> None:
+        """Return (or charge) tokens after the true cost is known."""
+        try:
+            await self._get_redis().hincrbyfloat(self.key, "tokens", amount)
+        except Exception as e:
+            logger.warning(f"Shared rate limit credit failed for {self.key}: {e}")
+            self.local.credit(amount)
+
+    async def pause(self, seconds: float) -> None:
+        """Make every process wait at least `seconds` from now."""
+        try:
+            await self._get_redis().eval(_PAUSE_SCRIPT, 1, self.key, seconds)
+        except Exception as e:
+            logger.warning(f"Shared rate limit pause failed for {self.key}: {e}")
+            self.local.pause(seconds)
+
+    def _get_redis(self):
+        """Lazily create the Redis client (redis is an optional dependency)."""
+        if self._redis is None:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(settings.REDIS_URL)
+        return self._redis
+
+
+class RateLimiter:
+    """
+    Per-provider limiter with a request bucket and an optional token bucket.
+
+    Callers `acquire` before each request, passing the estimated token cost
+    for LLM calls, then `settle` once the real usage is known. Rate-limit
+    response headers fed to `observe` pause the limiter until the provider's
+    quota resets. With RATE_LIMIT_BACKEND=redis the buckets are shared by
+    every process using the same provider name.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float,
+        tokens_per_minute: float = 0,
+        burst_seconds: float | None = None,
+        backend: str | None = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Provider name (also the Redis key suffix)
+            requests_per_minute: Sustained request rate
+            tokens_per_minute: Sustained LLM token rate (0 disables token limiting)
+            burst_seconds: Seconds of quota that may be spent in one burst
+            backend: memory or redis (defaults to RATE_LIMIT_BACKEND)
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.backend = (backend or settings.RATE_LIMIT_BACKEND).lower()
+        burst_seconds = burst_seconds or settings.RATE_LIMIT_BURST_SECONDS
+
+        self.requests = self._bucket("requests", requests_per_minute, burst_seconds)
+        self.tokens = (
+            self._bucket("tokens", tokens_per_minute, burst_seconds) if tokens_per_minute else None
+        )
+        self._counters = {"acquired": 0, "throttled": 0, "waited_seconds": 0.0, "pauses": 0}
+
+    def _bucket(self, kind: str, per_minute: float, burst_seconds: float):
+        """Build one bucket for this limiter's backend."""
+        rate = per_minute / 60
+        capacity = max(1.0, rate * burst_seconds)
+        if self.backend == "redis":
+            return RedisTokenBucket(f"rate_limit:{self.name}:{kind}", rate, capacity)
+        return TokenBucket(rate, capacity)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until one request (and `tokens` tokens) may be sent.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        wait = await _reserve(self.requests, 1)
+        if self.tokens is not None and tokens:
+            wait = max(wait, await _reserve(self.tokens, tokens))
+        self._record(wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens: int = 0) -> None:
+        """
+        Blocking variant of `acquire` for synchronous callers.
+
+        Always uses in-process buckets, even with the Redis backend.
+        """
+        wait = _local(self.requests).reserve(1)
+        if self.tokens is not None and tokens:
+            wait = max(wait, _local(self.tokens).reserve(tokens))
+        self._record(wait)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def settle(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once a response reports its real usage."""
+        if self.tokens is None or estimated == actual:
+            return
+        if isinstance(self.tokens, RedisTokenBucket):
+            await self.tokens.credit(estimated - actual)
+        else:
+            self.tokens.credit(estimated - actual)
+
+    async def observe(self, headers: Mapping[str, str] | None) -> float:
+        """
+        Adapt to rate-limit headers from a provider response.
+
+        Understands `Retry-After`, OpenAI's `x-ratelimit-remaining-*` /
+        `x-ratelimit-reset-*`, and Reddit's `x-ratelimit-remaining` /
+        `x-ratelimit-reset`.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            Seconds the limiter is now paused for (0 if not paused)
+        """
+        seconds = retry_delay(headers)
+        if seconds <= 0:
+            return 0.0
+
+        self._counters["pauses"] += 1
+        logger.warning(f"{self.name} rate limit reached, pausing for {seconds:.1f}s")
+        for bucket in (self.requests, self.tokens):
+            if bucket is None:
+                continue
+            if isinstance(bucket, RedisTokenBucket):
+                await bucket.pause(seconds)
+            else:
+                bucket.pause(seconds)
+        return seconds
+
+    def stats(self) -> dict[str, Any]:
+        """Configured rates and throttling counters."""
+        return {
+            "backend": self.backend,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            **self._counters,
+            "waited_seconds": round(self._counters["waited_seconds"], 3),
+        }
+
+    def _record(self, wait: float) -> None:
+        """Count an acquisition and any time spent waiting for it."""
+        self._counters["acquired"] += 1
+        if wait > 0:
+            self._counters["throttled"] += 1
+            self._counters["waited_seconds"] += wait
+
+
+async def _reserve(bucket: TokenBucket | RedisTokenBucket, amount: float) -> float:
+    """Reserve from either bucket type."""
+    if isinstance(bucket, RedisTokenBucket):
+        return await bucket.reserve(amount)
+    return bucket.reserve(amount)
+
+
+def _local(bucket: TokenBucket | RedisTokenBucket) -> TokenBucket:
+    """The in-process bucket behind either bucket type."""
+    return bucket.local if isinstance(bucket, RedisTokenBucket) else bucket
+
+
+def retry_delay(headers: Mapping[str, str] | None) -> float:
+    """
+    Seconds to wait according to rate-limit response headers.
+
+    Args:
+        headers: Response headers (case-insensitive mapping or plain dict)
+
+    Returns:
+        Delay in seconds, 0 if the headers do not ask for one
+    """
+    if not headers:
+        return 0.0
+    lowered = {key.lower(): value for key, value in headers.items()}
+
+    retry_after = lowered.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    delay = 0.0
+    # OpenAI-style: per-dimension remaining counts and reset durations ("6m0s")
+    for kind in ("requests", "tokens"):
+        remaining = _to_float(lowered.get(f"x-ratelimit-remaining-{kind}"))
+        if remaining is not None and remaining < 1:
+            delay = max(delay, parse_duration(lowered.get(f"x-ratelimit-reset-{kind}", "")))
+
+    # Reddit-style: remaining requests in the window and seconds until it resets
+    remaining = _to_float(lowered.get("x-ratelimit-remaining"))
+    if remaining is not None and remaining < 1:
+        delay = max(delay, _to_float(lowered.get("x-ratelimit-reset")) or 0.0)
+
+    return delay
+
+
+def parse_duration(value: str) -> float:
+    """Parse durations such as "1s", "20ms" or "6m0s" into seconds."""
+    total = 0.0
+    number = ""
+    index = 0
+    units = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    while index < len(value):
+        char = value[index]
+        if char.isdigit() or char == ".":
+            number += char
+            index += 1
+            continue
+        unit = "ms" if value.startswith("ms", index) else char
+        if unit not in units or not number:
+            return total
+        total += float(number) * units[unit]
+        number = ""
+        index += len(unit)
+    if number:
+        total += float(number)
+    return total
+
+
+def _to_float(value: str | None) -> float | None:
+    """Parse a numeric header, or None if absent or malformed."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+# Shared instances, one per provider
+reddit_rate_limiter = RateLimiter("reddit", requests_per_minute=settings.REDDIT_REQUESTS_PER_MINUTE)
+llm_rate_limiter = RateLimiter(
+    "llm",
+    requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+)
@@ -1,13 +1,29 @@
 """Reddit API integration using PRAW."""
 
-import time
+import asyncio
+import functools
+import itertools
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Literal
 
 import praw
 from loguru import logger
 from praw.exceptions import RedditAPIException
+from prawcore.exceptions import TooManyRequests
 
 from app.config import settings
+from app.integrations.circuit_breaker import CircuitBreaker, reddit_breaker
+from app.integrations.rate_limiter import RateLimiter, reddit_rate_limiter
+
+FanoutMode = Literal["none", "keywords", "subreddits", "both"]
+
+DEFAULT_SUBREDDITS = ["marketing", "socialmedia", "smallbusiness", "Entrepreneur"]
+
+# Reciprocal rank fusion constant: keeps one listing's top hit from outweighing
+# a post that several fan-out searches found
+RRF_K = 60
 
 
 class RedditSearchTool:
@@ -18,6 +34,8 @@ class RedditSearchTool:
         client_id: str | None = None,
         client_secret: str | None = None,
         user_agent: str | None = None,
+        limiter: RateLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
     ):
         """
         Initialize Reddit client with credentials.
@@ -26,14 +44,17 @@ class RedditSearchTool:
             client_id: Reddit API client ID (defaults to env)
             client_secret: Reddit API client secret (defaults to env)
             user_agent: Reddit API user agent (defaults to env)
+            limiter: Request rate limiter (defaults to the shared Reddit limiter)
+            breaker: Circuit breaker for Reddit outages (defaults to the shared one)
         """
         self.client_id = client_id or settings.REDDIT_CLIENT_ID
         self.client_secret = client_secret or settings.REDDIT_CLIENT_SECRET
         self.user_agent = user_agent or settings.REDDIT_USER_AGENT
+        self.limiter = limiter or reddit_rate_limiter
+        self.breaker = breaker or reddit_breaker
 
         self._reddit: praw.Reddit | None = None
-        self._last_request_time = 0
-        self._min_request_interval = 1.0  # Rate limit: 1 request per second
+        self._executor: ThreadPoolExecutor | None = None
 
     @property
     def reddit(self) -> praw.Reddit:
@@ -55,11 +76,41 @@ class RedditSearchTool:
         return self._reddit
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        """Wait for the Reddit rate budget (blocking)."""
+        self.limiter.acquire_sync()
+
+    async def _rate_limit_async(self) -> None:
+        """Wait for the Reddit rate budget without blocking the event loop."""
+        await self.limiter.acquire()
+
+    async def _run_in_thread(self, func, *args, **kwargs):
+        """
+        Run a blocking PRAW call on the Reddit worker thread.
+
+        PRAW is not thread-safe, and listings and lazy submission attributes
+        keep using the client that created them, so every call runs on one
+        dedicated thread. Concurrent callers queue for it; throughput is
+        bounded by the rate limiter anyway. The client is initialized on the
+        event loop thread first. Calls go through the circuit breaker, so an
+        open circuit raises CircuitOpenError immediately.
+        """
+        _ = self.reddit
+        self.breaker.before_call()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reddit")
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+        except BaseException as e:
+            self.breaker.record_failure(e)
+            if isinstance(e, TooManyRequests):
+                # Pause every caller sharing the limiter until Reddit's window resets
+                await self.limiter.observe(e.response.headers)
+            raise
+        self.breaker.record_success()
+        return result
 
     def search_subreddits(
         self,
@@ -80,35 +131,203 @@ class RedditSearchTool:
         Returns:
             List of post dictionaries with raw Reddit data
         """
-        if subreddits is None:
-            subreddits = ["marketing", "socialmedia", "smallbusiness", "Entrepreneur"]
+        self._rate_limit()
+        return self._search(keywords, subreddits, limit, time_filter)
 
-        query = " OR ".join(keywords)
-        subreddit_str = "+".join(subreddits)
+    async def search_subreddits_async(
+        self,
+        keywords: list[str],
+        subreddits: list[str] | None = None,
+        limit: int = 10,
+        time_filter: str = "week",
+    ) -> list[dict]:
+        """
+        Search Reddit for posts matching keywords without blocking the event loop.
 
-        posts = []
+        Same arguments and return shape as search_subreddits.
+        """
+        await self._rate_limit_async()
+        return await self._run_in_thread(self._search, keywords, subreddits, limit, time_filter)
 
-        try:
-            self._rate_limit()
+    async def iter_search_pages(
+        self,
+        keywords: list[str],
+        subreddits: list[str] | None = None,
+        limit: int = 10,
+        time_filter: str = "week",
+        page_size: int | None = None,
+        fanout: FanoutMode | None = None,
+        sort: str = "relevance",
+        since: datetime | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream search results page by page without blocking the event loop.
 
-            logger.info(f"Searching Reddit: '{query}' in r/{subreddit_str}")
+        Only one page of posts is held at a time, so callers can process
+        large result sets at constant memory. With fan-out, results are
+        merged and ranked before the first page is yielded (see
+        `_iter_fanout_pages`).
 
-            subreddit = self.reddit.subreddit(subreddit_str)
+        Args:
+            keywords: List of keywords to search for
+            subreddits: List of subreddit names (defaults to popular ones)
+            limit: Maximum number of posts to return in total
+            time_filter: Time filter (hour, day, week, month, year, all)
+            page_size: Posts per yielded page (defaults to REDDIT_PAGE_SIZE)
+            fanout: Search per keyword, per subreddit, or both instead of one
+                combined query (defaults to REDDIT_SEARCH_FANOUT)
+            sort: Reddit search sort (relevance, new, hot, top, comments)
+            since: With sort="new", stop at the first post created before this
+
+        Yields:
+            Lists of post dictionaries with raw Reddit data
+        """
+        page_size = page_size or settings.REDDIT_PAGE_SIZE
+        queries = _fanout_queries(keywords, subreddits, fanout or settings.REDDIT_SEARCH_FANOUT)
+        if len(queries) > 1:
+            pages = self._iter_fanout_pages(queries, limit, time_filter, page_size, sort, since)
+            async for page in pages:
+                yield page
+            return
+
+        listing = self._search_listing(keywords, subreddits, limit, time_filter, sort)
+        fetched = 0
+
+        while fetched < limit:
+            wanted = min(page_size, limit - fetched)
+            await self._rate_limit_async()
+            page = await self._run_in_thread(self._next_page, listing, wanted)
+            complete = len(page) == wanted
+            if since is not None:
+                page = _newer_than(page, since)
+                complete = complete and len(page) == wanted
+            if not page:
+                break
+
+            fetched += len(page)
+            yield page
+
+            if not complete:
+                break
+
+        logger.info(f"Streamed {fetched} posts matching query")
+
+    async def _iter_fanout_pages(
+        self,
+        queries: list[tuple[list[str], list[str]]],
+        limit: int,
+        time_filter: str,
+        page_size: int,
+        sort: str = "relevance",
+        since: datetime | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Run several searches in turn, then merge, dedupe and rank them.
+
+        Fan-out improves recall, not latency: PRAW calls share one worker
+        thread and the Reddit rate limiter, so the searches fetch one page
+        each per round, one after another, until `limit` unique posts are
+        found or all searches run out. Posts are ranked by reciprocal rank
+        fusion of their positions in each search, so posts several searches
+        agree on come first, with Reddit score breaking ties; with sort="new"
+        they are ordered newest first instead, and each search stops at
+        `since`. A failing search is dropped unless all of them fail.
+        """
+        listings = [
+            self._search_listing(keywords, subreddits, limit, time_filter, sort)
+            for keywords, subreddits in queries
+        ]
+        positions = [0] * len(listings)
+        active = set(range(len(listings)))
+        merged: dict[str, dict] = {}
+        relevance: dict[str, float] = {}
+        error: Exception | None = None
+
+        while active and len(merged) < limit:
+            for index in sorted(active):
+                try:
+                    await self._rate_limit_async()
+                    page = await self._run_in_thread(self._next_page, listings[index], page_size)
+                except Exception as e:
+                    logger.warning(f"Fan-out search {queries[index]} failed: {e}")
+                    error = e
+                    active.discard(index)
+                    continue
+                if since is not None:
+                    page = _newer_than(page, since)
+                if len(page) < page_size:
+                    active.discard(index)
+                for post in page:
+                    post_id = post["post_id"]
+                    merged.setdefault(post_id, post)
+                    relevance[post_id] = relevance.get(post_id, 0.0) + 1 / (
+                        RRF_K + positions[index]
+                    )
+                    positions[index] += 1
+
+        if error is not None and not merged:
+            raise error
+
+        if sort == "new":
+            ranked = sorted(merged.values(), key=lambda post: post["created_utc"], reverse=True)
+        else:
+            ranked = sorted(
+                merged.values(),
+                key=lambda post: (-relevance[post["post_id"]], -(post.get("score") or 0)),
+            )
+        ranked = ranked[:limit]
+        logger.info(
+            f"Fan-out over {len(queries)} searches found {len(merged)} unique posts "
+            f"in {sum(positions)} results, returning {len(ranked)}"
+        )
+        for start in range(0, len(ranked), page_size):
+            yield ranked[start : start + page_size]
+
+    def _search(
+        self,
+        keywords: list[str],
+        subreddits: list[str] | None,
+        limit: int,
+        time_filter: str,
+    ) -> list[dict]:
+        """Run a (blocking) subreddit search and extract post data."""
+        listing = self._search_listing(keywords, subreddits, limit, time_filter)
+        posts = self._next_page(listing, limit)
+        logger.info(f"Found {len(posts)} posts matching query")
+        return posts
+
+    def _search_listing(
+        self,
+        keywords: list[str],
+        subreddits: list[str] | None,
+        limit: int,
+        time_filter: str,
+        sort: str = "relevance",
+    ) -> Iterator:
+        """Build a lazy PRAW search listing (no request is made until iterated)."""
+        if subreddits is None:
+            subreddits = DEFAULT_SUBREDDITS
 
-            for submission in subreddit.search(
-                query,
-                limit=limit,
-                time_filter=time_filter,
-                sort="relevance",
-            ):
-                post_data = self._extract_post_data(submission)
-                posts.append(post_data)
+        query = " OR ".join(keywords)
+        subreddit_str = "+".join(subreddits)
 
-                if len(posts) >= limit:
-                    break
+        logger.info(f"Searching Reddit: '{query}' in r/{subreddit_str}")
 
-            logger.info(f"Found {len(posts)} posts matching query")
+        subreddit = self.reddit.subreddit(subreddit_str)
+        return subreddit.search(
+            query,
+            limit=limit,
+            time_filter=time_filter,
+            sort=sort,
+        )
 
+    def _next_page(self, listing: Iterator, size: int) -> list[dict]:
+        """Pull up to `size` submissions from a listing (blocking)."""
+        try:
+            return [
+                self._extract_post_data(submission)
+                for submission in itertools.islice(listing, size)
+            ]
         except RedditAPIException as e:
             logger.error(f"Reddit API error: {e}")
             raise
@@ -116,8 +335,6 @@ class RedditSearchTool:
             logger.error(f"Error searching Reddit: {e}")
             raise
 
-        return posts
-
     def _extract_post_data(self, submission) -> dict:
         """Extract relevant data from a Reddit submission."""
         return {
@@ -146,7 +363,15 @@ class RedditSearchTool:
             Post dictionary with detailed data
         """
         self._rate_limit()
+        return self._fetch_post_details(post_id)
+
+    async def get_post_details_async(self, post_id: str) -> dict:
+        """Get detailed information about a post without blocking the event loop."""
+        await self._rate_limit_async()
+        return await self._run_in_thread(self._fetch_post_details, post_id)
 
+    def _fetch_post_details(self, post_id: str) -> dict:
+        """Fetch and extract a single submission (blocking)."""
         try:
             submission = self.reddit.submission(id=post_id)
             return self._extract_post_data(submission)
@@ -166,7 +391,15 @@ class RedditSearchTool:
             List of comment dictionaries
         """
         self._rate_limit()
+        return self._fetch_top_comments(post_id, limit)
 
+    async def get_top_comments_async(self, post_id: str, limit: int = 5) -> list[dict]:
+        """Get top comments for a post without blocking the event loop."""
+        await self._rate_limit_async()
+        return await self._run_in_thread(self._fetch_top_comments, post_id, limit)
+
+    def _fetch_top_comments(self, post_id: str, limit: int) -> list[dict]:
+        """Fetch top-level comments for a submission (blocking)."""
         try:
             submission = self.reddit.submission(id=post_id)
             submission.comments.replace_more(limit=0)
@@ -190,5 +423,22 @@ class RedditSearchTool:
             raise
 
 
+def _newer_than(page: list[dict], since: datetime) -> list[dict]:
+    """Posts of a newest-first page up to the first one created before `since`."""
+    return list(itertools.takewhile(lambda post: post["created_utc"] >= since, page))
+
+
+def _fanout_queries(
+    keywords: list[str], subreddits: list[str] | None, fanout: FanoutMode | str
+) -> list[tuple[list[str], list[str]]]:
+    """Split a search into (keywords, subreddits) queries for the fan-out mode."""
+    subreddits = subreddits or DEFAULT_SUBREDDITS
+    keyword_groups = [[k] for k in keywords] if fanout in ("keywords", "both") else [keywords]
+    subreddit_groups = (
+        [[s] for s in subreddits] if fanout in ("subreddits", "both") else [subreddits]
+    )
+    return [(k, s) for k in keyword_groups for s in subreddit_groups]
+
+
 # Singleton instance for reuse
 reddit_tool = RedditSearchTool()
@@ -0,0 +1,295 @@
+"""Record Reddit search results to gzipped JSONL and replay them offline."""
+
+import asyncio
+import contextlib
+import gzip
+import itertools
+import json
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from app.config import settings
+from app.integrations.rate_limiter import RateLimiter
+from app.integrations.reddit import RedditSearchTool
+
+# Fields stored as ISO strings and parsed back to datetimes on replay
+DATETIME_FIELDS = ("created_utc",)
+
+# Records read and decoded per worker-thread call during replay
+READ_CHUNK_RECORDS = 1000
+
+
+class RedditRecorder:
+    """
+    Wraps a RedditSearchTool and snapshots everything it returns.
+
+    Drop-in for `ProductDNAService(reddit=...)`: pages are passed through
+    unchanged and appended to a gzipped JSONL file, one line per post:
+    `{"post": {...}, "fetch_ms": float, "comments": [...]}`. `post` is the
+    tool's `_extract_post_data` output, `fetch_ms` the post's share of its
+    page's fetch time (used for replay pacing), and `comments` the top
+    comments when `comments_per_post` is set.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        tool: RedditSearchTool | None = None,
+        comments_per_post: int = 0,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            path: Output file (appended to; created if missing)
+            tool: Live Reddit tool to record (defaults to a new RedditSearchTool)
+            comments_per_post: Top comments to fetch and store per post (extra API calls)
+        """
+        self.path = Path(path)
+        self.tool = tool or RedditSearchTool()
+        self.comments_per_post = comments_per_post
+        self.recorded = 0
+
+    async def iter_search_pages(
+        self,
+        keywords: list[str],
+        subreddits: list[str] | None = None,
+        limit: int = 10,
+        time_filter: str = "week",
+        page_size: int | None = None,
+        fanout: str | None = None,
+        sort: str = "relevance",
+        since: datetime | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Stream search pages from the live tool, recording each one."""
+        pages = self.tool.iter_search_pages(
+            keywords=keywords,
+            subreddits=subreddits,
+            limit=limit,
+            time_filter=time_filter,
+            page_size=page_size,
+            fanout=fanout,
+            sort=sort,
+            since=since,
+        )
+        while True:
+            started = time.perf_counter()
+            try:
+                page = await anext(pages)
+            except StopAsyncIteration:
+                break
+            fetch_ms = (time.perf_counter() - started) * 1000 / max(len(page), 1)
+
+            records = []
+            for post in page:
+                record: dict[str, Any] = {"post": post, "fetch_ms": round(fetch_ms, 2)}
+                if self.comments_per_post:
+                    record["comments"] = await self.tool.get_top_comments_async(
+                        post["post_id"], self.comments_per_post
+                    )
+                records.append(record)
+            self.recorded += write_records(self.path, records)
+            yield page
+
+        logger.info(f"Recorded {self.recorded} Reddit posts to {self.path}")
+
+
+class RedditReplay:
+    """
+    Replays a recorded (or synthetic) corpus in place of RedditSearchTool.
+
+    Searches stream the file from disk, so corpora of millions of posts
+    replay at constant memory. Reading and JSON decoding run on a worker
+    thread in chunks, so they do not stall the pipeline stages sharing the
+    event loop. Posts are filtered by subreddit and, if
+    `match_keywords` is set, by keyword in the title or body. Each page
+    waits for its recorded fetch time (scaled by `speed`) and, if given,
+    the rate limiter, so collection runs at a realistic pace.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        speed: float = 1.0,
+        limiter: RateLimiter | None = None,
+        match_keywords: bool = False,
+    ):
+        """
+        Initialize the replay backend.
+
+        Args:
+            path: Gzipped JSONL corpus written by RedditRecorder or write_records
+            speed: Pacing multiplier (2 = twice as fast, 0 = no delays)
+            limiter: Optional limiter acquired once per page, like the live tool
+            match_keywords: Only return posts containing one of the keywords
+        """
+        self.path = Path(path)
+        self.speed = speed
+        self.limiter = limiter
+        self.match_keywords = match_keywords
+        self._comments: dict[str, list[dict]] | None = None
+
+    async def iter_search_pages(
+        self,
+        keywords: list[str],
+        subreddits: list[str] | None = None,
+        limit: int = 10,
+        time_filter: str = "week",
+        page_size: int | None = None,
+        fanout: str | None = None,
+        sort: str = "relevance",
+        since: datetime | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream matching recorded posts page by page.
+
+        Same arguments and page shape as RedditSearchTool.iter_search_pages;
+        `time_filter`, `fanout` and `sort` are ignored since the corpus is a
+        fixed snapshot of already merged results. Posts created before
+        `since` are skipped.
+        """
+        page_size = page_size or settings.REDDIT_PAGE_SIZE
+        wanted_subreddits = {s.lower() for s in subreddits} if subreddits else None
+        terms = [k.lower() for k in keywords] if self.match_keywords else []
+
+        fetched = 0
+        page: list[dict] = []
+        page_ms = 0.0
+        async with contextlib.aclosing(read_records_async(self.path)) as records:
+            async for record in records:
+                post = record["post"]
+                if wanted_subreddits and post.get("subreddit", "").lower() not in wanted_subreddits:
+                    continue
+                if terms and not _matches(post, terms):
+                    continue
+                if since is not None and post["created_utc"] < since:
+                    continue
+
+                page.append(post)
+                page_ms += record.get("fetch_ms", 0.0)
+                if len(page) == min(page_size, limit - fetched):
+                    await self._pace(page_ms)
+                    fetched += len(page)
+                    yield page
+                    page, page_ms = [], 0.0
+                    if fetched >= limit:
+                        break
+
+        if page:
+            await self._pace(page_ms)
+            fetched += len(page)
+            yield page
+
+        logger.info(f"Replayed {fetched} posts from {self.path}")
+
+    async def get_post_details_async(self, post_id: str) -> dict:
+        """Look up one recorded post by ID (scans the corpus)."""
+        async with contextlib.aclosing(read_records_async(self.path)) as records:
+            async for record in records:
+                if record["post"]["post_id"] == post_id:
+                    return record["post"]
+        raise KeyError(f"Post {post_id} not in {self.path}")
+
+    async def get_top_comments_async(self, post_id: str, limit: int = 5) -> list[dict]:
+        """Recorded top comments for a post (empty if none were recorded)."""
+        if self._comments is None:
+            self._comments = {
+                record["post"]["post_id"]: record["comments"]
+                async for record in read_records_async(self.path)
+                if record.get("comments")
+            }
+        return self._comments.get(post_id, [])[:limit]
+
+    async def _pace(self, page_ms: float) -> None:
+        """Wait as long as the live API took for this page."""
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        if self.speed > 0 and page_ms > 0:
+            await asyncio.sleep(page_ms / 1000 / self.speed)
+        else:
+            await asyncio.sleep(0)
+
+
+def write_records(path: str | Path, records: Iterable[dict[str, Any]]) -> int:
+    """
+    Append records to a gzipped JSONL corpus.
+
+    Args:
+        path: Corpus file (created with parent directories if missing)
+        records: Dicts with a "post" key and optional "fetch_ms" / "comments"
+
+    Returns:
+        Number of records written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with gzip.open(path, "at", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, default=_encode) + "\n")
+            written += 1
+    return written
+
+
+def read_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream records from a gzipped JSONL corpus, restoring datetime fields."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                _decode(record["post"])
+                for comment in record.get("comments") or []:
+                    _decode(comment)
+                yield record
+
+
+async def read_records_async(
+    path: str | Path, chunk_size: int = READ_CHUNK_RECORDS
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream records like `read_records` without blocking the event loop.
+
+    Records are read and decoded on a worker thread, `chunk_size` at a time.
+
+    Args:
+        path: Gzipped JSONL corpus
+        chunk_size: Records decoded per worker-thread call
+
+    Yields:
+        Records with datetime fields restored
+    """
+    records = read_records(path)
+    try:
+        while chunk := await asyncio.to_thread(list, itertools.islice(records, chunk_size)):
+            for record in chunk:
+                yield record
+    finally:
+        # A read still running after a cancel keeps the generator busy; its
+        # file is then closed when the generator is collected
+        with contextlib.suppress(ValueError):
+            records.close()
+
+
+def _matches(post: dict, terms: list[str]) -> bool:
+    """Whether any search term appears in the post's title or body."""
+    text = f"{post.get('title', '')} {post.get('body', '')}".lower()
+    return any(term in text for term in terms)
+
+
+def _encode(value: Any) -> str:
+    """JSON encoder for datetimes."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode(item: dict) -> None:
+    """Parse ISO datetime fields in place."""
+    for field in DATETIME_FIELDS:
+        if isinstance(item.get(field), str):
+            item[field] = datetime.fromisoformat(item[field])
@@ -0,0 +1,98 @@
+"""Retry with exponential backoff, full jitter and an overall deadline."""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import openai
+from loguru import logger
+
+from app.config import settings
+from app.integrations.rate_limiter import retry_delay
+
+T = TypeVar("T")
+
+# Transient failures worth another attempt; anything else fails immediately
+RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    TimeoutError,
+)
+
+
+class RetryPolicy:
+    """
+    Retries transient failures within an attempt budget and a deadline.
+
+    Delays grow exponentially from `base_delay` up to `max_delay`, with full
+    jitter so concurrent callers do not retry in lockstep. A `Retry-After`
+    header on the failed response raises the delay to at least that value.
+    Each attempt is cut off when the deadline for the whole call expires.
+    """
+
+    def __init__(
+        self,
+        attempts: int | None = None,
+        base_delay: float | None = None,
+        max_delay: float | None = None,
+        deadline: float | None = None,
+        retryable: tuple[type[BaseException], ...] = RETRYABLE_ERRORS,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            attempts: Maximum attempts including the first (defaults to settings)
+            base_delay: Delay before the first retry in seconds (defaults to settings)
+            max_delay: Cap on a single delay in seconds (defaults to settings)
+            deadline: Seconds allowed for all attempts together (defaults to settings)
+            retryable: Exception types that trigger a retry
+        """
+        self.attempts = attempts or settings.LLM_RETRY_ATTEMPTS
+        self.base_delay = base_delay if base_delay is not None else settings.LLM_RETRY_BASE_DELAY
+        self.max_delay = max_delay or settings.LLM_RETRY_MAX_DELAY
+        self.deadline = deadline or settings.LLM_CALL_DEADLINE_SECONDS
+        self.retryable = retryable
+
+    async def run(self, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Call `func` until it succeeds, fails permanently, or the budget runs out.
+
+        Args:
+            func: Zero-argument coroutine factory, called once per attempt
+
+        Returns:
+            The first successful result
+
+        Raises:
+            The last error once attempts or the deadline are exhausted, or any
+            non-retryable error immediately
+        """
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                return await asyncio.wait_for(func(), timeout=deadline - time.monotonic())
+            except self.retryable as e:
+                delay = self.backoff(attempt, e)
+                if attempt >= self.attempts or time.monotonic() + delay >= deadline:
+                    raise
+                logger.warning(
+                    f"Attempt {attempt}/{self.attempts} failed ({type(e).__name__}), "
+                    f"retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    def backoff(self, attempt: int, error: BaseException | None = None) -> float:
+        """Delay before the retry following `attempt`."""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        response = getattr(error, "response", None)
+        if response is not None:
+            delay = max(delay, retry_delay(getattr(response, "headers", None)))
+        return delay
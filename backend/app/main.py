@@ -6,10 +6,13 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.config import settings
+from app.db.indexes import ensure_indexes
 from app.db.mongodb import mongodb
 from app.exceptions.handlers import setup_exception_handlers
 from app.middleware.cors import setup_cors
-from app.routers import health, product_dna, status
+from app.routers import health, product_dna, schedules, status
+from app.services.jobs import job_service
+from app.services.schedules import schedule_service
 from app.utils.logging import logger, setup_logging
 
 
@@ -35,6 +38,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("MongoDB connected successfully")
     except Exception as e:
         logger.warning(f"MongoDB connection failed: {e}. Some features may be unavailable.")
+    else:
+        # Create the indexes every query shape relies on
+        try:
+            await ensure_indexes(mongodb.db)
+        except Exception as e:
+            logger.warning(f"MongoDB index creation failed: {e}. Queries may be slow.")
+
+        # Start background collection job workers (resumes interrupted jobs)
+        await job_service.start()
+
+        # Start dispatching scheduled collections as jobs
+        if settings.SCHEDULER_ENABLED:
+            await schedule_service.start()
 
     yield
 
@@ -42,6 +58,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("=" * 80)
     logger.info(f"Shutting down {settings.APP_NAME}")
 
+    # Stop the scheduler before the workers its jobs run on
+    await schedule_service.stop()
+
+    # Stop job workers, re-queueing any job still in flight
+    await job_service.stop()
+
     # Disconnect from MongoDB
     await mongodb.disconnect()
 
@@ -84,6 +106,7 @@ def create_app() -> FastAPI:
     app.include_router(health.router)
     app.include_router(status.router)
     app.include_router(product_dna.router)
+    app.include_router(schedules.router)
 
     logger.info("FastAPI application created successfully")
 
@@ -105,4 +128,5 @@ async def root():
         "health": "/health",
         "status": "/api/v1/status",
         "product_dna": "/api/v1/product-dna",
+        "schedules": "/api/v1/product-dna/schedules",
     }
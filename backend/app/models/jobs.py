@@ -0,0 +1,61 @@
+"""Background collection job models."""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from app.models.reddit import CollectionRequest, CollectionResponse
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a collection job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class JobProgress(BaseModel):
+    """Per-post progress counters for a running job."""
+
+    collected: int = Field(default=0, description="Posts fetched from Reddit")
+    skipped: int = Field(default=0, description="Posts already stored with unchanged content")
+    enriched: int = Field(default=0, description="Posts enriched by the LLM")
+    stored: int = Field(default=0, description="Posts written to MongoDB")
+    failed: int = Field(default=0, description="Posts that failed enrichment or storage")
+
+
+class CollectionJob(BaseModel):
+    """A Product DNA collection running in the background."""
+
+    job_id: str = Field(..., description="Job identifier")
+    status: JobStatus = Field(..., description="Current job state")
+    request: CollectionRequest = Field(..., description="Collection parameters")
+    progress: JobProgress = Field(default_factory=JobProgress, description="Progress counters")
+    result: CollectionResponse | None = Field(None, description="Summary once completed")
+    error: str | None = Field(None, description="Failure reason")
+    attempts: int = Field(default=0, description="Times a worker has started this job")
+    schedule_id: str | None = Field(None, description="Schedule that queued this job")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime | None = Field(None)
+    finished_at: datetime | None = Field(None)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "3f2b9c1e8a7d4e6f9b0c1d2e3f4a5b6c",
+                "status": "running",
+                "request": {
+                    "keywords": ["social media marketing"],
+                    "subreddits": ["marketing"],
+                    "limit": 50,
+                    "time_filter": "week",
+                },
+                "progress": {"collected": 50, "skipped": 12, "enriched": 20, "stored": 0},
+                "attempts": 1,
+                "created_at": "2025-12-15T10:00:00Z",
+                "started_at": "2025-12-15T10:00:01Z",
+            }
+        }
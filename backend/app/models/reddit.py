@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -14,6 +15,13 @@ class Sentiment(str, Enum):
     NEGATIVE = "negative"
 
 
+class EnrichmentStatus(str, Enum):
+    """Whether a record carries real LLM output or placeholder values."""
+
+    COMPLETE = "complete"
+    FALLBACK = "fallback"
+
+
 class RedditPost(BaseModel):
     """Raw Reddit post data."""
 
@@ -67,7 +75,15 @@ class EnrichedPost(BaseModel):
     title: str = Field(..., description="Post title")
     body: str = Field(default="", description="Post body")
     sentiment: Sentiment = Field(..., description="LLM-generated sentiment")
+    confidence: float | None = Field(None, description="LLM confidence in the sentiment (0-1)")
     summary: str = Field(..., description="LLM-generated summary")
+    enrichment_status: EnrichmentStatus = Field(
+        default=EnrichmentStatus.COMPLETE,
+        description="fallback if the LLM was unavailable and placeholders were stored",
+    )
+    content_hash: str | None = Field(
+        None, description="Hash of title/body at enrichment time (used to skip re-enrichment)"
+    )
     metadata: PostMetadata = Field(..., description="Post metadata")
     keywords: list[str] = Field(default_factory=list, description="Search keywords used")
     enriched_at: datetime = Field(
@@ -97,6 +113,19 @@ class EnrichedPost(BaseModel):
         }
 
 
+class ProductDNASummary(BaseModel):
+    """Lightweight Product DNA record for list views."""
+
+    post_id: str = Field(..., description="Original post ID")
+    title: str = Field(..., description="Post title")
+    sentiment: Sentiment = Field(..., description="LLM-generated sentiment")
+    confidence: float | None = Field(None, description="LLM confidence in the sentiment (0-1)")
+    summary: str = Field(..., description="LLM-generated summary")
+    subreddit: str = Field(..., description="Subreddit name")
+    url: str = Field(..., description="Reddit permalink")
+    enriched_at: datetime = Field(..., description="Enrichment timestamp")
+
+
 class CollectionRequest(BaseModel):
     """Request to collect Product DNA from Reddit."""
 
@@ -104,10 +133,18 @@ class CollectionRequest(BaseModel):
     subreddits: list[str] = Field(
         default=["marketing", "socialmedia", "smallbusiness"], description="Subreddits to search"
     )
-    limit: int = Field(default=10, ge=1, le=100, description="Max posts to collect")
+    limit: int = Field(default=10, ge=1, le=10000, description="Max posts to collect")
     time_filter: str = Field(
         default="week", description="Time filter (hour/day/week/month/year/all)"
     )
+    fanout: Literal["none", "keywords", "subreddits", "both"] | None = Field(
+        default=None,
+        description="Search each keyword and/or subreddit separately and merge (default: settings)",
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Only collect posts newer than the last incremental run of this query",
+    )
 
     class Config:
         json_schema_extra = {
@@ -127,12 +164,35 @@ class CollectionResponse(BaseModel):
     posts_collected: int = Field(...)
     posts_enriched: int = Field(...)
     posts_stored: int = Field(...)
+    posts_new: int = Field(default=0, description="Collected posts not yet stored")
+    posts_refreshed: int = Field(
+        default=0, description="Stored posts re-enriched because their content changed"
+    )
+    posts_skipped: int = Field(
+        default=0, description="Stored posts skipped because their content is unchanged"
+    )
+    posts_seen: int = Field(
+        default=0, description="Posts skipped because an earlier incremental run already saw them"
+    )
     errors: list[str] = Field(default_factory=list)
     sample: list[EnrichedPost] = Field(
         default_factory=list, description="Sample of collected posts"
     )
 
 
+class CollectionWatermark(BaseModel):
+    """How far incremental collection has read for one (keywords, subreddits) query."""
+
+    query_key: str = Field(..., description="Normalized keywords and subreddits")
+    keywords: list[str] = Field(...)
+    subreddits: list[str] = Field(...)
+    newest_created_utc: datetime = Field(..., description="Newest post seen by the query")
+    seen_ids: list[str] = Field(
+        default_factory=list, description="Newest post IDs seen, newest first"
+    )
+    updated_at: datetime = Field(...)
+
+
 class ProductDNAStats(BaseModel):
     """Statistics about Product DNA collection."""
 
@@ -140,3 +200,11 @@ class ProductDNAStats(BaseModel):
     by_sentiment: dict[str, int] = Field(...)
     by_subreddit: dict[str, int] = Field(...)
     last_collection: datetime | None = Field(None)
+
+
+class TrendPoint(BaseModel):
+    """Sentiment counts for one time bucket."""
+
+    bucket: datetime = Field(..., description="Start of the hour or day bucket")
+    total: int = Field(..., description="Posts created in the bucket")
+    by_sentiment: dict[str, int] = Field(..., description="Posts per sentiment label")
@@ -0,0 +1,93 @@
+"""Scheduled collection models."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field, field_validator
+from pydantic_core import PydanticCustomError
+
+from app.models.reddit import CollectionRequest
+
+EXAMPLE_REQUEST = {
+    "keywords": ["social media marketing"],
+    "subreddits": ["marketing", "socialmedia"],
+    "limit": 200,
+    "time_filter": "day",
+    "incremental": True,
+}
+
+
+class ScheduleCreate(BaseModel):
+    """Definition of a recurring collection."""
+
+    name: str = Field(..., min_length=1, description="Human-readable schedule name")
+    request: CollectionRequest = Field(..., description="Collection run on every tick")
+    interval_seconds: int = Field(..., ge=60, description="Seconds between runs")
+    jitter_seconds: int | None = Field(
+        None,
+        ge=0,
+        description="Random spread of each run (default: SCHEDULE_JITTER_FRACTION of the interval)",
+    )
+    enabled: bool = Field(default=True, description="Whether the schedule runs")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "name": "Hourly social media marketing",
+                "request": EXAMPLE_REQUEST,
+                "interval_seconds": 3600,
+            }
+        }
+
+
+class ScheduleUpdate(BaseModel):
+    """
+    Partial update of a schedule; omitted fields are left unchanged.
+
+    Only `jitter_seconds` may be set to null (back to the default spread).
+    """
+
+    name: str | None = Field(None, min_length=1)
+    request: CollectionRequest | None = Field(None)
+    interval_seconds: int | None = Field(None, ge=60)
+    jitter_seconds: int | None = Field(None, ge=0)
+    enabled: bool | None = Field(None)
+
+    @field_validator("name", "request", "interval_seconds", "enabled")
+    @classmethod
+    def not_null(cls, value):
+        """Reject explicit nulls for fields a stored schedule requires."""
+        if value is None:
+            raise PydanticCustomError("not_null", "Field may be omitted but not set to null")
+        return value
+
+
+class CollectionSchedule(ScheduleCreate):
+    """A stored recurring collection and its run state."""
+
+    schedule_id: str = Field(..., description="Schedule identifier")
+    next_run_at: datetime = Field(..., description="When the next run is due")
+    last_run_at: datetime | None = Field(None, description="When the last run was queued")
+    last_job_id: str | None = Field(None, description="Job queued by the last run")
+    runs: int = Field(default=0, description="Jobs queued by this schedule")
+    skipped_runs: int = Field(
+        default=0, description="Runs skipped because the previous job was still active"
+    )
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "schedule_id": "9c1e8a7d4e6f9b0c1d2e3f4a5b6c3f2b",
+                "name": "Hourly social media marketing",
+                "request": EXAMPLE_REQUEST,
+                "interval_seconds": 3600,
+                "jitter_seconds": None,
+                "enabled": True,
+                "next_run_at": "2025-12-15T11:03:12Z",
+                "last_run_at": "2025-12-15T10:01:47Z",
+                "last_job_id": "3f2b9c1e8a7d4e6f9b0c1d2e3f4a5b6c",
+                "runs": 24,
+                "skipped_runs": 0,
+                "created_at": "2025-12-14T10:00:00Z",
+            }
+        }
@@ -1,19 +1,34 @@
 """Product DNA API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any, Literal
+
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
+from app.models.jobs import CollectionJob
 from app.models.reddit import (
     CollectionRequest,
     CollectionResponse,
     EnrichedPost,
     ProductDNAStats,
+    ProductDNASummary,
     Sentiment,
+    TrendPoint,
 )
-from app.services.product_dna import product_dna_service
+from app.services.jobs import job_service
+from app.services.product_dna import ProductDNAView, product_dna_service
+from app.services.rollups import Granularity, rollup_service
+from app.utils import export
 
 router = APIRouter(prefix="/api/v1/product-dna", tags=["Product DNA"])
 
+# Largest collection run inside one POST /collect request; bigger pulls go through /jobs
+SYNC_COLLECT_LIMIT = 100
+
 
 @router.post(
     "/collect",
@@ -27,9 +42,17 @@ async def collect_product_dna(request: CollectionRequest) -> CollectionResponse:
 
     - **keywords**: List of keywords to search for
     - **subreddits**: Target subreddits (defaults to marketing, socialmedia, smallbusiness)
-    - **limit**: Maximum posts to collect (1-100)
+    - **limit**: Maximum posts to collect (1-100; use `POST /jobs` for larger pulls)
     - **time_filter**: Time range (hour, day, week, month, year, all)
     """
+    if request.limit > SYNC_COLLECT_LIMIT:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"limit may be at most {SYNC_COLLECT_LIMIT} for POST /collect; "
+                "queue larger collections with POST /api/v1/product-dna/jobs"
+            ),
+        )
     logger.info(f"Starting Product DNA collection: {request.keywords}")
 
     try:
@@ -40,35 +63,170 @@ async def collect_product_dna(request: CollectionRequest) -> CollectionResponse:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.post(
+    "/collect/stream",
+    summary="Collect Product DNA (Streaming)",
+    description="Run the collection pipeline and stream per-post progress events",
+    response_class=StreamingResponse,
+)
+async def collect_product_dna_stream(
+    request: CollectionRequest,
+    format: Literal["ndjson", "sse"] = Query("ndjson", description="Stream format"),
+) -> StreamingResponse:
+    """
+    Collect posts like `POST /collect`, streaming progress as it happens.
+
+    Emits `collected`, `skipped`, `enriched`, `stored` and `failed` events
+    per post, then a final `summary` event with the CollectionResponse.
+    Use `format=sse` for EventSource clients, or `ndjson` (one JSON object
+    per line) otherwise.
+    """
+    logger.info(f"Starting streaming Product DNA collection: {request.keywords}")
+
+    events = product_dna_service.collect_events(request)
+    if format == "sse":
+        return StreamingResponse(_sse_stream(events), media_type="text/event-stream")
+    return StreamingResponse(_ndjson_stream(events), media_type="application/x-ndjson")
+
+
+async def _ndjson_stream(events: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    """Format events as newline-delimited JSON."""
+    async for event in events:
+        yield json.dumps(event, default=str) + "\n"
+
+
+async def _sse_stream(events: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    """Format events as server-sent events."""
+    async for event in events:
+        yield f"event: {event['event']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+@router.post(
+    "/jobs",
+    response_model=CollectionJob,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue Product DNA Collection",
+    description="Queue the collection pipeline as a background job and return immediately",
+)
+async def create_collection_job(request: CollectionRequest) -> CollectionJob:
+    """
+    Queue a collection job; poll `GET /jobs/{job_id}` for progress.
+
+    Takes the same parameters as `POST /collect`.
+    """
+    try:
+        return await job_service.enqueue(request)
+    except Exception as e:
+        logger.error(f"Failed to queue collection job: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=CollectionJob,
+    summary="Get Collection Job",
+    description="Get status, progress counters and result of a collection job",
+)
+async def get_collection_job(job_id: str) -> CollectionJob:
+    """Get a collection job by ID."""
+    try:
+        job = await job_service.get_job(job_id)
+    except Exception as e:
+        logger.error(f"Failed to get job {job_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
 @router.get(
     "/",
-    response_model=list[EnrichedPost],
+    response_model=list[EnrichedPost] | list[ProductDNASummary],
     summary="Get Product DNA",
     description="Retrieve stored Product DNA records with optional filters",
 )
 async def get_product_dna(
+    response: Response,
     sentiment: Sentiment | None = Query(None, description="Filter by sentiment"),
     subreddit: str | None = Query(None, description="Filter by subreddit"),
     limit: int = Query(50, ge=1, le=500, description="Max records to return"),
-    skip: int = Query(0, ge=0, description="Records to skip (pagination)"),
-) -> list[EnrichedPost]:
+    skip: int = Query(0, ge=0, description="Records to skip (offset pagination)"),
+    cursor: str | None = Query(
+        None, description="Cursor from the X-Next-Cursor header of the previous page"
+    ),
+    view: ProductDNAView = Query(
+        "full", description="full records, or summary (no body or metadata) for list views"
+    ),
+) -> list[EnrichedPost] | list[ProductDNASummary]:
     """
-    Retrieve Product DNA records from the database.
+    Retrieve Product DNA records from the database, newest first.
 
-    Supports filtering by sentiment and subreddit, with pagination.
+    Supports filtering by sentiment and subreddit. For deep paging, pass the
+    `X-Next-Cursor` response header back as `cursor`; the header is absent
+    on the last page. `view=summary` returns only the fields list views
+    render, projected in MongoDB.
     """
     try:
-        posts = await product_dna_service.get_product_dna(
+        posts, next_cursor = await product_dna_service.get_product_dna_page(
             sentiment=sentiment,
             subreddit=subreddit,
             limit=limit,
             skip=skip,
+            cursor=cursor,
+            view=view,
         )
-        return posts
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Failed to retrieve Product DNA: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return posts
+
+
+@router.get(
+    "/export",
+    summary="Export Product DNA",
+    description="Stream every matching record as NDJSON or CSV, optionally gzipped",
+    response_class=StreamingResponse,
+)
+async def export_product_dna(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+    sentiment: Sentiment | None = Query(None, description="Filter by sentiment"),
+    subreddit: str | None = Query(None, description="Filter by subreddit"),
+    batch_size: int | None = Query(
+        None, ge=1, le=10000, description="Documents fetched per MongoDB round trip"
+    ),
+    gzip: bool = Query(False, description="Compress the export with gzip"),
+) -> StreamingResponse:
+    """
+    Export the Product DNA dataset in one streamed response.
+
+    Records are encoded as they come off the MongoDB cursor, so memory
+    stays flat regardless of dataset size. CSV flattens metadata into
+    columns and joins keywords with `;`.
+    """
+    docs = product_dna_service.iter_product_dna(
+        sentiment=sentiment, subreddit=subreddit, batch_size=batch_size
+    )
+    body = export.coalesce(export.csv_rows(docs) if format == "csv" else export.ndjson_lines(docs))
+
+    filename = f"product_dna.{format}"
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    if gzip:
+        body = export.gzip_stream(body)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
 
 @router.get(
     "/stats",
@@ -94,16 +252,58 @@ async def get_stats() -> ProductDNAStats:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get(
+    "/trends",
+    response_model=list[TrendPoint],
+    summary="Sentiment Trends",
+    description="Sentiment counts per hour or day, read from pre-aggregated rollups",
+)
+async def get_trends(
+    granularity: Granularity = Query("day", description="Bucket size (hour/day)"),
+    subreddit: str | None = Query(None, description="Filter by subreddit"),
+    keyword: str | None = Query(None, description="Filter by collection keyword"),
+    start: datetime | None = Query(None, description="Earliest bucket (inclusive)"),
+    end: datetime | None = Query(None, description="Latest bucket (exclusive)"),
+) -> list[TrendPoint]:
+    """
+    Get sentiment counts over time, bucketed by post creation time.
+
+    Reads only the rollup collection, so cost depends on the number of
+    buckets requested rather than the number of stored posts.
+    """
+    try:
+        return await rollup_service.get_trends(
+            granularity=granularity, subreddit=subreddit, keyword=keyword, start=start, end=end
+        )
+    except Exception as e:
+        logger.error(f"Failed to get trends: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.post(
     "/ensure-indexes",
     summary="Create Database Indexes",
-    description="Create MongoDB indexes for efficient queries",
+    description="Create MongoDB indexes for efficient queries (also done at startup)",
 )
 async def ensure_indexes():
     """Create MongoDB indexes for the product_dna collection."""
     try:
-        await product_dna_service.ensure_indexes()
-        return {"message": "Indexes created successfully"}
+        indexes = await product_dna_service.ensure_indexes()
+        return {"message": "Indexes created successfully", "indexes": indexes}
     except Exception as e:
         logger.error(f"Failed to create indexes: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get(
+    "/indexes",
+    summary="Index Usage",
+    description="Report how often each product_dna index has been used ($indexStats)",
+)
+async def get_index_usage():
+    """Get per-index usage counters for the product_dna collection."""
+    try:
+        return {"indexes": await product_dna_service.get_index_usage()}
+    except Exception as e:
+        logger.error(f"Failed to get index usage: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
@@ -0,0 +1,139 @@
+"""Scheduled collection API endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from loguru import logger
+
+from app.models.jobs import CollectionJob
+from app.models.schedules import CollectionSchedule, ScheduleCreate, ScheduleUpdate
+from app.services.schedules import schedule_service
+
+router = APIRouter(prefix="/api/v1/product-dna/schedules", tags=["Schedules"])
+
+
+@router.post(
+    "",
+    response_model=CollectionSchedule,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Collection Schedule",
+    description="Store a recurring collection run by the built-in scheduler",
+)
+async def create_schedule(data: ScheduleCreate) -> CollectionSchedule:
+    """
+    Create a schedule that queues `request` as a job every `interval_seconds`.
+
+    Runs are spread by up to `jitter_seconds` either way and skipped while
+    the previous run's job is still active. Set `request.incremental` so
+    each run only collects posts that are new since the last one.
+    """
+    try:
+        return await schedule_service.create(data)
+    except Exception as e:
+        logger.error(f"Failed to create schedule: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get(
+    "",
+    response_model=list[CollectionSchedule],
+    summary="List Collection Schedules",
+    description="List every collection schedule with its next and last run",
+)
+async def list_schedules() -> list[CollectionSchedule]:
+    """List collection schedules."""
+    try:
+        return await schedule_service.list_schedules()
+    except Exception as e:
+        logger.error(f"Failed to list schedules: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get(
+    "/{schedule_id}",
+    response_model=CollectionSchedule,
+    summary="Get Collection Schedule",
+)
+async def get_schedule(schedule_id: str) -> CollectionSchedule:
+    """Get a collection schedule by ID."""
+    try:
+        schedule = await schedule_service.get(schedule_id)
+    except Exception as e:
+        logger.error(f"Failed to get schedule {schedule_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _found(schedule, schedule_id)
+
+
+@router.patch(
+    "/{schedule_id}",
+    response_model=CollectionSchedule,
+    summary="Update Collection Schedule",
+    description="Change, pause (`enabled: false`) or resume a schedule",
+)
+async def update_schedule(schedule_id: str, data: ScheduleUpdate) -> CollectionSchedule:
+    """Update a collection schedule; omitted fields are left unchanged."""
+    try:
+        schedule = await schedule_service.update(schedule_id, data)
+    except Exception as e:
+        logger.error(f"Failed to update schedule {schedule_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _found(schedule, schedule_id)
+
+
+@router.delete(
+    "/{schedule_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete Collection Schedule",
+    description="Delete a schedule; jobs it already queued are kept",
+)
+async def delete_schedule(schedule_id: str) -> Response:
+    """Delete a collection schedule."""
+    try:
+        deleted = await schedule_service.delete(schedule_id)
+    except Exception as e:
+        logger.error(f"Failed to delete schedule {schedule_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    if not deleted:
+        raise HTTPException(status_code=404, detail=f"Schedule {schedule_id} not found")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    "/{schedule_id}/run",
+    response_model=CollectionSchedule,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Run Collection Schedule Now",
+    description="Make a schedule due immediately; the scheduler queues its job on the next tick",
+)
+async def run_schedule(schedule_id: str) -> CollectionSchedule:
+    """Trigger a schedule outside its cadence."""
+    try:
+        schedule = await schedule_service.trigger(schedule_id)
+    except Exception as e:
+        logger.error(f"Failed to trigger schedule {schedule_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _found(schedule, schedule_id)
+
+
+@router.get(
+    "/{schedule_id}/runs",
+    response_model=list[CollectionJob],
+    summary="Get Schedule Run History",
+    description="Jobs queued by a schedule, newest first, with progress and results",
+)
+async def get_schedule_runs(
+    schedule_id: str,
+    limit: int = Query(20, ge=1, le=200, description="Maximum runs to return"),
+) -> list[CollectionJob]:
+    """List a schedule's runs."""
+    try:
+        return await schedule_service.history(schedule_id, limit=limit)
+    except Exception as e:
+        logger.error(f"Failed to get runs of schedule {schedule_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+def _found(schedule: CollectionSchedule | None, schedule_id: str) -> CollectionSchedule:
+    """Return the schedule or raise 404."""
+    if schedule is None:
+        raise HTTPException(status_code=404, detail=f"Schedule {schedule_id} not found")
+    return schedule
@@ -0,0 +1,381 @@
+"""Background collection jobs - queueing, workers, and progress tracking."""
+
+import asyncio
+import contextlib
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+from loguru import logger
+from pymongo import ReturnDocument
+
+from app.config import settings
+from app.db.mongodb import mongodb
+from app.models.jobs import CollectionJob, JobProgress, JobStatus
+from app.models.reddit import CollectionRequest
+from app.services.product_dna import ProductDNAService, product_dna_service
+
+# Pipeline events counted towards each JobProgress field
+PROGRESS_EVENTS = {"collected", "skipped", "enriched", "stored", "failed"}
+
+# Attempts at writing a finished job's final status before giving up
+FINISH_ATTEMPTS = 3
+
+
+class JobProgressTracker:
+    """
+    Counts pipeline events for a job and flushes them to MongoDB periodically.
+
+    Every flush also renews the run's lease. Once a flush finds that the
+    lease was taken over by another claim, the tracker cancels `pipeline`
+    so the two runs do not fetch, enrich and write the same posts.
+    """
+
+    def __init__(self, service: "JobService", job_id: str, lease_id: str):
+        """
+        Initialize the tracker.
+
+        Args:
+            service: Owning job service
+            job_id: Job being tracked
+            lease_id: Token of the claim this run holds on the job
+        """
+        self.service = service
+        self.job_id = job_id
+        self.lease_id = lease_id
+        self.progress = JobProgress()
+        self.pipeline: asyncio.Task | None = None
+        self.lease_lost = False
+        self._last_flush = time.monotonic()
+
+    async def record(self, event: str, data: dict[str, Any]) -> None:
+        """Pipeline callback: count an event and flush if the interval elapsed."""
+        if event not in PROGRESS_EVENTS:
+            return
+        setattr(self.progress, event, getattr(self.progress, event) + 1)
+
+        due = time.monotonic() - self._last_flush >= settings.JOB_PROGRESS_FLUSH_SECONDS
+        if due and not await self.flush():
+            self.lose_lease()
+
+    async def flush(self) -> bool:
+        """
+        Persist counters and extend this run's lease on the job.
+
+        Returns:
+            Whether the lease is still held (False once another claim took the job)
+        """
+        self._last_flush = time.monotonic()
+        result = await self.service.collection.update_one(
+            {"job_id": self.job_id, "lease_id": self.lease_id},
+            {
+                "$set": {
+                    "progress": self.progress.model_dump(),
+                    "lease_expires_at": self.service.lease_deadline(),
+                }
+            },
+        )
+        return result.matched_count > 0
+
+    async def heartbeat(self) -> None:
+        """Renew the lease every third of JOB_LEASE_SECONDS until cancelled."""
+        while True:
+            await asyncio.sleep(settings.JOB_LEASE_SECONDS / 3)
+            try:
+                if not await self.flush():
+                    self.lose_lease()
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to renew lease on collection job {self.job_id}: {e}")
+
+    def lose_lease(self) -> None:
+        """Stop this run because another claim now holds the job."""
+        if not self.lease_lost:
+            logger.warning(f"Lost the lease on collection job {self.job_id}; stopping this run")
+        self.lease_lost = True
+        if self.pipeline is not None:
+            self.pipeline.cancel()
+
+
+class JobService:
+    """
+    Runs collection jobs on asyncio worker tasks.
+
+    Jobs live in MongoDB. A worker claims a job by taking a time-limited
+    lease, identified by a token unique to that claim, and renews it from a
+    heartbeat while the job runs. Jobs whose lease expires,
+    for example because the process restarted, are claimed again. A re-run
+    resumes where the previous attempt stopped: posts that were already
+    stored are skipped by the pipeline's dedup stage, so they are not
+    enriched twice.
+    """
+
+    COLLECTION_NAME = "collection_jobs"
+
+    def __init__(self, product_dna: ProductDNAService | None = None):
+        """
+        Initialize the job service.
+
+        Args:
+            product_dna: Pipeline used to run jobs
+        """
+        self.product_dna = product_dna or product_dna_service
+        self.worker_id = uuid.uuid4().hex
+        self._workers: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        # Lease tokens of the jobs this process is running, by job ID
+        self._active_jobs: dict[str, str] = {}
+
+    @property
+    def collection(self):
+        """Get the collection_jobs MongoDB collection."""
+        return mongodb.get_collection(self.COLLECTION_NAME)
+
+    @staticmethod
+    def lease_deadline() -> datetime:
+        """Expiry time for a freshly taken or renewed lease."""
+        return datetime.utcnow() + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+
+    async def enqueue(self, request: CollectionRequest, **fields: Any) -> CollectionJob:
+        """
+        Queue a collection job.
+
+        Args:
+            request: Collection parameters
+            **fields: Extra fields stored on the job document
+
+        Returns:
+            The queued job
+        """
+        job = CollectionJob(
+            job_id=uuid.uuid4().hex, status=JobStatus.QUEUED, request=request, **fields
+        )
+        await self.collection.insert_one({**job.model_dump(), **fields, "lease_expires_at": None})
+        self._wakeup.set()
+
+        logger.info(f"Queued collection job {job.job_id}: {request.keywords}")
+        return job
+
+    async def get_job(self, job_id: str) -> CollectionJob | None:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job, or None if it does not exist
+        """
+        doc = await self.collection.find_one({"job_id": job_id}, {"_id": 0})
+        return CollectionJob(**doc) if doc else None
+
+    async def list_jobs(self, schedule_id: str, limit: int = 20) -> list[CollectionJob]:
+        """
+        Jobs queued by a schedule, newest first.
+
+        Args:
+            schedule_id: Schedule whose run history to list
+            limit: Maximum jobs to return
+
+        Returns:
+            The schedule's most recent jobs
+        """
+        cursor = (
+            self.collection.find({"schedule_id": schedule_id}, {"_id": 0})
+            .sort("created_at", -1)
+            .limit(limit)
+        )
+        return [CollectionJob(**doc) async for doc in cursor]
+
+    async def start(self, workers: int | None = None) -> None:
+        """
+        Start worker tasks.
+
+        Args:
+            workers: Number of concurrent jobs (defaults to JOB_WORKERS)
+        """
+        if self._workers:
+            return
+
+        for index in range(workers or settings.JOB_WORKERS):
+            self._workers.append(
+                asyncio.create_task(self._worker_loop(), name=f"job-worker-{index}")
+            )
+        logger.info(f"Started {len(self._workers)} collection job workers")
+
+    async def stop(self) -> None:
+        """Stop workers and hand their in-flight jobs back to the queue."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        if self._active_jobs:
+            await self.collection.update_many(
+                {"lease_id": {"$in": list(self._active_jobs.values())}},
+                {
+                    "$set": {
+                        "status": JobStatus.QUEUED.value,
+                        "lease_id": None,
+                        "lease_expires_at": None,
+                    }
+                },
+            )
+            logger.info(f"Re-queued {len(self._active_jobs)} interrupted jobs")
+            self._active_jobs.clear()
+
+    async def _worker_loop(self) -> None:
+        """Claim and run jobs until cancelled."""
+        while True:
+            try:
+                claimed = await self._claim_next()
+            except Exception as e:
+                logger.error(f"Failed to claim collection job: {e}")
+                claimed = None
+
+            if claimed is None:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=settings.JOB_POLL_INTERVAL_SECONDS
+                    )
+                continue
+
+            job, lease_id = claimed
+            try:
+                await self.run_job(job, lease_id)
+            except Exception as e:
+                logger.error(f"Collection job {job.job_id} could not be completed: {e}")
+
+    async def _claim_next(self) -> tuple[CollectionJob, str] | None:
+        """
+        Atomically lease the oldest queued job, or one whose lease expired.
+
+        Returns:
+            Tuple of (job, lease token of this claim), or None if no job is available
+        """
+        now = datetime.utcnow()
+        lease_id = uuid.uuid4().hex
+
+        # Give up on jobs that keep dying mid-run
+        await self.collection.update_many(
+            {
+                "status": JobStatus.RUNNING.value,
+                "lease_expires_at": {"$lt": now},
+                "attempts": {"$gte": settings.JOB_MAX_ATTEMPTS},
+            },
+            {
+                "$set": {
+                    "status": JobStatus.FAILED.value,
+                    "error": f"Abandoned after {settings.JOB_MAX_ATTEMPTS} attempts",
+                    "finished_at": now,
+                    "lease_expires_at": None,
+                }
+            },
+        )
+
+        doc = await self.collection.find_one_and_update(
+            {
+                "attempts": {"$lt": settings.JOB_MAX_ATTEMPTS},
+                "$or": [
+                    {"status": JobStatus.QUEUED.value},
+                    {"status": JobStatus.RUNNING.value, "lease_expires_at": {"$lt": now}},
+                ],
+            },
+            {
+                "$set": {
+                    "status": JobStatus.RUNNING.value,
+                    "worker_id": self.worker_id,
+                    "lease_id": lease_id,
+                    "lease_expires_at": self.lease_deadline(),
+                    "started_at": now,
+                    "progress": JobProgress().model_dump(),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", 1)],
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+        return (CollectionJob(**doc), lease_id) if doc else None
+
+    async def run_job(self, job: CollectionJob, lease_id: str) -> None:
+        """
+        Run a claimed job through the pipeline and record the outcome.
+
+        The lease is renewed by a heartbeat for as long as the pipeline
+        runs, including phases that emit no progress events (buffered
+        fan-out searches, rate limit pauses, open LLM circuits). If the
+        lease is lost to another claim, the pipeline is cancelled and the
+        outcome is left to the run that now holds the job.
+
+        Args:
+            job: Job leased by this worker
+            lease_id: Token of the claim on the job
+        """
+        tracker = JobProgressTracker(self, job.job_id, lease_id)
+        self._active_jobs[job.job_id] = lease_id
+        logger.info(f"Running collection job {job.job_id} (attempt {job.attempts})")
+
+        tracker.pipeline = asyncio.create_task(
+            self.product_dna.collect_and_enrich(job.request, on_event=tracker.record)
+        )
+        heartbeat = asyncio.create_task(tracker.heartbeat())
+        try:
+            result = await tracker.pipeline
+        except asyncio.CancelledError:
+            if not tracker.lease_lost:
+                raise
+            update = None
+        except Exception as e:
+            logger.error(f"Collection job {job.job_id} failed: {e}")
+            update = {"status": JobStatus.FAILED.value, "error": str(e)}
+        else:
+            update = {
+                "status": JobStatus.COMPLETED.value,
+                "result": result.model_dump(),
+                "error": None,
+            }
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        if update is None:
+            self._active_jobs.pop(job.job_id, None)
+            logger.info(f"Collection job {job.job_id} stopped: lease taken by another claim")
+            return
+
+        update |= {
+            "progress": tracker.progress.model_dump(),
+            "finished_at": datetime.utcnow(),
+            "lease_id": None,
+            "lease_expires_at": None,
+        }
+        try:
+            await self._finish(job.job_id, lease_id, update)
+        finally:
+            self._active_jobs.pop(job.job_id, None)
+        logger.info(f"Collection job {job.job_id} finished: {update['status']}")
+
+    async def _finish(self, job_id: str, lease_id: str, update: dict[str, Any]) -> None:
+        """Write a finished job's outcome, retrying transient failures."""
+        for attempt in range(1, FINISH_ATTEMPTS + 1):
+            try:
+                result = await self.collection.update_one(
+                    {"job_id": job_id, "lease_id": lease_id}, {"$set": update}
+                )
+            except Exception as e:
+                if attempt == FINISH_ATTEMPTS:
+                    raise
+                logger.warning(f"Failed to record outcome of job {job_id} (attempt {attempt}): {e}")
+                await asyncio.sleep(attempt)
+                continue
+
+            if result.matched_count == 0:
+                logger.warning(f"Lease on job {job_id} was lost; outcome not recorded")
+            return
+
+
+# Singleton instance
+job_service = JobService()
@@ -1,21 +1,62 @@
 """Product DNA service - orchestrates Reddit collection and LLM enrichment."""
 
 import asyncio
+import base64
+import contextlib
+import hashlib
+import json
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime
+from typing import Any, Literal
 
 from loguru import logger
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
+from app.config import settings
+from app.db.indexes import ensure_collection_indexes, index_usage
 from app.db.mongodb import mongodb
 from app.integrations.llm import LLMService, llm_service
+from app.integrations.llm_router import LLMRouter
 from app.integrations.reddit import RedditSearchTool, reddit_tool
 from app.models.reddit import (
     CollectionRequest,
     CollectionResponse,
     EnrichedPost,
+    EnrichmentStatus,
     PostMetadata,
     ProductDNAStats,
+    ProductDNASummary,
     Sentiment,
 )
+from app.services.rollups import RollupService, rollup_service
+from app.services.watermarks import WatermarkService, WatermarkTracker, watermark_service
+
+# Receives per-post pipeline events: collected, skipped, enriched, stored, failed
+ProgressCallback = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+# Queue sentinel marking the end of a pipeline stage
+_DONE = object()
+
+# Record shapes returned by get_product_dna
+ProductDNAView = Literal["full", "summary"]
+
+# Fields fetched for each view; summary leaves the Reddit body on the server
+VIEW_PROJECTIONS: dict[str, dict[str, int]] = {
+    "full": {"_id": 0},
+    "summary": {
+        "_id": 0,
+        "post_id": 1,
+        "title": 1,
+        "sentiment": 1,
+        "confidence": 1,
+        "summary": 1,
+        "metadata.subreddit": 1,
+        "metadata.url": 1,
+        "enriched_at": 1,
+    },
+}
 
 
 class ProductDNAService:
@@ -27,6 +68,8 @@ class ProductDNAService:
         self,
         reddit: RedditSearchTool | None = None,
         llm: LLMService | None = None,
+        rollups: RollupService | None = None,
+        watermarks: WatermarkService | None = None,
     ):
         """
         Initialize Product DNA service.
@@ -34,9 +77,16 @@ class ProductDNAService:
         Args:
             reddit: Reddit search tool instance
             llm: LLM service instance
+            rollups: Rollup service updated as new posts are stored
+            watermarks: Watermark store used by incremental collections
         """
         self.reddit = reddit or reddit_tool
         self.llm = llm or llm_service
+        self.rollups = rollups or rollup_service
+        self.watermarks = watermarks or watermark_service
+
+        self._stats_cache: tuple[float, ProductDNAStats] | None = None
+        self._stats_lock = asyncio.Lock()
 
     @property
     def collection(self):
@@ -46,64 +96,333 @@ class ProductDNAService:
     async def collect_and_enrich(
         self,
         request: CollectionRequest,
+        on_event: ProgressCallback | None = None,
     ) -> CollectionResponse:
         """
         Collect posts from Reddit and enrich with LLM analysis.
 
+        Runs as a streaming pipeline: Reddit pages feed a bounded queue,
+        enrichment workers drain it into a second bounded queue, and a
+        writer stores posts in small batches as soon as they are enriched.
+        Memory stays constant regardless of `request.limit`.
+
+        Incremental requests page Reddit newest first, stop at the query's
+        watermark and drop posts an earlier run already saw; `limit` counts
+        unseen posts only. The watermark only advances when the run finishes
+        without errors and reaches it, so failed posts and posts beyond the
+        limit are picked up next time.
+
         Args:
             request: Collection request parameters
+            on_event: Optional async callback receiving per-post progress events
 
         Returns:
             CollectionResponse with results
         """
-        errors = []
-        posts_collected = 0
-        posts_enriched = 0
-        posts_stored = 0
-        enriched_posts = []
-
-        try:
-            # Step 1: Collect from Reddit
-            logger.info(f"Collecting posts for keywords: {request.keywords}")
-
-            raw_posts = self.reddit.search_subreddits(
-                keywords=request.keywords,
-                subreddits=request.subreddits,
-                limit=request.limit,
-                time_filter=request.time_filter,
-            )
-            posts_collected = len(raw_posts)
-            logger.info(f"Collected {posts_collected} posts from Reddit")
-
-            # Step 2: Enrich with LLM (in batches to avoid rate limits)
-            for post in raw_posts:
+        errors: list[str] = []
+        counts = {"collected": 0, "enriched": 0, "stored": 0}
+        dedup_counts = {"new": 0, "refreshed": 0, "skipped": 0, "seen": 0}
+        sample: list[EnrichedPost] = []
+        # Stored documents of refreshed posts, so their rollups follow a sentiment change
+        previous: dict[str, dict[str, Any]] = {}
+        tracker = await self._watermark_tracker(request) if request.incremental else None
+
+        workers = settings.ENRICHMENT_CONCURRENCY
+        enrich_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+
+        async def produce() -> None:
+            # Step 1: Collect from Reddit page by page, skipping known posts
+            try:
+                logger.info(f"Collecting posts for keywords: {request.keywords}")
+                async for page in self.reddit.iter_search_pages(
+                    keywords=request.keywords,
+                    subreddits=request.subreddits,
+                    limit=tracker.search_limit(request.limit) if tracker else request.limit,
+                    time_filter=request.time_filter,
+                    fanout=request.fanout,
+                    sort="new" if tracker else "relevance",
+                    since=tracker.cutoff if tracker else None,
+                ):
+                    if tracker is not None:
+                        page, seen = tracker.take(page, request.limit - counts["collected"])
+                        dedup_counts["seen"] += seen
+
+                    counts["collected"] += len(page)
+                    for post in page:
+                        await _emit(on_event, "collected", {"post_id": post.get("post_id")})
+
+                    # Step 2: Skip posts already stored with unchanged content
+                    to_enrich, page_counts, known = await self._filter_known_posts(page)
+                    previous.update(known)
+                    for key, value in page_counts.items():
+                        dedup_counts[key] += value
+                    if page_counts["skipped"]:
+                        enrich_ids = {post.get("post_id") for post in to_enrich}
+                        for post in page:
+                            if post.get("post_id") not in enrich_ids:
+                                await _emit(on_event, "skipped", {"post_id": post.get("post_id")})
+
+                    for post in to_enrich:
+                        await enrich_queue.put(post)
+
+                    if tracker is not None and not tracker.complete:
+                        break
+
+                logger.info(f"Collected {counts['collected']} posts from Reddit")
+            except Exception as e:
+                logger.error(f"Collection pipeline error: {e}")
+                errors.append(f"Pipeline error: {str(e)}")
+            finally:
+                for _ in range(workers):
+                    await enrich_queue.put(_DONE)
+
+        async def enrich() -> None:
+            # Step 3: Enrich with LLM (bounded concurrency)
+            timeout = settings.ENRICHMENT_TIMEOUT_SECONDS
+            while (post := await enrich_queue.get()) is not _DONE:
+                enriched, error = await self._enrich_one(post, request.keywords, timeout, on_event)
+                if error is not None:
+                    errors.append(error)
+                    continue
+                counts["enriched"] += 1
+                if len(sample) < 3:
+                    sample.append(enriched)
+                await store_queue.put(enriched)
+
+        async def write() -> None:
+            # Step 4: Store in MongoDB in small batches
+            batch: list[EnrichedPost] = []
+            finished_workers = 0
+
+            async def flush() -> None:
+                if batch:
+                    stored, store_errors = await self._store_posts(
+                        batch, on_event=on_event, previous=previous
+                    )
+                    counts["stored"] += stored
+                    errors.extend(store_errors)
+                    batch.clear()
+
+            while finished_workers < workers:
                 try:
-                    enriched = await self._enrich_post(post, request.keywords)
-                    enriched_posts.append(enriched)
-                    posts_enriched += 1
-                except Exception as e:
-                    logger.warning(f"Failed to enrich post {post.get('post_id')}: {e}")
-                    errors.append(f"Enrichment failed for {post.get('post_id')}: {str(e)}")
+                    item = await asyncio.wait_for(
+                        store_queue.get(), timeout=settings.PIPELINE_FLUSH_SECONDS
+                    )
+                except TimeoutError:
+                    await flush()
+                    continue
+
+                if item is _DONE:
+                    finished_workers += 1
+                    continue
+                batch.append(item)
+                if len(batch) >= settings.PIPELINE_STORE_BATCH_SIZE:
+                    await flush()
+            await flush()
+
+        async def enrich_worker() -> None:
+            try:
+                await enrich()
+            finally:
+                await store_queue.put(_DONE)
 
-            logger.info(f"Enriched {posts_enriched}/{posts_collected} posts")
+        await asyncio.gather(produce(), write(), *(enrich_worker() for _ in range(workers)))
 
-            # Step 3: Store in MongoDB
-            if enriched_posts:
-                posts_stored = await self._store_posts(enriched_posts)
-                logger.info(f"Stored {posts_stored} posts in MongoDB")
+        if tracker is not None:
+            await self._save_watermark(request, tracker, errors)
 
-        except Exception as e:
-            logger.error(f"Collection pipeline error: {e}")
-            errors.append(f"Pipeline error: {str(e)}")
+        logger.info(
+            f"Collection finished: {counts['collected']} collected, "
+            f"{counts['enriched']} enriched, {counts['stored']} stored"
+        )
 
         return CollectionResponse(
             success=len(errors) == 0,
-            posts_collected=posts_collected,
-            posts_enriched=posts_enriched,
-            posts_stored=posts_stored,
+            posts_collected=counts["collected"],
+            posts_enriched=counts["enriched"],
+            posts_stored=counts["stored"],
+            posts_new=dedup_counts["new"],
+            posts_refreshed=dedup_counts["refreshed"],
+            posts_skipped=dedup_counts["skipped"],
+            posts_seen=dedup_counts["seen"],
             errors=errors,
-            sample=enriched_posts[:3],  # Return first 3 as sample
+            sample=sample,  # First 3 enriched posts as sample
+        )
+
+    async def collect_events(self, request: CollectionRequest) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run a collection and yield its progress events as they happen.
+
+        Yields one event per post and stage (collected, skipped, enriched,
+        stored, failed), then a final `summary` event carrying the
+        CollectionResponse. Closing the iterator early cancels the run.
+
+        Args:
+            request: Collection request parameters
+
+        Yields:
+            Event dictionaries with an `event` key
+        """
+        # Bounded so a slow consumer applies backpressure to the pipeline
+        events: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+
+        async def on_event(event: str, data: dict[str, Any]) -> None:
+            await events.put({"event": event, **data})
+
+        async def run() -> None:
+            try:
+                result = await self.collect_and_enrich(request, on_event=on_event)
+                await events.put({"event": "summary", "result": result.model_dump(mode="json")})
+            except Exception:
+                await events.put(_DONE)
+                raise
+            # Not reached on cancellation, where nobody reads the queue any more
+            await events.put(_DONE)
+
+        task = asyncio.create_task(run())
+        try:
+            while (event := await events.get()) is not _DONE:
+                yield event
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                logger.info("Streaming collection cancelled by client")
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def _watermark_tracker(self, request: CollectionRequest) -> WatermarkTracker:
+        """Start tracking an incremental run (a full scan if the watermark can't be read)."""
+        try:
+            previous = await self.watermarks.get(request.keywords, request.subreddits)
+        except Exception as e:
+            logger.warning(f"Watermark lookup failed, collecting the full window: {e}")
+            previous = None
+        if previous is None:
+            logger.info(f"No watermark yet, collecting the full '{request.time_filter}' window")
+        else:
+            logger.info(f"Collecting posts newer than {previous.newest_created_utc.isoformat()}")
+        return WatermarkTracker(previous)
+
+    async def _save_watermark(
+        self,
+        request: CollectionRequest,
+        tracker: WatermarkTracker,
+        errors: list[str],
+    ) -> None:
+        """Advance the query's watermark after a successful incremental run."""
+        if errors:
+            logger.warning("Incremental run had errors, watermark not advanced")
+            return
+        if tracker.previous is not None and not tracker.complete:
+            logger.info(
+                f"Incremental run stopped at limit={request.limit} before the watermark; "
+                f"the next run continues down to it"
+            )
+        try:
+            await self.watermarks.save(request.keywords, request.subreddits, tracker)
+        except Exception as e:
+            logger.warning(f"Failed to save watermark: {e}")
+
+    async def _filter_known_posts(
+        self, raw_posts: list[dict]
+    ) -> tuple[list[dict], dict[str, int], dict[str, dict[str, Any]]]:
+        """
+        Drop posts already stored with the same title/body.
+
+        Uses a single `$in` lookup on post_id. Posts whose content hash
+        changed since they were stored, or that were stored with fallback
+        values, are kept for re-enrichment.
+
+        Args:
+            raw_posts: Raw post dictionaries from Reddit
+
+        Returns:
+            Tuple of (posts to enrich, counts of new/refreshed/skipped posts,
+            stored documents of the refreshed posts by post_id)
+        """
+        counts = {"new": 0, "refreshed": 0, "skipped": 0}
+        if not raw_posts:
+            return [], counts, {}
+
+        try:
+            cursor = self.collection.find(
+                {"post_id": {"$in": [post.get("post_id") for post in raw_posts]}},
+                {
+                    "_id": 0,
+                    "post_id": 1,
+                    "content_hash": 1,
+                    "enrichment_status": 1,
+                    "sentiment": 1,
+                    "keywords": 1,
+                    "metadata.subreddit": 1,
+                    "metadata.created_utc": 1,
+                },
+            )
+            known = {doc["post_id"]: doc async for doc in cursor}
+        except Exception as e:
+            logger.warning(f"Dedup lookup failed, enriching all posts: {e}")
+            counts["new"] = len(raw_posts)
+            return raw_posts, counts, {}
+
+        to_enrich = []
+        refreshed: dict[str, dict[str, Any]] = {}
+        for post in raw_posts:
+            post_id = post.get("post_id")
+            doc = known.get(post_id)
+            if doc is None:
+                counts["new"] += 1
+            elif doc.get("enrichment_status") == EnrichmentStatus.FALLBACK.value or (
+                doc.get("content_hash") != content_hash(post.get("title", ""), post.get("body", ""))
+            ):
+                counts["refreshed"] += 1
+                refreshed[post_id] = doc
+            else:
+                counts["skipped"] += 1
+                continue
+            to_enrich.append(post)
+
+        logger.info(
+            f"Dedup: {counts['new']} new, {counts['refreshed']} changed, "
+            f"{counts['skipped']} unchanged posts skipped"
         )
+        return to_enrich, counts, refreshed
+
+    async def _enrich_one(
+        self,
+        post: dict,
+        keywords: list[str],
+        timeout: float,
+        on_event: ProgressCallback | None = None,
+    ) -> tuple[EnrichedPost | None, str | None]:
+        """
+        Enrich one post under a timeout; returns (enriched post, error message).
+
+        While every LLM provider's circuit is open the worker pauses (up to
+        `timeout`) for one to recover instead of storing fallback values; if
+        none does the post fails fast and is picked up by the next collection.
+        """
+        post_id = post.get("post_id")
+        router = getattr(self.llm, "router", None)
+        try:
+            if isinstance(router, LLMRouter) and not await router.wait_until_available(timeout):
+                raise RuntimeError("All LLM provider circuits are open")
+            enriched = await asyncio.wait_for(self._enrich_post(post, keywords), timeout=timeout)
+        except TimeoutError:
+            logger.warning(f"Enrichment timed out for post {post_id} after {timeout}s")
+            error = f"Enrichment timed out for {post_id} after {timeout}s"
+        except Exception as e:
+            logger.warning(f"Failed to enrich post {post_id}: {e}")
+            error = f"Enrichment failed for {post_id}: {str(e)}"
+        else:
+            await _emit(
+                on_event, "enriched", {"post_id": post_id, "sentiment": enriched.sentiment.value}
+            )
+            return enriched, None
+
+        await _emit(on_event, "failed", {"post_id": post_id, "error": error})
+        return None, error
 
     async def _enrich_post(self, post: dict, keywords: list[str]) -> EnrichedPost:
         """Enrich a single post with LLM analysis."""
@@ -111,10 +430,7 @@ class ProductDNAService:
         body = post.get("body", "")
 
         # Run sentiment and summary analysis
-        sentiment_result, summary = await asyncio.gather(
-            self.llm.analyze_sentiment(title, body),
-            self.llm.generate_summary(title, body),
-        )
+        result = await self.llm.analyze_post(title, body)
 
         # Build enriched post
         metadata = PostMetadata(
@@ -131,31 +447,227 @@ class ProductDNAService:
             post_id=post.get("post_id", ""),
             title=title,
             body=body,
-            sentiment=Sentiment(sentiment_result.sentiment.value),
-            summary=summary,
+            sentiment=Sentiment(result.sentiment.sentiment.value),
+            confidence=result.sentiment.confidence,
+            summary=result.summary,
+            enrichment_status=(
+                EnrichmentStatus.FALLBACK if result.fallback else EnrichmentStatus.COMPLETE
+            ),
+            content_hash=content_hash(title, body),
             metadata=metadata,
             keywords=keywords,
             enriched_at=datetime.utcnow(),
         )
 
-    async def _store_posts(self, posts: list[EnrichedPost]) -> int:
-        """Store enriched posts in MongoDB with upsert."""
+    async def _store_posts(
+        self,
+        posts: list[EnrichedPost],
+        on_event: ProgressCallback | None = None,
+        previous: dict[str, dict[str, Any]] | None = None,
+    ) -> tuple[int, list[str]]:
+        """
+        Store enriched posts in MongoDB with unordered bulk upserts.
+
+        Newly inserted posts are counted into the trend rollups, and updated
+        posts whose sentiment changed are moved to their new sentiment.
+
+        Args:
+            posts: Enriched posts to upsert by post_id
+            on_event: Optional callback receiving stored/failed events
+            previous: Stored documents of re-enriched posts by post_id, as
+                returned by `_filter_known_posts`; entries are consumed
+
+        Returns:
+            Tuple of (posts inserted or modified, per-post error messages)
+        """
         stored_count = 0
+        errors = []
+        inserted: list[EnrichedPost] = []
+        changed: list[tuple[dict[str, Any], str]] = []
+        previous = previous if previous is not None else {}
+        chunk_size = settings.MONGO_BULK_CHUNK_SIZE
+
+        for start in range(0, len(posts), chunk_size):
+            chunk = posts[start : start + chunk_size]
+            # Use upserts to avoid duplicates
+            operations = [
+                UpdateOne({"post_id": post.post_id}, {"$set": post.model_dump()}, upsert=True)
+                for post in chunk
+            ]
+
+            chunk_errors: dict[str, str] = {}
+            inserted_before = len(inserted)
+            try:
+                result = await self.collection.bulk_write(operations, ordered=False)
+                stored_count += result.upserted_count + result.modified_count
+                inserted.extend(chunk[index] for index in result.upserted_ids)
+            except BulkWriteError as e:
+                # Unordered writes keep going past failures; count what landed
+                details = e.details
+                stored_count += details.get("nUpserted", 0) + details.get("nModified", 0)
+                inserted.extend(chunk[upsert["index"]] for upsert in details.get("upserted", []))
+                for write_error in details.get("writeErrors", []):
+                    post_id = chunk[write_error["index"]].post_id
+                    logger.error(f"Failed to store post {post_id}: {write_error.get('errmsg')}")
+                    chunk_errors[post_id] = (
+                        f"Storage failed for {post_id}: {write_error.get('errmsg')}"
+                    )
+            except Exception as e:
+                logger.error(f"Failed to store {len(chunk)} posts: {e}")
+                chunk_errors = {
+                    post.post_id: f"Storage failed for {post.post_id}: {str(e)}" for post in chunk
+                }
+
+            errors.extend(chunk_errors.values())
+            inserted_ids = {post.post_id for post in inserted[inserted_before:]}
+            for post in chunk:
+                # Updated (not inserted) posts move between sentiments
+                doc = previous.pop(post.post_id, None)
+                if (
+                    doc is not None
+                    and doc.get("sentiment")
+                    and post.post_id not in chunk_errors
+                    and post.post_id not in inserted_ids
+                ):
+                    changed.append((doc, post.sentiment.value))
+
+                if post.post_id in chunk_errors:
+                    await _emit(
+                        on_event,
+                        "failed",
+                        {"post_id": post.post_id, "error": chunk_errors[post.post_id]},
+                    )
+                else:
+                    await _emit(on_event, "stored", {"post_id": post.post_id})
+
+        if inserted:
+            try:
+                await self.rollups.record(inserted)
+            except Exception as e:
+                # Rollups are derived data; a rebuild restores them
+                logger.warning(f"Failed to update rollups for {len(inserted)} posts: {e}")
+
+        if changed:
+            try:
+                await self.rollups.reclassify(changed)
+            except Exception as e:
+                logger.warning(f"Failed to update rollups for {len(changed)} posts: {e}")
+
+        if stored_count:
+            self.invalidate_stats()
+        return stored_count, errors
+
+    async def reenrich_degraded(
+        self,
+        limit: int | None = None,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, int]:
+        """
+        Re-run enrichment for records stored with fallback values.
+
+        Uses the stored title and body, so Reddit is not contacted. Records
+        are processed in MONGO_BULK_CHUNK_SIZE chunks; any that fall back
+        again are left as they are for a later run.
+
+        Args:
+            limit: Maximum records to process (default: all degraded records)
+            concurrency: Maximum posts enriched at once (defaults to settings)
+            timeout: Per-post timeout in seconds (defaults to settings)
+
+        Returns:
+            Counts of scanned, repaired, still_degraded and failed records
+        """
+        concurrency = concurrency or settings.ENRICHMENT_CONCURRENCY
+        timeout = timeout or settings.ENRICHMENT_TIMEOUT_SECONDS
+        semaphore = asyncio.Semaphore(concurrency)
+        counts = {"scanned": 0, "repaired": 0, "still_degraded": 0, "failed": 0}
+
+        async def analyze(doc: dict[str, Any]):
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.llm.analyze_post(doc.get("title", ""), doc.get("body", "")),
+                        timeout=timeout,
+                    )
+                except Exception as e:
+                    logger.warning(f"Re-enrichment failed for post {doc.get('post_id')}: {e}")
+                    return None
+
+        async def repair(chunk: list[dict[str, Any]]) -> None:
+            results = await asyncio.gather(*(analyze(doc) for doc in chunk))
+            repaired = [
+                (doc, result)
+                for doc, result in zip(chunk, results, strict=True)
+                if result is not None and not result.fallback
+            ]
+            counts["scanned"] += len(chunk)
+            counts["failed"] += sum(result is None for result in results)
+            counts["still_degraded"] += sum(
+                result is not None and result.fallback for result in results
+            )
+            if not repaired:
+                return
+
+            now = datetime.utcnow()
+            operations = [
+                UpdateOne(
+                    {
+                        "post_id": doc["post_id"],
+                        "enrichment_status": EnrichmentStatus.FALLBACK.value,
+                    },
+                    {
+                        "$set": {
+                            "sentiment": result.sentiment.sentiment.value,
+                            "confidence": result.sentiment.confidence,
+                            "summary": result.summary,
+                            "enrichment_status": EnrichmentStatus.COMPLETE.value,
+                            "content_hash": content_hash(doc.get("title", ""), doc.get("body", "")),
+                            "enriched_at": now,
+                        }
+                    },
+                )
+                for doc, result in repaired
+            ]
+            await self.collection.bulk_write(operations, ordered=False)
+            counts["repaired"] += len(repaired)
 
-        for post in posts:
             try:
-                # Use upsert to avoid duplicates
-                result = await self.collection.update_one(
-                    {"post_id": post.post_id},
-                    {"$set": post.model_dump()},
-                    upsert=True,
+                await self.rollups.reclassify(
+                    (doc, result.sentiment.sentiment.value) for doc, result in repaired
                 )
-                if result.upserted_id or result.modified_count:
-                    stored_count += 1
             except Exception as e:
-                logger.error(f"Failed to store post {post.post_id}: {e}")
+                logger.warning(f"Failed to update rollups for {len(repaired)} posts: {e}")
+
+        cursor = self.collection.find(
+            {"enrichment_status": EnrichmentStatus.FALLBACK.value},
+            {
+                "_id": 0,
+                "post_id": 1,
+                "title": 1,
+                "body": 1,
+                "sentiment": 1,
+                "keywords": 1,
+                "metadata.subreddit": 1,
+                "metadata.created_utc": 1,
+            },
+        )
+        if limit:
+            cursor = cursor.limit(limit)
 
-        return stored_count
+        chunk: list[dict[str, Any]] = []
+        async for doc in cursor:
+            chunk.append(doc)
+            if len(chunk) >= settings.MONGO_BULK_CHUNK_SIZE:
+                await repair(chunk)
+                chunk = []
+        if chunk:
+            await repair(chunk)
+
+        if counts["repaired"]:
+            self.invalidate_stats()
+        logger.info(f"Re-enrichment finished: {counts}")
+        return counts
 
     async def get_product_dna(
         self,
@@ -163,71 +675,245 @@ class ProductDNAService:
         subreddit: str | None = None,
         limit: int = 50,
         skip: int = 0,
-    ) -> list[EnrichedPost]:
+        cursor: str | None = None,
+        view: ProductDNAView = "full",
+    ) -> list[EnrichedPost] | list[ProductDNASummary]:
         """
-        Retrieve stored Product DNA records.
+        Retrieve stored Product DNA records, newest first.
+
+        Only the fields the view needs are fetched, and documents are built
+        without re-validation since they were validated when stored.
 
         Args:
             sentiment: Filter by sentiment
             subreddit: Filter by subreddit
             limit: Maximum records to return
-            skip: Number of records to skip (for pagination)
+            skip: Number of records to skip (offset pagination; prefer `cursor`)
+            cursor: Opaque cursor from a previous page (keyset pagination)
+            view: "full" records or "summary" records for list views
 
         Returns:
-            List of enriched posts
+            List of enriched posts, or summaries for the summary view
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        query = {}
+        query: dict[str, Any] = {}
 
         if sentiment:
             query["sentiment"] = sentiment.value
         if subreddit:
             query["metadata.subreddit"] = subreddit
+        if cursor:
+            # Resume strictly after the last (enriched_at, post_id) seen
+            enriched_at, post_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"enriched_at": {"$lt": enriched_at}},
+                {"enriched_at": enriched_at, "post_id": {"$lt": post_id}},
+            ]
+
+        db_cursor = (
+            self.collection.find(query, VIEW_PROJECTIONS[view])
+            .sort([("enriched_at", -1), ("post_id", -1)])
+            .skip(skip)
+            .limit(limit)
+        )
 
-        cursor = self.collection.find(query).skip(skip).limit(limit).sort("enriched_at", -1)
+        build = summary_from_doc if view == "summary" else post_from_doc
+        return [build(doc) async for doc in db_cursor]
 
-        posts = []
-        async for doc in cursor:
-            doc.pop("_id", None)  # Remove MongoDB _id
-            posts.append(EnrichedPost(**doc))
+    async def get_product_dna_page(
+        self,
+        sentiment: Sentiment | None = None,
+        subreddit: str | None = None,
+        limit: int = 50,
+        skip: int = 0,
+        cursor: str | None = None,
+        view: ProductDNAView = "full",
+    ) -> tuple[list[EnrichedPost] | list[ProductDNASummary], str | None]:
+        """
+        Retrieve one page of Product DNA records and the cursor for the next.
+
+        Args:
+            sentiment: Filter by sentiment
+            subreddit: Filter by subreddit
+            limit: Maximum records to return
+            skip: Number of records to skip
+            cursor: Opaque cursor from a previous page
+            view: "full" records or "summary" records
+
+        Returns:
+            Tuple of (posts, next cursor or None on the last page)
+        """
+        posts = await self.get_product_dna(
+            sentiment=sentiment,
+            subreddit=subreddit,
+            limit=limit,
+            skip=skip,
+            cursor=cursor,
+            view=view,
+        )
+        next_cursor = None
+        if len(posts) == limit:
+            next_cursor = encode_cursor(posts[-1].enriched_at, posts[-1].post_id)
+        return posts, next_cursor
+
+    async def iter_product_dna(
+        self,
+        sentiment: Sentiment | None = None,
+        subreddit: str | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream every matching stored document, newest first.
+
+        Documents are yielded straight from the cursor as MongoDB returns
+        each batch, so memory use does not grow with the result size.
+
+        Args:
+            sentiment: Filter by sentiment
+            subreddit: Filter by subreddit
+            batch_size: Documents fetched per round trip (defaults to EXPORT_BATCH_SIZE)
+
+        Yields:
+            Raw documents without `_id`
+        """
+        query: dict[str, Any] = {}
+        if sentiment:
+            query["sentiment"] = sentiment.value
+        if subreddit:
+            query["metadata.subreddit"] = subreddit
 
-        return posts
+        db_cursor = (
+            self.collection.find(query, VIEW_PROJECTIONS["full"])
+            .sort([("enriched_at", -1), ("post_id", -1)])
+            .batch_size(batch_size or settings.EXPORT_BATCH_SIZE)
+        )
+        async for doc in db_cursor:
+            yield doc
 
     async def get_stats(self) -> ProductDNAStats:
-        """Get statistics about the Product DNA collection."""
-        total = await self.collection.count_documents({})
-
-        # Aggregate by sentiment
-        sentiment_pipeline = [{"$group": {"_id": "$sentiment", "count": {"$sum": 1}}}]
-        sentiment_cursor = self.collection.aggregate(sentiment_pipeline)
-        by_sentiment = {}
-        async for doc in sentiment_cursor:
-            by_sentiment[doc["_id"]] = doc["count"]
-
-        # Aggregate by subreddit
-        subreddit_pipeline = [{"$group": {"_id": "$metadata.subreddit", "count": {"$sum": 1}}}]
-        subreddit_cursor = self.collection.aggregate(subreddit_pipeline)
-        by_subreddit = {}
-        async for doc in subreddit_cursor:
-            by_subreddit[doc["_id"]] = doc["count"]
-
-        # Get last collection time
-        last_doc = await self.collection.find_one({}, sort=[("enriched_at", -1)])
-        last_collection = last_doc.get("enriched_at") if last_doc else None
+        """
+        Get statistics about the Product DNA collection.
+
+        Computed with a single `$facet` aggregation and cached in-process for
+        STATS_CACHE_SECONDS, or until the next write through `_store_posts`.
+        Concurrent callers share one computation.
+        """
+        async with self._stats_lock:
+            if self._stats_cache is not None:
+                computed_at, stats = self._stats_cache
+                if time.monotonic() - computed_at < settings.STATS_CACHE_SECONDS:
+                    return stats
+
+            stats = await self._compute_stats()
+            self._stats_cache = (time.monotonic(), stats)
+            return stats
+
+    def invalidate_stats(self) -> None:
+        """Drop cached statistics so the next request recomputes them."""
+        self._stats_cache = None
+
+    async def _compute_stats(self) -> ProductDNAStats:
+        """Compute all statistics in one pass over the collection."""
+        pipeline = [
+            {
+                "$facet": {
+                    "total": [{"$count": "count"}],
+                    "by_sentiment": [{"$group": {"_id": "$sentiment", "count": {"$sum": 1}}}],
+                    "by_subreddit": [
+                        {"$group": {"_id": "$metadata.subreddit", "count": {"$sum": 1}}}
+                    ],
+                    "last_collection": [
+                        {"$group": {"_id": None, "enriched_at": {"$max": "$enriched_at"}}}
+                    ],
+                }
+            }
+        ]
+
+        facets = {}
+        async for doc in self.collection.aggregate(pipeline):
+            facets = doc
+
+        total = facets.get("total") or [{"count": 0}]
+        last = facets.get("last_collection") or [{"enriched_at": None}]
 
         return ProductDNAStats(
-            total_posts=total,
-            by_sentiment=by_sentiment,
-            by_subreddit=by_subreddit,
-            last_collection=last_collection,
+            total_posts=total[0]["count"],
+            by_sentiment={doc["_id"]: doc["count"] for doc in facets.get("by_sentiment", [])},
+            by_subreddit={doc["_id"]: doc["count"] for doc in facets.get("by_subreddit", [])},
+            last_collection=last[0]["enriched_at"],
         )
 
-    async def ensure_indexes(self) -> None:
-        """Create MongoDB indexes for efficient queries."""
-        await self.collection.create_index("post_id", unique=True)
-        await self.collection.create_index("sentiment")
-        await self.collection.create_index("metadata.subreddit")
-        await self.collection.create_index("enriched_at")
-        logger.info("MongoDB indexes created for product_dna collection")
+    async def ensure_indexes(self) -> list[str]:
+        """Create the MongoDB indexes declared for the product_dna collection."""
+        return await ensure_collection_indexes(self.collection, self.COLLECTION_NAME)
+
+    async def get_index_usage(self) -> list[dict[str, Any]]:
+        """Report `$indexStats` usage counters for the product_dna indexes."""
+        return await index_usage(self.collection)
+
+
+async def _emit(on_event: ProgressCallback | None, event: str, data: dict[str, Any]) -> None:
+    """Deliver a progress event; callback failures never break the pipeline."""
+    if on_event is None:
+        return
+    try:
+        await on_event(event, data)
+    except Exception as e:
+        logger.warning(f"Progress callback failed for '{event}' event: {e}")
+
+
+def encode_cursor(enriched_at: datetime, post_id: str) -> str:
+    """Encode a keyset pagination position as an opaque URL-safe token."""
+    payload = json.dumps({"e": enriched_at.isoformat(), "p": post_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a token from encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["e"]), str(payload["p"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def post_from_doc(doc: dict[str, Any]) -> EnrichedPost:
+    """Build an EnrichedPost from a trusted stored document without validation."""
+    return EnrichedPost.model_construct(
+        **{
+            **doc,
+            "sentiment": Sentiment(doc["sentiment"]),
+            "metadata": PostMetadata.model_construct(**doc["metadata"]),
+        }
+    )
+
+
+def summary_from_doc(doc: dict[str, Any]) -> ProductDNASummary:
+    """Build a ProductDNASummary from a summary-projected document without validation."""
+    metadata = doc.get("metadata", {})
+    return ProductDNASummary.model_construct(
+        post_id=doc["post_id"],
+        title=doc["title"],
+        sentiment=Sentiment(doc["sentiment"]),
+        confidence=doc.get("confidence"),
+        summary=doc["summary"],
+        subreddit=metadata.get("subreddit", ""),
+        url=metadata.get("url", ""),
+        enriched_at=doc["enriched_at"],
+    )
+
+
+def content_hash(title: str, body: str) -> str:
+    """Hash of the post content that enrichment depends on."""
+    return hashlib.sha256(f"{title}\0{body}".encode()).hexdigest()
 
 
 # Singleton instance
@@ -0,0 +1,256 @@
+"""Product DNA rollups - pre-aggregated sentiment counts per time bucket."""
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, Literal
+
+from loguru import logger
+from pymongo import UpdateOne
+
+from app.config import settings
+from app.db.indexes import ensure_collection_indexes
+from app.db.mongodb import mongodb
+from app.models.reddit import EnrichedPost, Sentiment, TrendPoint
+
+Granularity = Literal["hour", "day"]
+
+GRANULARITIES: tuple[Granularity, ...] = ("hour", "day")
+
+# (granularity, bucket, subreddit, keyword); keyword None counts every post once
+RollupKey = tuple[str, datetime, str, str | None]
+
+
+class RollupService:
+    """
+    Maintains the product_dna_rollups collection.
+
+    Each rollup document counts posts per sentiment for one
+    (granularity, bucket, subreddit, keyword) combination, bucketed by the
+    post's `created_utc`. A post is counted under every keyword it was
+    collected for and once more under `keyword=None`, so totals across
+    keywords are never double counted.
+
+    Counts are incremented when a post is first stored. Posts re-enriched
+    later (refreshed because their Reddit content changed, or repaired
+    after a fallback) are moved to their new sentiment.
+    """
+
+    COLLECTION_NAME = "product_dna_rollups"
+    REBUILD_COLLECTION_NAME = "product_dna_rollups_rebuild"
+
+    @property
+    def collection(self):
+        """Get the product_dna_rollups MongoDB collection."""
+        return mongodb.get_collection(self.COLLECTION_NAME)
+
+    async def record(self, posts: Iterable[EnrichedPost]) -> int:
+        """
+        Increment rollups for newly stored posts.
+
+        Args:
+            posts: Posts that were inserted (not updated) in product_dna
+
+        Returns:
+            Number of rollup documents touched
+        """
+        increments: dict[RollupKey, Counter] = {}
+        for post in posts:
+            _accumulate(
+                increments,
+                subreddit=post.metadata.subreddit,
+                created_utc=post.metadata.created_utc,
+                keywords=post.keywords,
+                deltas={"total": 1, post.sentiment.value: 1},
+            )
+        return await self._flush(increments)
+
+    async def reclassify(self, changes: Iterable[tuple[dict[str, Any], str]]) -> int:
+        """
+        Move re-enriched posts from their stored sentiment to a new one.
+
+        Args:
+            changes: Pairs of (stored document before the update, new sentiment);
+                documents need sentiment, keywords and metadata.subreddit/created_utc
+
+        Returns:
+            Number of rollup documents touched
+        """
+        increments: dict[RollupKey, Counter] = {}
+        for doc, sentiment in changes:
+            metadata = doc.get("metadata", {})
+            if doc.get("sentiment") == sentiment or not metadata.get("created_utc"):
+                continue
+            _accumulate(
+                increments,
+                subreddit=metadata.get("subreddit", ""),
+                created_utc=metadata["created_utc"],
+                keywords=doc.get("keywords", []),
+                deltas={doc["sentiment"]: -1, sentiment: 1},
+            )
+        return await self._flush(increments)
+
+    async def rebuild(self, source, chunk_size: int | None = None) -> int:
+        """
+        Recompute every rollup from the raw product_dna collection.
+
+        Reads the source in chunks through a projected cursor, so memory is
+        bounded by the number of distinct buckets in one chunk. Rollups are
+        built in a separate collection that replaces the live one only when
+        complete, so trends stay readable throughout. Rollup updates from
+        writes that land while a rebuild runs are lost on the swap; run it
+        while collection is paused.
+
+        Args:
+            source: Motor collection holding the raw Product DNA documents
+            chunk_size: Documents aggregated per rollup flush
+
+        Returns:
+            Number of posts rolled up
+        """
+        chunk_size = chunk_size or settings.ROLLUP_REBUILD_CHUNK_SIZE
+        target = mongodb.get_collection(self.REBUILD_COLLECTION_NAME)
+        # Clear leftovers of an interrupted rebuild; indexes move with the rename
+        await target.delete_many({})
+        await ensure_collection_indexes(target, self.COLLECTION_NAME)
+
+        processed = 0
+        increments: dict[RollupKey, Counter] = {}
+        projection = {
+            "_id": 0,
+            "sentiment": 1,
+            "keywords": 1,
+            "metadata.subreddit": 1,
+            "metadata.created_utc": 1,
+        }
+
+        async for doc in source.find({}, projection).batch_size(chunk_size):
+            metadata = doc.get("metadata", {})
+            if not metadata.get("created_utc") or not doc.get("sentiment"):
+                continue
+
+            _accumulate(
+                increments,
+                subreddit=metadata.get("subreddit", ""),
+                created_utc=metadata["created_utc"],
+                keywords=doc.get("keywords", []),
+                deltas={"total": 1, doc["sentiment"]: 1},
+            )
+            processed += 1
+            if processed % chunk_size == 0:
+                await self._flush(increments, target)
+                increments = {}
+                logger.info(f"Rolled up {processed} posts")
+
+        await self._flush(increments, target)
+        await target.rename(self.COLLECTION_NAME, dropTarget=True)
+        logger.info(f"Rollup rebuild complete: {processed} posts")
+        return processed
+
+    async def get_trends(
+        self,
+        granularity: Granularity = "day",
+        subreddit: str | None = None,
+        keyword: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[TrendPoint]:
+        """
+        Read sentiment counts over time from the rollups only.
+
+        Args:
+            granularity: Bucket size
+            subreddit: Restrict to one subreddit (default: all subreddits)
+            keyword: Restrict to posts collected for one keyword
+            start: Earliest bucket (inclusive)
+            end: Latest bucket (exclusive)
+
+        Returns:
+            One point per bucket, oldest first
+        """
+        match: dict[str, Any] = {"granularity": granularity, "keyword": keyword}
+        if subreddit:
+            match["subreddit"] = subreddit
+        if start or end:
+            match["bucket"] = {}
+            if start:
+                match["bucket"]["$gte"] = start
+            if end:
+                match["bucket"]["$lt"] = end
+
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": "$bucket",
+                    "total": {"$sum": "$total"},
+                    **{s.value: {"$sum": f"${s.value}"} for s in Sentiment},
+                }
+            },
+            {"$sort": {"_id": 1}},
+        ]
+
+        points = []
+        async for doc in self.collection.aggregate(pipeline):
+            points.append(
+                TrendPoint(
+                    bucket=doc["_id"],
+                    total=doc["total"],
+                    by_sentiment={s.value: doc.get(s.value, 0) for s in Sentiment},
+                )
+            )
+        return points
+
+    async def _flush(self, increments: dict[RollupKey, Counter], collection=None) -> int:
+        """Apply accumulated increments as one unordered bulk of $inc upserts."""
+        if not increments:
+            return 0
+        collection = collection if collection is not None else self.collection
+
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {
+                    "granularity": granularity,
+                    "bucket": bucket,
+                    "subreddit": subreddit,
+                    "keyword": keyword,
+                },
+                {"$inc": dict(counts), "$set": {"updated_at": now}},
+                upsert=True,
+            )
+            for (granularity, bucket, subreddit, keyword), counts in increments.items()
+        ]
+
+        chunk_size = settings.MONGO_BULK_CHUNK_SIZE
+        for start in range(0, len(operations), chunk_size):
+            await collection.bulk_write(operations[start : start + chunk_size], ordered=False)
+        return len(operations)
+
+
+def _accumulate(
+    increments: dict[RollupKey, Counter],
+    subreddit: str,
+    created_utc: datetime,
+    keywords: list[str],
+    deltas: dict[str, int],
+) -> None:
+    """Add one post's counter deltas to every bucket it falls in."""
+    for granularity in GRANULARITIES:
+        bucket = bucket_start(created_utc, granularity)
+        for keyword in [None, *dict.fromkeys(keywords)]:
+            increments.setdefault((granularity, bucket, subreddit, keyword), Counter()).update(
+                deltas
+            )
+
+
+def bucket_start(moment: datetime, granularity: Granularity) -> datetime:
+    """Truncate a timestamp to the start of its hour or day bucket."""
+    moment = moment.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        moment = moment.replace(hour=0)
+    return moment
+
+
+# Singleton instance
+rollup_service = RollupService()
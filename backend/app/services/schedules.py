@@ -0,0 +1,287 @@
+"""Scheduled collections - recurring Product DNA runs dispatched as jobs."""
+
+import asyncio
+import contextlib
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+from loguru import logger
+from pydantic import ValidationError
+from pymongo import ReturnDocument
+
+from app.config import settings
+from app.db.mongodb import mongodb
+from app.models.jobs import CollectionJob, JobStatus
+from app.models.schedules import CollectionSchedule, ScheduleCreate, ScheduleUpdate
+from app.services.jobs import JobService, job_service
+
+# Jobs that still count as the schedule's previous run being in progress
+ACTIVE_JOB_STATUSES = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+
+
+class ScheduleService:
+    """
+    Stores collection schedules and dispatches them when due.
+
+    Every replica runs a scheduler loop, but a schedule is dispatched by
+    one replica only: the loop claims a due schedule with an atomic
+    find-and-update that takes a short lock, queues a collection job
+    tagged with the schedule ID, moves `next_run_at` forward and releases
+    the lock. Locks left by a crashed replica expire after
+    SCHEDULE_LOCK_SECONDS. The job itself runs on the job workers, so
+    schedules get the same leases, retries and progress tracking as
+    `POST /jobs`, and a schedule's run history is its list of jobs.
+
+    Runs are spread by a random jitter so schedules with the same interval
+    do not all hit Reddit and the LLM at once, and a run is skipped while
+    the schedule's previous job is still queued or running.
+    """
+
+    COLLECTION_NAME = "collection_schedules"
+
+    def __init__(self, jobs: JobService | None = None):
+        """
+        Initialize the schedule service.
+
+        Args:
+            jobs: Job service that runs dispatched collections
+        """
+        self.jobs = jobs or job_service
+        self.instance_id = uuid.uuid4().hex
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+
+    @property
+    def collection(self):
+        """Get the collection_schedules MongoDB collection."""
+        return mongodb.get_collection(self.COLLECTION_NAME)
+
+    async def create(self, data: ScheduleCreate) -> CollectionSchedule:
+        """
+        Store a new schedule; its first run is due within one jitter window.
+
+        Args:
+            data: Schedule definition
+
+        Returns:
+            The stored schedule
+        """
+        now = datetime.utcnow()
+        schedule = CollectionSchedule(
+            **data.model_dump(),
+            schedule_id=uuid.uuid4().hex,
+            next_run_at=now + timedelta(seconds=random.uniform(0, _jitter(data))),
+        )
+        await self.collection.insert_one(
+            {**schedule.model_dump(), "locked_by": None, "lock_expires_at": None}
+        )
+        self._wakeup.set()
+
+        logger.info(f"Created schedule {schedule.schedule_id}: {schedule.name}")
+        return schedule
+
+    async def get(self, schedule_id: str) -> CollectionSchedule | None:
+        """
+        Get a schedule by ID.
+
+        Args:
+            schedule_id: Schedule identifier
+
+        Returns:
+            The schedule, or None if it does not exist
+        """
+        doc = await self.collection.find_one({"schedule_id": schedule_id}, _PROJECTION)
+        return CollectionSchedule(**doc) if doc else None
+
+    async def list_schedules(self) -> list[CollectionSchedule]:
+        """All schedules, oldest first."""
+        cursor = self.collection.find({}, _PROJECTION).sort("created_at", 1)
+        return [CollectionSchedule(**doc) async for doc in cursor]
+
+    async def update(self, schedule_id: str, data: ScheduleUpdate) -> CollectionSchedule | None:
+        """
+        Change a schedule's definition.
+
+        A new interval or jitter takes effect from the next run onwards.
+
+        Args:
+            schedule_id: Schedule identifier
+            data: Fields to change
+
+        Returns:
+            The updated schedule, or None if it does not exist
+        """
+        changes = data.model_dump(exclude_unset=True)
+        if not changes:
+            return await self.get(schedule_id)
+
+        doc = await self.collection.find_one_and_update(
+            {"schedule_id": schedule_id},
+            {"$set": changes},
+            projection=_PROJECTION,
+            return_document=ReturnDocument.AFTER,
+        )
+        self._wakeup.set()
+        return CollectionSchedule(**doc) if doc else None
+
+    async def delete(self, schedule_id: str) -> bool:
+        """
+        Delete a schedule; jobs it already queued are kept.
+
+        Returns:
+            Whether a schedule was deleted
+        """
+        result = await self.collection.delete_one({"schedule_id": schedule_id})
+        return result.deleted_count > 0
+
+    async def trigger(self, schedule_id: str) -> CollectionSchedule | None:
+        """
+        Make a schedule due now; a scheduler dispatches it on its next tick.
+
+        Returns:
+            The updated schedule, or None if it does not exist
+        """
+        doc = await self.collection.find_one_and_update(
+            {"schedule_id": schedule_id},
+            {"$set": {"next_run_at": datetime.utcnow()}},
+            projection=_PROJECTION,
+            return_document=ReturnDocument.AFTER,
+        )
+        self._wakeup.set()
+        return CollectionSchedule(**doc) if doc else None
+
+    async def history(self, schedule_id: str, limit: int = 20) -> list[CollectionJob]:
+        """
+        Jobs a schedule has queued, newest first.
+
+        Args:
+            schedule_id: Schedule identifier
+            limit: Maximum runs to return
+
+        Returns:
+            The schedule's most recent jobs with their progress and results
+        """
+        return await self.jobs.list_jobs(schedule_id, limit=limit)
+
+    async def start(self) -> None:
+        """Start the scheduler loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._scheduler_loop(), name="collection-scheduler")
+            logger.info(f"Started collection scheduler {self.instance_id}")
+
+    async def stop(self) -> None:
+        """Stop the scheduler loop."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _scheduler_loop(self) -> None:
+        """Dispatch due schedules until cancelled."""
+        while True:
+            try:
+                while await self.dispatch_due() is not None:
+                    pass
+            except Exception as e:
+                logger.error(f"Failed to dispatch collection schedules: {e}")
+
+            self._wakeup.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.SCHEDULER_POLL_SECONDS)
+
+    async def dispatch_due(self) -> CollectionSchedule | None:
+        """
+        Claim one due schedule, queue its job and schedule its next run.
+
+        Returns:
+            The dispatched schedule, or None if nothing was due
+        """
+        now = datetime.utcnow()
+        doc = await self.collection.find_one_and_update(
+            {
+                "enabled": True,
+                "next_run_at": {"$lte": now},
+                "$or": [{"lock_expires_at": None}, {"lock_expires_at": {"$lt": now}}],
+            },
+            {
+                "$set": {
+                    "locked_by": self.instance_id,
+                    "lock_expires_at": now + timedelta(seconds=settings.SCHEDULE_LOCK_SECONDS),
+                }
+            },
+            sort=[("next_run_at", 1)],
+            projection=_PROJECTION,
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc is None:
+            return None
+
+        try:
+            schedule = CollectionSchedule(**doc)
+        except ValidationError as e:
+            # Disable rather than re-claim an unusable definition on every tick
+            logger.error(f"Disabling invalid schedule {doc.get('schedule_id')}: {e}")
+            await self._release(doc.get("schedule_id"), {"$set": {"enabled": False}})
+            return None
+
+        update: dict[str, Any] = {"next_run_at": _next_run(schedule, now)}
+        try:
+            if await self._previous_run_active(schedule):
+                logger.warning(
+                    f"Skipping schedule {schedule.schedule_id} ({schedule.name}): "
+                    f"job {schedule.last_job_id} is still active"
+                )
+                counter = "skipped_runs"
+            else:
+                job = await self.jobs.enqueue(schedule.request, schedule_id=schedule.schedule_id)
+                logger.info(
+                    f"Dispatched schedule {schedule.schedule_id} ({schedule.name}) "
+                    f"as job {job.job_id}"
+                )
+                update |= {"last_run_at": now, "last_job_id": job.job_id}
+                counter = "runs"
+        except Exception:
+            # Leave the schedule due so the next tick retries it
+            await self._release(schedule.schedule_id, {})
+            raise
+
+        await self._release(schedule.schedule_id, {"$set": update, "$inc": {counter: 1}})
+        return schedule.model_copy(update=update)
+
+    async def _release(self, schedule_id: str, update: dict[str, Any]) -> None:
+        """Apply a dispatch's outcome and release this replica's lock on the schedule."""
+        release = {"locked_by": None, "lock_expires_at": None}
+        await self.collection.update_one(
+            {"schedule_id": schedule_id, "locked_by": self.instance_id},
+            {**update, "$set": {**update.get("$set", {}), **release}},
+        )
+
+    async def _previous_run_active(self, schedule: CollectionSchedule) -> bool:
+        """Whether the job from the schedule's last run is still queued or running."""
+        if schedule.last_job_id is None:
+            return False
+        job = await self.jobs.get_job(schedule.last_job_id)
+        return job is not None and job.status.value in ACTIVE_JOB_STATUSES
+
+
+# Lock fields are internal to the scheduler
+_PROJECTION = {"_id": 0, "locked_by": 0, "lock_expires_at": 0}
+
+
+def _jitter(schedule: ScheduleCreate) -> float:
+    """Maximum random spread of a schedule's runs, in seconds."""
+    if schedule.jitter_seconds is not None:
+        return min(schedule.jitter_seconds, schedule.interval_seconds / 2)
+    return schedule.interval_seconds * settings.SCHEDULE_JITTER_FRACTION
+
+
+def _next_run(schedule: CollectionSchedule, now: datetime) -> datetime:
+    """When a schedule dispatched at `now` is next due: one interval later, +/- jitter."""
+    jitter = _jitter(schedule)
+    return now + timedelta(seconds=schedule.interval_seconds + random.uniform(-jitter, jitter))
+
+
+# Singleton instance
+schedule_service = ScheduleService()
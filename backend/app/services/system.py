@@ -5,6 +5,9 @@ import time
 from typing import Any
 
 from app.config import settings
+from app.integrations.circuit_breaker import reddit_breaker
+from app.integrations.llm import llm_service
+from app.integrations.rate_limiter import reddit_rate_limiter
 
 # Track application start time
 _start_time = time.time()
@@ -49,6 +52,19 @@ class SystemService:
                 "message": "OPENAI_API_KEY not set",
             }
 
+        # LLM result cache
+        if llm_service.cache is not None:
+            dependencies["llm_cache"] = {"status": "enabled", **llm_service.cache.stats()}
+        else:
+            dependencies["llm_cache"] = {"status": "disabled"}
+
+        # Reddit rate limiter and circuit breaker
+        dependencies["rate_limits"] = {"reddit": reddit_rate_limiter.stats()}
+        dependencies["circuit_breakers"] = {"reddit": reddit_breaker.stats()}
+
+        # LLM providers, each with its own rate limiter, circuit breaker and latencies
+        dependencies["llm_providers"] = llm_service.router.stats()
+
         return dependencies
 
     @classmethod
@@ -0,0 +1,195 @@
+"""Collection watermarks - how far incremental collection has read per query."""
+
+import heapq
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from app.config import settings
+from app.db.mongodb import mongodb
+from app.integrations.reddit import DEFAULT_SUBREDDITS
+from app.models.reddit import CollectionWatermark
+
+
+class WatermarkTracker:
+    """
+    Follows one incremental run against the query's previous watermark.
+
+    Runs page Reddit with `sort="new"` and stop at `cutoff`, which sits
+    WATERMARK_OVERLAP_SECONDS behind the previous watermark so posts that
+    reach the search index late are still picked up. Posts in that overlap
+    that an earlier run already saw are dropped via `take`.
+
+    A run that stops at its limit before reaching the cutoff is incomplete:
+    it keeps the previous watermark time and only adds the posts it
+    collected to the seen IDs, so the next run skips those and keeps paging
+    down to the same cutoff instead of losing the posts in between.
+    """
+
+    def __init__(self, previous: CollectionWatermark | None, max_ids: int | None = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            previous: Watermark left by the last run (None on the first run)
+            max_ids: Newest post IDs to remember (defaults to WATERMARK_SEEN_IDS)
+        """
+        self.previous = previous
+        self.max_ids = settings.WATERMARK_SEEN_IDS if max_ids is None else max_ids
+        self._seen = set(previous.seen_ids) if previous else set()
+        self._newest: datetime | None = None
+        # Min-heap of the newest (created_utc, post_id) pairs collected
+        self._new: list[tuple[datetime, str]] = []
+        self.complete = True
+
+    @property
+    def cutoff(self) -> datetime | None:
+        """Oldest creation time this run needs to read back to."""
+        if self.previous is None:
+            return None
+        return self.previous.newest_created_utc - timedelta(
+            seconds=settings.WATERMARK_OVERLAP_SECONDS
+        )
+
+    def is_seen(self, post_id: str) -> bool:
+        """Whether an earlier run already collected this post."""
+        return post_id in self._seen
+
+    def search_limit(self, limit: int) -> int:
+        """Posts to request from Reddit so that seen posts do not use up `limit`."""
+        return limit + (len(self.previous.seen_ids) if self.previous else 0)
+
+    def take(self, page: list[dict], room: int) -> tuple[list[dict], int]:
+        """
+        Filter a newest-first page down to posts no earlier run saw.
+
+        Args:
+            page: Posts returned by the search
+            room: Unseen posts the run may still collect
+
+        Returns:
+            Tuple of (unseen posts to collect, number of seen posts dropped);
+            the run is marked incomplete once `room` is used up
+        """
+        seen = [post for post in page if self.is_seen(post["post_id"])]
+        unseen = [post for post in page if not self.is_seen(post["post_id"])]
+        if len(unseen) >= room:
+            unseen = unseen[:room]
+            self.complete = False
+        for post in seen + unseen:
+            self.observe(post)
+        return unseen, len(seen)
+
+    def observe(self, post: dict) -> None:
+        """Record a post collected by this run."""
+        entry = (post["created_utc"], post["post_id"])
+        if self._newest is None or entry[0] > self._newest:
+            self._newest = entry[0]
+        if len(self._new) < self.max_ids:
+            heapq.heappush(self._new, entry)
+        elif self.max_ids:
+            heapq.heappushpop(self._new, entry)
+
+    def advanced(self) -> tuple[datetime, list[str]] | None:
+        """
+        The watermark after this run.
+
+        Returns:
+            Tuple of (newest creation time, newest IDs first), or None if the
+            run saw nothing new
+        """
+        if self._newest is None:
+            return None
+        newest = self._newest
+        ids = list(dict.fromkeys(post_id for _, post_id in sorted(self._new, reverse=True)))
+        if self.previous is not None:
+            if self.complete:
+                newest = max(newest, self.previous.newest_created_utc)
+            else:
+                # Posts between this run's oldest and the cutoff are still unread
+                newest = self.previous.newest_created_utc
+            collected = set(ids)
+            ids += [post_id for post_id in self.previous.seen_ids if post_id not in collected]
+        return newest, ids[: self.max_ids]
+
+
+class WatermarkService:
+    """Stores one watermark per (keywords, subreddits) query in collection_watermarks."""
+
+    COLLECTION_NAME = "collection_watermarks"
+
+    @property
+    def collection(self):
+        """Get the collection_watermarks MongoDB collection."""
+        return mongodb.get_collection(self.COLLECTION_NAME)
+
+    async def get(
+        self, keywords: list[str], subreddits: list[str] | None
+    ) -> CollectionWatermark | None:
+        """
+        Load the watermark for a query.
+
+        Args:
+            keywords: Query keywords
+            subreddits: Query subreddits (None means the search defaults)
+
+        Returns:
+            The stored watermark, or None if the query never ran incrementally
+        """
+        doc = await self.collection.find_one(
+            {"query_key": query_key(keywords, subreddits)}, {"_id": 0}
+        )
+        return CollectionWatermark(**doc) if doc else None
+
+    async def save(
+        self, keywords: list[str], subreddits: list[str] | None, tracker: WatermarkTracker
+    ) -> CollectionWatermark | None:
+        """
+        Advance a query's watermark to what a finished run has seen.
+
+        Args:
+            keywords: Query keywords
+            subreddits: Query subreddits (None means the search defaults)
+            tracker: Tracker that followed the run
+
+        Returns:
+            The new watermark, or None if the run saw no new posts
+        """
+        advanced = tracker.advanced()
+        if advanced is None:
+            return None
+        newest, seen_ids = advanced
+        watermark = CollectionWatermark(
+            query_key=query_key(keywords, subreddits),
+            keywords=sorted(keywords),
+            subreddits=sorted(subreddits or DEFAULT_SUBREDDITS),
+            newest_created_utc=newest,
+            seen_ids=seen_ids,
+            updated_at=datetime.utcnow(),
+        )
+        await self.collection.update_one(
+            {"query_key": watermark.query_key}, {"$set": watermark.model_dump()}, upsert=True
+        )
+        logger.info(f"Watermark for {watermark.query_key} advanced to {newest.isoformat()}")
+        return watermark
+
+    async def reset(self, keywords: list[str], subreddits: list[str] | None) -> bool:
+        """
+        Forget a query's watermark so its next incremental run starts over.
+
+        Returns:
+            Whether a watermark was deleted
+        """
+        result = await self.collection.delete_one({"query_key": query_key(keywords, subreddits)})
+        return result.deleted_count > 0
+
+
+def query_key(keywords: list[str], subreddits: list[str] | None) -> str:
+    """Order- and case-insensitive identity of a (keywords, subreddits) query."""
+    words = sorted({keyword.strip().lower() for keyword in keywords})
+    subs = sorted({sub.strip().lower() for sub in subreddits or DEFAULT_SUBREDDITS})
+    return f"{'|'.join(words)}@{'+'.join(subs)}"
+
+
+# Singleton instance
+watermark_service = WatermarkService()
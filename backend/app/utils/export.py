@@ -0,0 +1,104 @@
+"""Streaming encoders for bulk Product DNA exports."""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+# Flattened CSV columns and the document path each one reads
+CSV_COLUMNS: dict[str, str] = {
+    "post_id": "post_id",
+    "title": "title",
+    "body": "body",
+    "sentiment": "sentiment",
+    "confidence": "confidence",
+    "summary": "summary",
+    "enrichment_status": "enrichment_status",
+    "subreddit": "metadata.subreddit",
+    "url": "metadata.url",
+    "author": "metadata.author",
+    "score": "metadata.score",
+    "num_comments": "metadata.num_comments",
+    "upvote_ratio": "metadata.upvote_ratio",
+    "created_utc": "metadata.created_utc",
+    "keywords": "keywords",
+    "enriched_at": "enriched_at",
+}
+
+# Encoded output is coalesced into chunks of about this size before sending
+CHUNK_BYTES = 64 * 1024
+
+
+async def ndjson_lines(docs: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode documents as newline-delimited JSON."""
+    async for doc in docs:
+        yield (json.dumps(doc, default=_json_default) + "\n").encode()
+
+
+async def csv_rows(docs: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode documents as CSV with a header row, flattening nested fields."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def row(values) -> bytes:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue().encode()
+
+    yield row(CSV_COLUMNS)
+    async for doc in docs:
+        yield row(_csv_value(_lookup(doc, path)) for path in CSV_COLUMNS.values())
+
+
+async def coalesce(chunks: AsyncIterator[bytes], size: int = CHUNK_BYTES) -> AsyncIterator[bytes]:
+    """Merge small chunks so each response write carries about `size` bytes."""
+    pending = bytearray()
+    async for chunk in chunks:
+        pending += chunk
+        if len(pending) >= size:
+            yield bytes(pending)
+            pending.clear()
+    if pending:
+        yield bytes(pending)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress a byte stream incrementally into a single gzip member."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _lookup(doc: dict[str, Any], path: str) -> Any:
+    """Read a dotted path from a nested document."""
+    value: Any = doc
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    """Render a field as a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return ";".join(str(item) for item in value)
+    return value
+
+
+def _json_default(value: Any) -> str:
+    """Serialize datetimes as ISO 8601 and anything else as a string."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
@@ -0,0 +1,139 @@
+"""Synthetic Reddit corpora in the replay format.
+
+Generates posts shaped like RedditSearchTool._extract_post_data output,
+with per-post fetch times sampled around the live API's page latency, and
+streams them to gzipped JSONL that RedditReplay can serve. Sizes from a few
+posts to millions are written at constant memory.
+
+Usage:
+    python -m benchmarks.corpus --posts 1000000 --output benchmarks/corpora/1m.jsonl.gz
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from app.integrations.reddit_replay import write_records
+from app.utils.logging import logger, setup_logging
+
+CORPORA_DIR = Path(__file__).parent / "corpora"
+
+SUBREDDITS = ("marketing", "socialmedia", "smallbusiness", "startups", "SaaS")
+TOPICS = ("scheduling tool", "analytics dashboard", "engagement rate", "ad spend", "onboarding")
+OPINIONS = ("love", "can't stand", "am evaluating", "keep fighting with", "just switched to")
+
+# A live search page of 25 posts takes roughly 0.5-1s
+FETCH_MS_PER_POST = 30
+
+# Posts are spread over the 30 days before this fixed date so corpora are reproducible
+CORPUS_END = datetime(2025, 1, 1)
+
+
+def synthetic_records(
+    count: int, seed: int = 0, prefix: str = "t3_", comments: int = 0
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield replay records for synthetic posts.
+
+    Args:
+        count: Number of posts
+        seed: Random seed (same seed, same corpus)
+        prefix: Post ID prefix
+        comments: Top comments generated per post
+
+    Yields:
+        Records of the form {"post": {...}, "fetch_ms": float, "comments": [...]}
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        topic = rng.choice(TOPICS)
+        subreddit = rng.choice(SUBREDDITS)
+        post_id = f"{prefix}{i:07d}"
+        created = CORPUS_END - timedelta(minutes=rng.randint(0, 30 * 24 * 60))
+        record: dict[str, Any] = {
+            "post": {
+                "post_id": post_id,
+                "title": f"I {rng.choice(OPINIONS)} our {topic} (#{i})",
+                "body": " ".join(rng.choice(TOPICS) for _ in range(rng.randint(0, 60))),
+                "score": int(rng.paretovariate(1.2)) - 1,
+                "url": f"https://reddit.com/r/{subreddit}/comments/{post_id}/",
+                "external_url": None,
+                "subreddit": subreddit,
+                "author": f"user{rng.randint(1, 100_000)}",
+                "created_utc": created,
+                "num_comments": rng.randint(0, 300),
+                "upvote_ratio": round(rng.uniform(0.5, 1.0), 2),
+                "is_self": True,
+            },
+            "fetch_ms": round(rng.lognormvariate(0, 0.4) * FETCH_MS_PER_POST, 2),
+        }
+        if comments:
+            # Separate generator so adding comments does not change the posts
+            comment_rng = random.Random(f"{seed}:{post_id}")
+            record["comments"] = [
+                {
+                    "comment_id": f"{post_id}_c{j}",
+                    "body": f"Have you tried a different {comment_rng.choice(TOPICS)}?",
+                    "score": comment_rng.randint(0, 500),
+                    "author": f"user{comment_rng.randint(1, 100_000)}",
+                    "created_utc": created + timedelta(minutes=comment_rng.randint(1, 600)),
+                }
+                for j in range(comments)
+            ]
+        yield record
+
+
+def synthetic_posts(count: int, seed: int = 0) -> list[dict]:
+    """Synthetic raw posts held in memory (for small LLM-only runs)."""
+    return [record["post"] for record in synthetic_records(count, seed=seed)]
+
+
+def generate(path: Path, count: int, seed: int = 0, comments: int = 0) -> Path:
+    """
+    Write a synthetic corpus, replacing any existing file.
+
+    Returns:
+        The corpus path
+    """
+    path.unlink(missing_ok=True)
+    started = time.perf_counter()
+    written = write_records(path, synthetic_records(count, seed=seed, comments=comments))
+    logger.info(
+        f"Generated {written} posts in {time.perf_counter() - started:.1f}s "
+        f"({path.stat().st_size / 1e6:.1f} MB): {path}"
+    )
+    return path
+
+
+def cached_corpus(count: int, seed: int = 0) -> Path:
+    """Path of a synthetic corpus for (count, seed), generating it on first use."""
+    path = CORPORA_DIR / f"synthetic-{count}-{seed}.jsonl.gz"
+    if not path.exists():
+        generate(path, count, seed=seed)
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    setup_logging()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.corpus",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--posts", type=int, default=10_000, help="Posts to generate")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--comments", type=int, default=0, help="Top comments per post")
+    parser.add_argument("--output", type=Path, default=None, help="Gzipped JSONL path")
+    args = parser.parse_args(argv)
+
+    output = args.output or CORPORA_DIR / f"synthetic-{args.posts}-{args.seed}.jsonl.gz"
+    generate(output, args.posts, seed=args.seed, comments=args.comments)
+
+
+if __name__ == "__main__":
+    main()
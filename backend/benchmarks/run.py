@@ -0,0 +1,360 @@
+"""Enrichment throughput benchmarks against the local LLM stub.
+
+Drives LLMService (combined and separate enrichment) and, when MongoDB is
+reachable, the full ProductDNAService.collect_and_enrich pipeline over a
+replayed Reddit corpus at several concurrency levels. The corpus is a
+recording (python -m app.cli record-reddit) or a synthetic one from
+benchmarks.corpus, generated and cached on first use. Reports posts/sec,
+p50/p95/p99 per-post latency and LLM calls per post, and writes them to a
+JSON file (benchmarks/results/<APP_VERSION>.json by default) so runs can be
+compared across releases.
+
+The stub runs in-process unless --url points at a running server
+(python -m benchmarks.stub_llm) or any other OpenAI-compatible endpoint.
+
+Usage:
+    python -m benchmarks.run [--posts 500] [--concurrency 1,8,32]
+        [--scenarios combined,separate,pipeline] [--latency-ms 200] [--error-rate 0.02]
+        [--url http://localhost:8001] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import cProfile
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.config import settings
+from app.db.indexes import ensure_indexes
+from app.db.mongodb import mongodb
+from app.integrations.circuit_breaker import CircuitBreaker
+from app.integrations.llm import LLMService
+from app.integrations.llm_router import LLMProvider
+from app.integrations.reddit_replay import RedditReplay, read_records
+from app.integrations.retry import RETRYABLE_ERRORS
+from app.models.reddit import CollectionRequest
+from app.services.product_dna import ProductDNAService
+from app.services.rollups import RollupService
+from app.utils.logging import logger, setup_logging
+from benchmarks.corpus import cached_corpus
+from benchmarks.stub_llm import StubConfig, create_app
+
+SCENARIOS = ("combined", "separate", "pipeline")
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class CallCounter:
+    """Counts LLM HTTP requests and 429 responses through httpx event hooks."""
+
+    def __init__(self):
+        self.requests = 0
+        self.rate_limited = 0
+
+    async def on_request(self, request: httpx.Request) -> None:
+        self.requests += 1
+
+    async def on_response(self, response: httpx.Response) -> None:
+        if response.status_code == 429:
+            self.rate_limited += 1
+
+    def snapshot(self) -> tuple[int, int]:
+        """Current (requests, rate_limited) counts."""
+        return self.requests, self.rate_limited
+
+
+def build_llm(base_url: str, transport: httpx.AsyncBaseTransport | None, counter: CallCounter):
+    """LLMService with one provider pointed at the stub (no cache, default retries)."""
+    client = AsyncOpenAI(
+        api_key="benchmark",
+        base_url=f"{base_url}/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(
+            transport=transport,
+            timeout=60,
+            event_hooks={"request": [counter.on_request], "response": [counter.on_response]},
+        ),
+    )
+    provider = LLMProvider(
+        "stub",
+        base_url=f"{base_url}/v1",
+        api_key="benchmark",
+        model="stub-large",
+        small_model="stub-small",
+        breaker=CircuitBreaker("stub", failure_types=RETRYABLE_ERRORS),
+    )
+    provider._client = client
+    return LLMService(api_key="benchmark", providers=[provider])
+
+
+async def bench_llm(
+    llm: LLMService, posts: list[dict], concurrency: int, combined: bool
+) -> dict[str, Any]:
+    """Run analyze_post over every post with `concurrency` calls in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    fallbacks = 0
+
+    async def one(post: dict) -> None:
+        nonlocal fallbacks
+        async with semaphore:
+            started = time.perf_counter()
+            result = await llm.analyze_post(post["title"], post["body"], combined=combined)
+            latencies.append(time.perf_counter() - started)
+            fallbacks += result.fallback
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(post) for post in posts))
+    return {
+        "seconds": time.perf_counter() - started,
+        "latencies": latencies,
+        "completed": len(posts),
+        "fallbacks": fallbacks,
+    }
+
+
+async def bench_pipeline(
+    llm: LLMService, reddit: RedditReplay, posts: int, concurrency: int
+) -> dict[str, Any]:
+    """Run collect_and_enrich over a replayed corpus into the (emptied) benchmark database."""
+    service = ProductDNAService(reddit=reddit, llm=llm, rollups=RollupService())
+    await service.collection.delete_many({})
+    await service.rollups.collection.delete_many({})
+
+    collected_at: dict[str, float] = {}
+    latencies: list[float] = []
+
+    async def on_event(event: str, data: dict[str, Any]) -> None:
+        if event == "collected":
+            collected_at[data["post_id"]] = time.perf_counter()
+        elif event == "stored":
+            latencies.append(time.perf_counter() - collected_at.pop(data["post_id"]))
+
+    previous = settings.ENRICHMENT_CONCURRENCY
+    settings.ENRICHMENT_CONCURRENCY = concurrency
+    try:
+        started = time.perf_counter()
+        # Constructed without validation: corpus runs go past the API's 10k limit,
+        # and subreddits=None replays every subreddit in the corpus
+        request = CollectionRequest.model_construct(
+            keywords=["benchmark"], subreddits=None, limit=posts, time_filter="all"
+        )
+        response = await service.collect_and_enrich(request, on_event=on_event)
+        seconds = time.perf_counter() - started
+    finally:
+        settings.ENRICHMENT_CONCURRENCY = previous
+
+    fallbacks = await service.collection.count_documents({"enrichment_status": "fallback"})
+    return {
+        "seconds": seconds,
+        "latencies": latencies,
+        "completed": response.posts_stored,
+        "fallbacks": fallbacks,
+        "errors": len(response.errors),
+    }
+
+
+def summarize(
+    scenario: str, concurrency: int, posts: int, run: dict[str, Any], calls: int, limited: int
+) -> dict[str, Any]:
+    """Turn one run's raw timings and call counts into reported metrics."""
+    latencies = run.pop("latencies")
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "posts": posts,
+        **{key: value for key, value in run.items() if key != "seconds"},
+        "seconds": round(run["seconds"], 3),
+        "posts_per_sec": round(run["completed"] / run["seconds"], 2) if run["seconds"] else None,
+        "latency_ms": percentiles_ms(latencies),
+        "llm_calls": calls,
+        "llm_calls_per_post": round(calls / posts, 3) if posts else None,
+        "rate_limited": limited,
+    }
+
+
+def percentiles_ms(samples: list[float]) -> dict[str, float | None]:
+    """p50/p95/p99 of latencies in milliseconds."""
+    if not samples:
+        return {"p50": None, "p95": None, "p99": None}
+    if len(samples) == 1:
+        value = round(samples[0] * 1000, 1)
+        return {"p50": value, "p95": value, "p99": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {f"p{q}": round(cuts[q - 1] * 1000, 1) for q in (50, 95, 99)}
+
+
+async def connect_benchmark_db(db_name: str) -> bool:
+    """Point the app at a dedicated benchmark database; False if MongoDB is unreachable."""
+    settings.MONGODB_DB_NAME = db_name
+    try:
+        await asyncio.wait_for(mongodb.connect(), timeout=5)
+        await ensure_indexes(mongodb.db)
+    except Exception as e:
+        logger.warning(f"MongoDB unavailable, skipping pipeline benchmarks: {e}")
+        await mongodb.disconnect()
+        return False
+    return True
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every requested scenario at every concurrency level."""
+    config = StubConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_spread=args.latency_spread,
+        error_rate=args.error_rate,
+        requests_per_minute=args.stub_rpm,
+        seed=args.seed,
+    )
+    if args.url:
+        base_url, transport, stub = args.url.rstrip("/"), None, {"url": args.url}
+    else:
+        base_url = "http://stub"
+        transport = httpx.ASGITransport(app=create_app(config))
+        stub = config.model_dump()
+
+    counter = CallCounter()
+    llm = build_llm(base_url, transport, counter)
+    corpus = args.corpus or cached_corpus(args.posts, seed=args.seed)
+    reddit = RedditReplay(corpus, speed=args.reddit_speed)
+    posts = [record["post"] for record in itertools.islice(read_records(corpus), args.posts)]
+
+    scenarios = list(args.scenarios)
+    if "pipeline" in scenarios and not await connect_benchmark_db(args.mongo_db):
+        scenarios.remove("pipeline")
+
+    results = []
+    try:
+        for scenario in scenarios:
+            for concurrency in args.concurrency:
+                calls_before, limited_before = counter.snapshot()
+                if scenario == "pipeline":
+                    raw = await bench_pipeline(llm, reddit, len(posts), concurrency)
+                else:
+                    raw = await bench_llm(llm, posts, concurrency, combined=scenario == "combined")
+                calls, limited = counter.snapshot()
+                result = summarize(
+                    scenario,
+                    concurrency,
+                    len(posts),
+                    raw,
+                    calls - calls_before,
+                    limited - limited_before,
+                )
+                logger.info(
+                    f"{scenario} x{concurrency}: {result['posts_per_sec']} posts/s, "
+                    f"p95 {result['latency_ms']['p95']} ms, "
+                    f"{result['llm_calls_per_post']} calls/post"
+                )
+                results.append(result)
+    finally:
+        await mongodb.disconnect()
+
+    return {
+        "benchmark": "enrichment",
+        "app_version": settings.APP_VERSION,
+        "git_commit": _git_commit(),
+        "created_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "stub": stub,
+        "corpus": str(corpus),
+        "reddit_speed": args.reddit_speed,
+        "posts": len(posts),
+        "results": results,
+    }
+
+
+def _git_commit() -> str | None:
+    """Current commit hash, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options for the benchmark run."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--posts", type=int, default=500, help="Posts per run")
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        default=None,
+        help="Recorded or generated corpus (default: synthetic, generated and cached)",
+    )
+    parser.add_argument(
+        "--reddit-speed",
+        type=float,
+        default=0,
+        help="Replay pacing multiplier for the pipeline (1 = recorded API speed, 0 = none)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(v) for v in value.split(",")],
+        default=[1, 8, 32],
+        help="Comma-separated concurrency levels",
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: [v for v in value.split(",") if v in SCENARIOS],
+        default=list(SCENARIOS),
+        help=f"Comma-separated subset of {','.join(SCENARIOS)}",
+    )
+    parser.add_argument("--url", default=None, help="External OpenAI-compatible base URL")
+    parser.add_argument("--latency", default="lognormal", help="Stub latency distribution")
+    parser.add_argument("--latency-ms", type=float, default=200, help="Stub median latency")
+    parser.add_argument("--latency-spread", type=float, default=0.5, help="Stub latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Stub random 429 rate")
+    parser.add_argument("--stub-rpm", type=int, default=0, help="Stub requests-per-minute quota")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for posts and the stub")
+    parser.add_argument(
+        "--mongo-db", default="pulse_benchmark", help="Database emptied and used by pipeline runs"
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Results JSON path")
+    parser.add_argument("--profile", type=Path, default=None, help="Write cProfile stats here")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    setup_logging()
+    args = build_parser().parse_args(argv)
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    report = asyncio.run(run(args))
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        logger.info(f"Wrote profile to {args.profile} (inspect with python -m pstats)")
+
+    output = args.output or RESULTS_DIR / f"{settings.APP_VERSION}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    logger.info(f"Wrote benchmark results to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""Local OpenAI-compatible chat.completions server for benchmarks and tests.
+
+Answers every prompt LLMService sends (sentiment, summary, combined and
+batch enrichment) with deterministic canned outputs derived from the post
+title, after a latency drawn from a configurable distribution. It can inject
+429s, either at random or from a requests-per-minute quota, and keeps token
+accounting available at GET /stats.
+
+Usage:
+    python -m benchmarks.stub_llm --port 8001 --latency lognormal --latency-ms 300
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+import uuid
+from collections import Counter, deque
+from typing import Any, Literal
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+SENTIMENTS = ("positive", "neutral", "negative")
+
+POST_BLOCK = re.compile(r"^\[post_id: (?P<post_id>[^\]]+)\]\nTitle: (?P<title>.*)$", re.MULTILINE)
+TITLE_LINE = re.compile(r"^Title: (?P<title>.*)$", re.MULTILINE)
+
+
+class StubConfig(BaseModel):
+    """Behavior of the stub server."""
+
+    latency: Literal["fixed", "uniform", "lognormal", "exponential"] = Field(
+        default="lognormal", description="Latency distribution per request"
+    )
+    latency_ms: float = Field(default=200, ge=0, description="Median (mean for exponential)")
+    latency_spread: float = Field(
+        default=0.5, ge=0, description="Uniform: +/- fraction of latency_ms; lognormal: sigma"
+    )
+    per_token_ms: float = Field(default=0, ge=0, description="Extra latency per completion token")
+    error_rate: float = Field(default=0, ge=0, le=1, description="Probability of a random 429")
+    requests_per_minute: int = Field(default=0, ge=0, description="Quota enforced with 429s")
+    retry_after_seconds: float = Field(default=1, ge=0, description="Retry-After on injected 429s")
+    seed: int = Field(default=0, description="Seed for latency and error sampling")
+
+
+class StubStats:
+    """Request and token counters."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        self.requests = 0
+        self.completions = 0
+        self.rate_limited = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.by_model: Counter = Counter()
+        self.by_task: Counter = Counter()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Counters as a JSON-serializable dict."""
+        return {
+            "requests": self.requests,
+            "completions": self.completions,
+            "rate_limited": self.rate_limited,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.prompt_tokens + self.completion_tokens,
+            "by_model": dict(self.by_model),
+            "by_task": dict(self.by_task),
+        }
+
+
+def create_app(config: StubConfig | None = None) -> FastAPI:
+    """
+    Build the stub server.
+
+    Args:
+        config: Latency and error injection settings (defaults to StubConfig())
+
+    Returns:
+        FastAPI app serving /v1/chat/completions, /v1/models, /stats and /reset
+    """
+    config = config or StubConfig()
+    rng = random.Random(config.seed)
+    stats = StubStats()
+    window: deque[float] = deque()
+
+    app = FastAPI(title="Pulse LLM stub")
+    app.state.config = config
+    app.state.stats = stats
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        stats.requests += 1
+
+        limited = _quota_exceeded(window, config.requests_per_minute)
+        if limited is None and rng.random() < config.error_rate:
+            limited = config.retry_after_seconds
+        if limited is not None:
+            stats.rate_limited += 1
+            return _rate_limit_response(limited)
+
+        messages = payload.get("messages", [])
+        task, content = respond(messages)
+        prompt_tokens = sum(_tokens(str(m.get("content", ""))) for m in messages)
+        completion_tokens = min(_tokens(content), payload.get("max_tokens") or 4096)
+
+        await asyncio.sleep(
+            _sample_latency(rng, config) + completion_tokens * config.per_token_ms / 1000
+        )
+
+        model = payload.get("model", "stub")
+        stats.completions += 1
+        stats.prompt_tokens += prompt_tokens
+        stats.completion_tokens += completion_tokens
+        stats.by_model[model] += 1
+        stats.by_task[task] += 1
+
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "stub", "object": "model"}]}
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats.as_dict()
+
+    @app.post("/reset")
+    async def reset():
+        stats.reset()
+        window.clear()
+        return stats.as_dict()
+
+    return app
+
+
+def respond(messages: list[dict]) -> tuple[str, str]:
+    """
+    Deterministic answer for one of LLMService's prompts.
+
+    Outputs depend only on the post title, so every prompt variant (which
+    truncate the body differently) agrees on a post's sentiment and summary.
+
+    Returns:
+        Tuple of (task name, completion content)
+    """
+    prompt = str(messages[-1].get("content", "")) if messages else ""
+
+    if prompt.startswith("Analyze each of the following"):
+        results = [
+            {"post_id": m["post_id"], **canned_enrichment(m["title"])}
+            for m in POST_BLOCK.finditer(prompt)
+        ]
+        return "batch", json.dumps({"results": results})
+
+    title_match = TITLE_LINE.search(prompt)
+    enrichment = canned_enrichment(title_match["title"] if title_match else "")
+
+    if prompt.startswith("Analyze the following"):
+        return "enrichment", json.dumps(enrichment)
+    if prompt.startswith("Summarize"):
+        return "summary", enrichment["summary"]
+    return "sentiment", enrichment["sentiment"]
+
+
+def canned_enrichment(title: str) -> dict[str, Any]:
+    """Sentiment, confidence and summary derived from a hash of the title."""
+    digest = int(hashlib.sha256(title.encode()).hexdigest(), 16)
+    words = title.split()[:12] or ["an", "untitled", "post"]
+    return {
+        "sentiment": SENTIMENTS[digest % len(SENTIMENTS)],
+        "confidence": round(0.5 + (digest >> 8) % 50 / 100, 2),
+        "summary": f"User discusses {' '.join(words)}.",
+    }
+
+
+def _sample_latency(rng: random.Random, config: StubConfig) -> float:
+    """Draw one request latency in seconds."""
+    base = config.latency_ms / 1000
+    if config.latency == "fixed" or base == 0:
+        return base
+    if config.latency == "uniform":
+        return max(
+            0.0, rng.uniform(base * (1 - config.latency_spread), base * (1 + config.latency_spread))
+        )
+    if config.latency == "exponential":
+        return rng.expovariate(1 / base)
+    return rng.lognormvariate(math.log(base), config.latency_spread)
+
+
+def _quota_exceeded(window: deque[float], requests_per_minute: int) -> float | None:
+    """Record a request against the quota; returns seconds until it frees up if exceeded."""
+    if not requests_per_minute:
+        return None
+    now = time.monotonic()
+    while window and window[0] <= now - 60:
+        window.popleft()
+    if len(window) >= requests_per_minute:
+        return window[0] + 60 - now
+    window.append(now)
+    return None
+
+
+def _rate_limit_response(retry_after: float) -> JSONResponse:
+    """429 shaped like OpenAI's, with Retry-After and x-ratelimit headers."""
+    return JSONResponse(
+        status_code=429,
+        headers={
+            "retry-after": f"{retry_after:.3f}",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": f"{retry_after:.3f}s",
+        },
+        content={
+            "error": {
+                "message": "Rate limit reached (stub)",
+                "type": "requests",
+                "code": "rate_limit_exceeded",
+            }
+        },
+    )
+
+
+def _tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the stub server with uvicorn."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.stub_llm", description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    for name, field in StubConfig.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+            help=field.description,
+        )
+    args = parser.parse_args(argv)
+
+    config = StubConfig(**{name: getattr(args, name) for name in StubConfig.model_fields})
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Tests for the LLM stub server and benchmark harness."""
+
+import httpx
+import pytest
+
+from benchmarks.corpus import synthetic_posts
+from benchmarks.run import CallCounter, bench_llm, build_llm, summarize
+from benchmarks.stub_llm import StubConfig, create_app
+
+
+def stub_llm(config: StubConfig):
+    """LLMService wired to an in-process stub, plus its call counter and app."""
+    app = create_app(config)
+    counter = CallCounter()
+    return build_llm("http://stub", httpx.ASGITransport(app=app), counter), counter, app
+
+
+@pytest.mark.asyncio
+async def test_stub_outputs_are_deterministic_across_modes():
+    """Test that combined, separate and batch prompts agree on each post."""
+    llm, _, app = stub_llm(StubConfig(latency="fixed", latency_ms=0))
+    post = synthetic_posts(1)[0]
+
+    combined = await llm.analyze_post(post["title"], post["body"], combined=True)
+    separate = await llm.analyze_post(post["title"], post["body"], combined=False)
+    batch = await llm.enrich_batch([post])
+
+    assert combined.sentiment.sentiment == separate.sentiment.sentiment
+    assert combined.summary == separate.summary == batch[0]["summary"]
+    assert app.state.stats.by_task == {"enrichment": 1, "sentiment": 1, "summary": 1, "batch": 1}
+    assert app.state.stats.by_model == {"stub-large": 3, "stub-small": 1}
+
+
+@pytest.mark.asyncio
+async def test_stub_quota_429s_are_retried():
+    """Test that injected 429s carry Retry-After and are retried by LLMService."""
+    llm, counter, app = stub_llm(
+        StubConfig(latency="fixed", latency_ms=0, error_rate=0.2, retry_after_seconds=0, seed=1)
+    )
+    posts = synthetic_posts(10)
+
+    run = await bench_llm(llm, posts, concurrency=4, combined=True)
+    result = summarize("combined", 4, len(posts), run, *counter.snapshot())
+
+    stats = app.state.stats
+    assert result["rate_limited"] == stats.rate_limited > 0
+    assert result["llm_calls"] == stats.requests == stats.completions + stats.rate_limited
+    # Only posts that hit a 429 on every attempt fall back
+    assert stats.completions == len(posts) - result["fallbacks"]
+    assert set(result["latency_ms"]) == {"p50", "p95", "p99"}
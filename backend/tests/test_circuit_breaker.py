@@ -0,0 +1,109 @@
+"""Tests for the provider circuit breakers."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.integrations.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    """Record enough failures to open the breaker."""
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure(ConnectionError("down"))
+
+
+def test_opens_after_consecutive_failures():
+    """Test that the circuit opens at the threshold and rejects calls."""
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_seconds=30)
+
+    breaker.record_failure(ConnectionError("down"))
+    breaker.record_success()
+    trip(breaker)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_in > 0
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_ignores_non_provider_errors():
+    """Test that errors outside failure_types never open the circuit."""
+    breaker = CircuitBreaker("test", failure_threshold=1, failure_types=(ConnectionError,))
+
+    breaker.record_failure(ValueError("bad request"))
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_probe_closes_or_reopens():
+    """Test that after recovery one probe is admitted and decides the state."""
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_seconds=30)
+    trip(breaker)
+
+    with patch("app.integrations.circuit_breaker.time.monotonic", return_value=1e12):
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_failure(ConnectionError("still down"))
+        assert breaker._state == CircuitState.OPEN
+
+    with patch("app.integrations.circuit_breaker.time.monotonic", return_value=2e12):
+        breaker.before_call()
+        breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats()["opened"] == 2
+
+
+def test_trip_opens_for_requested_time():
+    """Test that tripping (quota exhaustion) opens the circuit past the recovery time."""
+    breaker = CircuitBreaker("test", failure_threshold=5, recovery_seconds=30)
+
+    breaker.trip(3600, reason="quota exhaustion")
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.retry_in() > 3500
+
+
+@pytest.mark.asyncio
+async def test_llm_calls_fail_fast_when_open():
+    """Test that an open LLM circuit stops retries and skips the API."""
+    from app.integrations.llm import LLMService
+    from app.integrations.retry import RetryPolicy
+
+    breaker = CircuitBreaker("llm", failure_threshold=1, recovery_seconds=60)
+    service = LLMService(
+        api_key="test", retry=RetryPolicy(attempts=3, base_delay=0), breaker=breaker
+    )
+    client = service.providers[0]._client = AsyncMock()
+    client.chat.completions.create = AsyncMock(side_effect=TimeoutError())
+
+    with pytest.raises(CircuitOpenError):
+        await service._complete([{"role": "user", "content": "hi"}], max_tokens=5)
+
+    # The first attempt opened the circuit; the retry was rejected locally
+    assert client.chat.completions.create.await_count == 1
+    assert breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_reddit_calls_fail_fast_when_open():
+    """Test that an open Reddit circuit rejects calls before using the thread pool."""
+    from app.integrations.reddit import RedditSearchTool
+
+    breaker = CircuitBreaker("reddit", failure_threshold=1, recovery_seconds=60)
+    tool = RedditSearchTool(client_id="id", client_secret="secret", breaker=breaker)
+    tool._reddit = MagicMock()
+    func = MagicMock(side_effect=ConnectionError("down"))
+
+    with pytest.raises(ConnectionError):
+        await tool._run_in_thread(func)
+    with pytest.raises(CircuitOpenError):
+        await tool._run_in_thread(func)
+
+    assert func.call_count == 1
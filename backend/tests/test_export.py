@@ -0,0 +1,90 @@
+"""Tests for streaming Product DNA exports."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.export import coalesce, csv_rows, gzip_stream, ndjson_lines
+
+DOC = {
+    "post_id": "abc",
+    "title": "Title, with comma",
+    "body": "Body",
+    "sentiment": "positive",
+    "confidence": 0.9,
+    "summary": "Summary.",
+    "metadata": {
+        "subreddit": "marketing",
+        "url": "https://reddit.com/abc",
+        "created_utc": datetime(2024, 1, 1, 12),
+    },
+    "keywords": ["seo", "ads"],
+    "enriched_at": datetime(2024, 1, 2),
+}
+
+
+async def async_items(items):
+    """Yield items asynchronously."""
+    for item in items:
+        yield item
+
+
+async def collect(chunks):
+    """Join an async byte stream."""
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_serializes_datetimes():
+    """Test that each document becomes one JSON line with ISO timestamps."""
+    data = await collect(ndjson_lines(async_items([DOC, DOC])))
+
+    lines = data.decode().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["metadata"]["created_utc"] == "2024-01-01T12:00:00"
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_flatten_metadata():
+    """Test that CSV output has a header and flattened, quoted cells."""
+    data = await collect(csv_rows(async_items([DOC])))
+
+    rows = list(csv.DictReader(io.StringIO(data.decode())))
+    assert rows[0]["title"] == "Title, with comma"
+    assert rows[0]["subreddit"] == "marketing"
+    assert rows[0]["keywords"] == "seo;ads"
+    assert rows[0]["author"] == ""
+
+
+@pytest.mark.asyncio
+async def test_coalesce_and_gzip_round_trip():
+    """Test that coalesced, gzipped output decompresses to the original bytes."""
+    chunks = [b"x" * 10 for _ in range(25)]
+
+    coalesced = [chunk async for chunk in coalesce(async_items(chunks), size=100)]
+    compressed = await collect(gzip_stream(async_items(coalesced)))
+
+    assert [len(chunk) for chunk in coalesced] == [100, 100, 50]
+    assert gzip.decompress(compressed) == b"".join(chunks)
+
+
+@pytest.mark.asyncio
+async def test_export_endpoint_streams_gzipped_csv(client):
+    """Test that GET /export streams filtered records as a gzipped CSV download."""
+    with patch("app.routers.product_dna.product_dna_service") as mock_service:
+        mock_service.iter_product_dna.return_value = async_items([DOC])
+        response = await client.get(
+            "/api/v1/product-dna/export",
+            params={"format": "csv", "subreddit": "marketing", "gzip": "true"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="product_dna.csv.gz"' in response.headers["content-disposition"]
+    assert mock_service.iter_product_dna.call_args.kwargs["subreddit"] == "marketing"
+    assert b"Title, with comma" in gzip.decompress(response.content)
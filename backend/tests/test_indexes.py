@@ -0,0 +1,71 @@
+"""Tests for MongoDB index management."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.indexes import INDEXES, ensure_collection_indexes, ensure_indexes, index_usage
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_creates_every_declared_collection():
+    """Test that startup index creation covers every declared collection."""
+    collections = {name: AsyncMock() for name in INDEXES}
+    for name, collection in collections.items():
+        collection.create_indexes = AsyncMock(return_value=[f"{name}_index"])
+
+    db = MagicMock()
+    db.__getitem__.side_effect = collections.__getitem__
+
+    result = await ensure_indexes(db)
+
+    assert result == {name: [f"{name}_index"] for name in INDEXES}
+    for name, collection in collections.items():
+        collection.create_indexes.assert_called_once_with(INDEXES[name])
+
+
+@pytest.mark.asyncio
+async def test_superseded_product_dna_indexes_are_dropped():
+    """Test that single-field indexes replaced by compound ones are removed."""
+    collection = AsyncMock()
+    collection.index_information = AsyncMock(
+        return_value={"_id_": {}, "post_id_1": {}, "sentiment_1": {}, "enriched_at_1": {}}
+    )
+
+    await ensure_collection_indexes(collection, "product_dna")
+
+    dropped = [call.args[0] for call in collection.drop_index.call_args_list]
+    assert dropped == ["sentiment_1", "enriched_at_1"]
+
+
+def test_schedule_history_index_skips_ad_hoc_jobs():
+    """Test that the run-history index only covers jobs with a schedule ID."""
+    history = next(
+        model.document
+        for model in INDEXES["collection_jobs"]
+        if dict(model.document["key"]).get("schedule_id")
+    )
+
+    assert history["partialFilterExpression"] == {"schedule_id": {"$type": "string"}}
+
+
+@pytest.mark.asyncio
+async def test_index_usage_reports_access_counts():
+    """Test that $indexStats output is reduced to name, key and access count."""
+    stats = [
+        {"name": "post_id_1", "key": {"post_id": 1}, "accesses": {"ops": 12, "since": None}},
+        {"name": "_id_", "key": {"_id": 1}, "accesses": {"ops": 0, "since": None}},
+    ]
+    aggregate_cursor = MagicMock()
+    aggregate_cursor.__aiter__.return_value = stats
+
+    collection = MagicMock()
+    collection.aggregate.return_value = aggregate_cursor
+
+    usage = await index_usage(collection)
+
+    collection.aggregate.assert_called_once_with([{"$indexStats": {}}])
+    assert usage == [
+        {"name": "_id_", "key": {"_id": 1}, "accesses": 0, "since": None},
+        {"name": "post_id_1", "key": {"post_id": 1}, "accesses": 12, "since": None},
+    ]
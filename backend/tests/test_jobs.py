@@ -0,0 +1,255 @@
+"""Tests for background collection jobs."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.jobs import CollectionJob, JobStatus
+from app.models.reddit import CollectionRequest, CollectionResponse
+
+
+class TestJobService:
+    """Tests for JobService class."""
+
+    @pytest.fixture
+    def mock_jobs_collection(self):
+        """Mock the collection_jobs MongoDB collection."""
+        mock_collection = AsyncMock()
+        with patch("app.services.jobs.mongodb") as mock_mongo:
+            mock_mongo.get_collection.return_value = mock_collection
+            yield mock_collection
+
+    @pytest.mark.asyncio
+    async def test_enqueue_stores_queued_job(self, mock_jobs_collection):
+        """Test that enqueue persists a queued job and returns its ID."""
+        from app.services.jobs import JobService
+
+        service = JobService(product_dna=MagicMock())
+        request = CollectionRequest(keywords=["test"], limit=5)
+
+        job = await service.enqueue(request)
+
+        assert job.status == JobStatus.QUEUED
+        doc = mock_jobs_collection.insert_one.call_args[0][0]
+        assert doc["job_id"] == job.job_id
+        assert doc["status"] == JobStatus.QUEUED
+        assert doc["request"]["keywords"] == ["test"]
+
+    @pytest.mark.asyncio
+    async def test_run_job_tracks_progress_and_result(self, mock_jobs_collection):
+        """Test that pipeline events become progress counters on the finished job."""
+        from app.services.jobs import JobService
+
+        async def fake_pipeline(request, on_event):
+            await on_event("collected", {"post_id": "p1"})
+            await on_event("collected", {"post_id": "p2"})
+            await on_event("skipped", {"post_id": "p1"})
+            await on_event("enriched", {"post_id": "p2"})
+            await on_event("stored", {"post_id": "p2"})
+            return CollectionResponse(
+                success=True, posts_collected=2, posts_enriched=1, posts_stored=1
+            )
+
+        pipeline = MagicMock()
+        pipeline.collect_and_enrich = AsyncMock(side_effect=fake_pipeline)
+
+        service = JobService(product_dna=pipeline)
+        job = CollectionJob(
+            job_id="job1",
+            status=JobStatus.RUNNING,
+            request=CollectionRequest(keywords=["test"]),
+        )
+
+        await service.run_job(job, "lease1")
+
+        final_filter, final_update = mock_jobs_collection.update_one.call_args_list[-1][0]
+        assert final_filter == {"job_id": "job1", "lease_id": "lease1"}
+        final_update = final_update["$set"]
+        assert final_update["status"] == JobStatus.COMPLETED.value
+        assert final_update["progress"] == {
+            "collected": 2,
+            "skipped": 1,
+            "enriched": 1,
+            "stored": 1,
+            "failed": 0,
+        }
+        assert final_update["result"]["posts_stored"] == 1
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_renews_lease_without_progress_events(self, mock_jobs_collection):
+        """Test that a job emitting no events keeps its lease while it runs."""
+        import asyncio
+
+        from app.config import settings
+        from app.services.jobs import JobService
+
+        async def silent_pipeline(request, on_event):
+            await asyncio.sleep(0.05)
+            return CollectionResponse(
+                success=True, posts_collected=0, posts_enriched=0, posts_stored=0
+            )
+
+        mock_jobs_collection.update_one.return_value = MagicMock(matched_count=1)
+        pipeline = MagicMock()
+        pipeline.collect_and_enrich = AsyncMock(side_effect=silent_pipeline)
+        service = JobService(product_dna=pipeline)
+        job = CollectionJob(
+            job_id="job1", status=JobStatus.RUNNING, request=CollectionRequest(keywords=["x"])
+        )
+
+        with patch.object(settings, "JOB_LEASE_SECONDS", 0.03):
+            await service.run_job(job, "lease1")
+
+        renewals = [
+            call[0]
+            for call in mock_jobs_collection.update_one.call_args_list
+            if "lease_expires_at" in call[0][1]["$set"]
+            and call[0][1]["$set"]["lease_expires_at"] is not None
+        ]
+        assert len(renewals) >= 2
+        assert all(query == {"job_id": "job1", "lease_id": "lease1"} for query, _ in renewals)
+        assert service._active_jobs == {}
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_cancels_run_without_recording_outcome(self, mock_jobs_collection):
+        """Test that a run whose lease was taken over stops and leaves the job alone."""
+        import asyncio
+
+        from app.config import settings
+        from app.services.jobs import JobService
+
+        cancelled = asyncio.Event()
+
+        async def slow_pipeline(request, on_event):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_jobs_collection.update_one.return_value = MagicMock(matched_count=0)
+        pipeline = MagicMock()
+        pipeline.collect_and_enrich = AsyncMock(side_effect=slow_pipeline)
+        service = JobService(product_dna=pipeline)
+        job = CollectionJob(
+            job_id="job1", status=JobStatus.RUNNING, request=CollectionRequest(keywords=["x"])
+        )
+
+        with patch.object(settings, "JOB_LEASE_SECONDS", 0.03):
+            await asyncio.wait_for(service.run_job(job, "lease1"), timeout=1)
+
+        assert cancelled.is_set()
+        # Only the failed renewal was written; no final status
+        assert mock_jobs_collection.update_one.call_count == 1
+        assert service._active_jobs == {}
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_on_progress_flush_stops_run(self, mock_jobs_collection):
+        """Test that a progress flush finding the lease gone stops the pipeline."""
+        import asyncio
+
+        from app.config import settings
+        from app.services.jobs import JobService
+
+        events = []
+
+        async def busy_pipeline(request, on_event):
+            for index in range(3):
+                events.append(index)
+                await on_event("collected", {"post_id": f"p{index}"})
+                await asyncio.sleep(0)
+            return CollectionResponse(
+                success=True, posts_collected=3, posts_enriched=0, posts_stored=0
+            )
+
+        mock_jobs_collection.update_one.return_value = MagicMock(matched_count=0)
+        pipeline = MagicMock()
+        pipeline.collect_and_enrich = AsyncMock(side_effect=busy_pipeline)
+        service = JobService(product_dna=pipeline)
+        job = CollectionJob(
+            job_id="job1", status=JobStatus.RUNNING, request=CollectionRequest(keywords=["x"])
+        )
+
+        with patch.object(settings, "JOB_PROGRESS_FLUSH_SECONDS", 0):
+            await service.run_job(job, "lease1")
+
+        assert events == [0]
+        assert all(
+            "status" not in call[0][1]["$set"]
+            for call in mock_jobs_collection.update_one.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_failed_outcome_write(self, mock_jobs_collection):
+        """Test that a worker keeps claiming jobs when recording an outcome fails."""
+        import asyncio
+
+        from app.services.jobs import JobService
+
+        job = CollectionJob(
+            job_id="job1", status=JobStatus.RUNNING, request=CollectionRequest(keywords=["x"])
+        )
+        claims = [(job, "lease1"), None]
+        service = JobService(product_dna=MagicMock())
+        service._claim_next = AsyncMock(side_effect=lambda: claims.pop(0) if claims else None)
+        service.run_job = AsyncMock(side_effect=RuntimeError("mongo down"))
+
+        with patch("app.services.jobs.settings.JOB_POLL_INTERVAL_SECONDS", 0.01):
+            worker = asyncio.create_task(service._worker_loop())
+            await asyncio.sleep(0.05)
+            assert not worker.done()
+            worker.cancel()
+
+        service.run_job.assert_called_once_with(job, "lease1")
+        assert service._claim_next.call_count >= 2
+
+    @pytest.mark.asyncio
+    async def test_outcome_write_is_retried(self, mock_jobs_collection):
+        """Test that a transient error writing the final status is retried."""
+        from app.services.jobs import JobService
+
+        mock_jobs_collection.update_one.side_effect = [
+            RuntimeError("transient"),
+            MagicMock(matched_count=1),
+        ]
+        service = JobService(product_dna=MagicMock())
+
+        with patch("app.services.jobs.asyncio.sleep", AsyncMock()):
+            await service._finish("job1", "lease1", {"status": JobStatus.COMPLETED.value})
+
+        assert mock_jobs_collection.update_one.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_job_endpoint_returns_202(self, client):
+        """Test that POST /jobs returns the queued job immediately."""
+        queued = CollectionJob(
+            job_id="job1", status=JobStatus.QUEUED, request=CollectionRequest(keywords=["x"])
+        )
+        with patch("app.routers.product_dna.job_service") as mock_service:
+            mock_service.enqueue = AsyncMock(return_value=queued)
+            response = await client.post("/api/v1/product-dna/jobs", json={"keywords": ["x"]})
+
+        assert response.status_code == 202
+        assert response.json()["job_id"] == "job1"
+
+    @pytest.mark.asyncio
+    async def test_sync_collect_rejects_job_sized_limits(self, client):
+        """Test that POST /collect keeps its small cap and points large pulls at /jobs."""
+        with patch("app.routers.product_dna.product_dna_service") as mock_service:
+            mock_service.collect_and_enrich = AsyncMock()
+            response = await client.post(
+                "/api/v1/product-dna/collect", json={"keywords": ["x"], "limit": 5000}
+            )
+
+        assert response.status_code == 422
+        assert "/jobs" in response.json()["message"]
+        mock_service.collect_and_enrich.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_unknown_job_returns_404(self, client):
+        """Test that GET /jobs/{job_id} returns 404 for unknown jobs."""
+        with patch("app.routers.product_dna.job_service") as mock_service:
+            mock_service.get_job = AsyncMock(return_value=None)
+            response = await client.get("/api/v1/product-dna/jobs/missing")
+
+        assert response.status_code == 404
@@ -15,7 +15,7 @@ class TestLLMService:
         mock_response.choices = [MagicMock()]
         mock_response.choices[0].message.content = "positive"
 
-        with patch("app.integrations.llm.AsyncOpenAI") as mock_openai:
+        with patch("app.integrations.llm_router.AsyncOpenAI") as mock_openai:
             mock_client = AsyncMock()
             mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
             mock_openai.return_value = mock_client
@@ -23,7 +23,7 @@ class TestLLMService:
             from app.integrations.llm import LLMService, Sentiment
 
             service = LLMService(api_key="test_key")
-            service._client = mock_client
+            service.providers[0]._client = mock_client
 
             result = await service.analyze_sentiment(
                 title="Great product, highly recommend!",
@@ -39,7 +39,7 @@ class TestLLMService:
         mock_response.choices = [MagicMock()]
         mock_response.choices[0].message.content = "negative"
 
-        with patch("app.integrations.llm.AsyncOpenAI") as mock_openai:
+        with patch("app.integrations.llm_router.AsyncOpenAI") as mock_openai:
             mock_client = AsyncMock()
             mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
             mock_openai.return_value = mock_client
@@ -47,7 +47,7 @@ class TestLLMService:
             from app.integrations.llm import LLMService, Sentiment
 
             service = LLMService(api_key="test_key")
-            service._client = mock_client
+            service.providers[0]._client = mock_client
 
             result = await service.analyze_sentiment(
                 title="Terrible experience, avoid!",
@@ -63,7 +63,7 @@ class TestLLMService:
         mock_response.choices = [MagicMock()]
         mock_response.choices[0].message.content = "neutral"
 
-        with patch("app.integrations.llm.AsyncOpenAI") as mock_openai:
+        with patch("app.integrations.llm_router.AsyncOpenAI") as mock_openai:
             mock_client = AsyncMock()
             mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
             mock_openai.return_value = mock_client
@@ -71,7 +71,7 @@ class TestLLMService:
             from app.integrations.llm import LLMService, Sentiment
 
             service = LLMService(api_key="test_key")
-            service._client = mock_client
+            service.providers[0]._client = mock_client
 
             result = await service.analyze_sentiment(
                 title="Product update released", body="New version is now available for download."
@@ -88,7 +88,7 @@ class TestLLMService:
             0
         ].message.content = "User asks for social media marketing tips for small business growth."
 
-        with patch("app.integrations.llm.AsyncOpenAI") as mock_openai:
+        with patch("app.integrations.llm_router.AsyncOpenAI") as mock_openai:
             mock_client = AsyncMock()
             mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
             mock_openai.return_value = mock_client
@@ -96,7 +96,7 @@ class TestLLMService:
             from app.integrations.llm import LLMService
 
             service = LLMService(api_key="test_key")
-            service._client = mock_client
+            service.providers[0]._client = mock_client
 
             summary = await service.generate_summary(
                 title="How to grow my small business on social media?",
@@ -118,7 +118,7 @@ class TestLLMService:
         mock_summary_response.choices = [MagicMock()]
         mock_summary_response.choices[0].message.content = "Test summary."
 
-        with patch("app.integrations.llm.AsyncOpenAI") as mock_openai:
+        with patch("app.integrations.llm_router.AsyncOpenAI") as mock_openai:
             mock_client = AsyncMock()
             # Return different responses for different calls
             mock_client.chat.completions.create = AsyncMock(
@@ -129,11 +129,11 @@ class TestLLMService:
             from app.integrations.llm import LLMService
 
             service = LLMService(api_key="test_key")
-            service._client = mock_client
+            service.providers[0]._client = mock_client
 
             post = {"post_id": "test123", "title": "Test Title", "body": "Test body content"}
 
-            enriched = await service.enrich_post(post)
+            enriched = await service.enrich_post(post, combined=False)
 
             assert enriched["sentiment"] == "positive"
             assert enriched["summary"] == "Test summary."
@@ -142,7 +142,7 @@ class TestLLMService:
     @pytest.mark.asyncio
     async def test_sentiment_error_returns_neutral(self):
         """Test that errors in sentiment analysis default to neutral."""
-        with patch("app.integrations.llm.AsyncOpenAI") as mock_openai:
+        with patch("app.integrations.llm_router.AsyncOpenAI") as mock_openai:
             mock_client = AsyncMock()
             mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
             mock_openai.return_value = mock_client
@@ -150,9 +150,140 @@ class TestLLMService:
             from app.integrations.llm import LLMService, Sentiment
 
             service = LLMService(api_key="test_key")
-            service._client = mock_client
+            service.providers[0]._client = mock_client
 
             result = await service.analyze_sentiment(title="Test", body="Test")
 
             # Should default to neutral on error
             assert result.sentiment == Sentiment.NEUTRAL
+
+    @pytest.mark.asyncio
+    async def test_api_failure_marks_result_as_fallback(self):
+        """Test that placeholder results are flagged so they can be re-enriched."""
+        from app.integrations.llm import LLMService, Sentiment
+        from app.integrations.retry import RetryPolicy
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=TimeoutError())
+
+        service = LLMService(
+            api_key="test_key", retry=RetryPolicy(attempts=2, base_delay=0.001, deadline=5)
+        )
+        service.providers[0]._client = mock_client
+
+        combined = await service.analyze_post("Title", "Body", combined=True)
+        separate = await service.analyze_post("Title", "Body", combined=False)
+
+        # One retry per call: 2 attempts combined, 2 x 2 attempts separately
+        assert mock_client.chat.completions.create.call_count == 6
+        assert combined.fallback and separate.fallback
+        assert combined.sentiment.sentiment == Sentiment.NEUTRAL
+        assert separate.summary == combined.summary
+
+    @pytest.mark.asyncio
+    async def test_combined_enrichment_single_call(self):
+        """Test that combined mode gets sentiment and summary from one completion."""
+        content = '{"sentiment": "Negative", "confidence": 0.82, "summary": "User reports a bug"}'
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = content
+
+        from app.integrations.llm import LLMService, Sentiment
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        service = LLMService(api_key="test_key")
+        service.providers[0]._client = mock_client
+
+        result = await service.analyze_post("App crashes", "It crashes on login", combined=True)
+
+        assert mock_client.chat.completions.create.call_count == 1
+        assert result.sentiment.sentiment == Sentiment.NEGATIVE
+        assert result.sentiment.confidence == 0.82
+        assert result.summary == "User reports a bug."
+
+    @pytest.mark.asyncio
+    async def test_combined_enrichment_parse_failure_falls_back(self):
+        """Test that an unparseable combined response falls back to two calls."""
+
+        def response(content):
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = content
+            return mock_response
+
+        from app.integrations.llm import LLMService, Sentiment
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[response("not json"), response("positive"), response("Summary")]
+        )
+
+        service = LLMService(api_key="test_key")
+        service.providers[0]._client = mock_client
+
+        enriched = await service.enrich_post(
+            {"post_id": "p1", "title": "Title", "body": "Body"}, combined=True
+        )
+
+        assert mock_client.chat.completions.create.call_count == 3
+        assert enriched["sentiment"] == Sentiment.POSITIVE.value
+        assert enriched["summary"] == "Summary."
+
+    @pytest.mark.asyncio
+    async def test_enrich_batch_packs_posts_and_requeues_missing(self):
+        """Test that batches share one completion and only missing posts are retried."""
+
+        def response(content):
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = content
+            return mock_response
+
+        first = (
+            '{"results": ['
+            '{"post_id": "p1", "sentiment": "positive", "confidence": 0.9, "summary": "One."},'
+            '{"post_id": "p2", "sentiment": "bogus", "summary": "Two."}]}'
+        )
+        second = '[{"post_id": "p2", "sentiment": "negative", "summary": "Two"}]'
+
+        from app.integrations.llm import LLMService
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[response(first), response(second)]
+        )
+
+        service = LLMService(api_key="test_key")
+        service.providers[0]._client = mock_client
+
+        posts = [
+            {"post_id": "p1", "title": "First", "body": "Body one"},
+            {"post_id": "p2", "title": "Second", "body": "Body two"},
+        ]
+        enriched = await service.enrich_batch(posts, batch_size=5)
+
+        assert mock_client.chat.completions.create.call_count == 2
+        retry_prompt = mock_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+        assert "[post_id: p2]" in retry_prompt
+        assert "[post_id: p1]" not in retry_prompt
+        assert [post["sentiment"] for post in enriched] == ["positive", "negative"]
+        assert enriched[1]["summary"] == "Two."
+
+    def test_plan_batches_adapts_to_body_length(self):
+        """Test that long bodies produce smaller batches than the configured size."""
+        from app.config import settings
+        from app.integrations.llm import LLMService
+
+        service = LLMService(api_key="test_key")
+        short_posts = [{"post_id": str(i), "title": "t", "body": "b"} for i in range(20)]
+        long_posts = [{"post_id": str(i), "title": "t", "body": "x" * 5000} for i in range(20)]
+
+        with patch.object(settings, "LLM_CONTEXT_TOKENS", 2000):
+            short_batches = service.plan_batches(short_posts, batch_size=10)
+            long_batches = service.plan_batches(long_posts, batch_size=10)
+
+        assert [len(batch) for batch in short_batches] == [10, 10]
+        assert all(len(batch) < 10 for batch in long_batches)
+        assert sum(len(batch) for batch in long_batches) == 20
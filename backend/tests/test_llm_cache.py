@@ -0,0 +1,139 @@
+"""Tests for the LLM result cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.integrations.llm_cache import LLMCache, cache_key
+
+
+class TestLLMCache:
+    """Tests for LLMCache class."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at capacity."""
+        cache = LLMCache(max_entries=2, ttl_seconds=60, backend="memory")
+
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 2})
+        await cache.get("a")  # "b" becomes least recently used
+        await cache.set("c", {"v": 3})
+
+        assert await cache.get("a") == {"v": 1}
+        assert await cache.get("b") is None
+        assert await cache.get("c") == {"v": 3}
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_and_counters(self):
+        """Test that expired entries miss and hits/misses are counted."""
+        cache = LLMCache(max_entries=10, ttl_seconds=60, backend="memory")
+
+        with patch("app.integrations.llm_cache.time.monotonic", return_value=1000.0):
+            await cache.set("key", {"v": 1})
+            assert await cache.get("key") == {"v": 1}
+
+        with patch("app.integrations.llm_cache.time.monotonic", return_value=1061.0):
+            assert await cache.get("key") is None
+
+        stats = cache.stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_cache_key_depends_on_model_and_prompt_version(self):
+        """Test that changing the model or prompt version changes the key."""
+        base = cache_key("gpt-4o", "sentiment", "v1", "Title", "Body")
+
+        assert base == cache_key("gpt-4o", "sentiment", "v1", "Title", "Body")
+        assert base != cache_key("gpt-4o-mini", "sentiment", "v1", "Title", "Body")
+        assert base != cache_key("gpt-4o", "sentiment", "v2", "Title", "Body")
+
+    def test_batch_results_keyed_apart_from_single_post_enrichment(self):
+        """Test that batch results are keyed on their own prompt and the body it sends."""
+        from app.integrations.llm import BATCH_BODY_CHARS, LLMService
+
+        service = LLMService(api_key="test_key", cache=LLMCache(backend="memory"))
+        post = {"post_id": "p1", "title": "Title", "body": "x" * BATCH_BODY_CHARS}
+        longer = {**post, "body": post["body"] + "y"}
+
+        # The single-post key for the same post, as _analyze_combined builds it
+        enrichment_key = service._cache_key("enrichment", post["title"], post["body"])
+
+        assert service._post_batch_key(post) != enrichment_key
+        # Text the batch prompt never sends cannot change its answer
+        assert service._post_batch_key(post) == service._post_batch_key(longer)
+
+    @pytest.mark.asyncio
+    async def test_repeat_enrichment_costs_no_llm_calls(self):
+        """Test that already-seen content is served from the cache."""
+        content = '{"sentiment": "positive", "confidence": 0.9, "summary": "Great tool."}'
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = content
+
+        from app.integrations.llm import LLMService
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        service = LLMService(api_key="test_key", cache=LLMCache(backend="memory"))
+        service.providers[0]._client = mock_client
+
+        first = await service.analyze_post("Love it", "Works well", combined=True)
+        second = await service.analyze_post("Love it", "Works well", combined=True)
+
+        assert mock_client.chat.completions.create.call_count == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_fallback_results_are_not_cached(self):
+        """Test that error fallbacks are retried instead of served from cache."""
+        from app.integrations.llm import LLMService
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+
+        service = LLMService(api_key="test_key", cache=LLMCache(backend="memory"))
+        service.providers[0]._client = mock_client
+
+        await service.analyze_sentiment("Title", "Body")
+        await service.analyze_sentiment("Title", "Body")
+
+        assert mock_client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failover_answers_are_keyed_by_the_answering_model(self):
+        """Test that a failover provider's answer is not cached as the primary model's."""
+        import openai
+
+        from app.integrations.llm import LLMService
+        from app.integrations.llm_router import LLMProvider
+        from app.integrations.retry import RetryPolicy
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "positive"
+        mock_response.usage = None
+
+        primary = LLMProvider("github", "http://test", "key", model="gh-large", small_model="gh")
+        primary._client = AsyncMock()
+        primary._client.chat.completions.create = AsyncMock(
+            side_effect=openai.APIConnectionError(request=MagicMock())
+        )
+        failover = LLMProvider("local", "http://test", "key", model="local-large", small_model="lo")
+        failover._client = AsyncMock()
+        failover._client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        cache = LLMCache(backend="memory")
+        service = LLMService(
+            cache=cache, providers=[primary, failover], retry=RetryPolicy(attempts=1)
+        )
+
+        await service.analyze_sentiment("Title", "Body")
+        await service.analyze_sentiment("Title", "Body")
+
+        # The primary's key was never filled, so the lookup misses both times
+        assert failover._client.chat.completions.create.await_count == 2
+        assert await cache.get(cache_key("lo", "sentiment", "v1", "Title", "Body")) is not None
+        assert await cache.get(cache_key("gh", "sentiment", "v1", "Title", "Body")) is None
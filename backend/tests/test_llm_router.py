@@ -0,0 +1,204 @@
+"""Tests for multi-provider LLM routing."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import openai
+import pytest
+
+from app.integrations.circuit_breaker import CircuitBreaker, CircuitState
+from app.integrations.llm_router import LatencyTracker, LLMProvider, LLMRouter, ModelTier
+
+
+def make_provider(name: str, side_effect=None, breaker: CircuitBreaker | None = None):
+    """Provider with a mocked client that answers 'positive' unless side_effect is set."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "positive"
+    response.usage = None
+
+    provider = LLMProvider(
+        name,
+        base_url="http://test",
+        api_key="key",
+        model=f"{name}-large",
+        small_model=f"{name}-small",
+        breaker=breaker,
+    )
+    provider._client = AsyncMock()
+    provider._client.chat.completions.create = AsyncMock(
+        return_value=response, side_effect=side_effect
+    )
+    return provider
+
+
+def rate_limit_error(headers: dict, code: str | None = None) -> openai.RateLimitError:
+    """429 error carrying the given response headers."""
+    response = httpx.Response(
+        429, headers=headers, request=httpx.Request("POST", "http://test/chat/completions")
+    )
+    body = {"code": code} if code else None
+    return openai.RateLimitError("rate limited", response=response, body=body)
+
+
+def test_latency_percentiles():
+    """Test nearest-rank percentiles over the sliding window."""
+    tracker = LatencyTracker(window=100)
+    for ms in range(1, 101):
+        tracker.record(ms / 1000)
+
+    assert tracker.percentile(50) == pytest.approx(0.05)
+    assert tracker.percentile(95) == pytest.approx(0.095)
+    assert LatencyTracker().percentile(50) is None
+
+
+@pytest.mark.asyncio
+async def test_routes_tasks_to_model_tiers():
+    """Test that the small tier uses the small model and the large tier the strong one."""
+    provider = make_provider("github")
+    router = LLMRouter([provider])
+
+    await router.complete(ModelTier.SMALL, [], max_tokens=5, estimated=10)
+    await router.complete(ModelTier.LARGE, [], max_tokens=5, estimated=10)
+
+    models = [c.kwargs["model"] for c in provider._client.chat.completions.create.call_args_list]
+    assert models == ["github-small", "github-large"]
+
+
+@pytest.mark.asyncio
+async def test_fails_over_to_next_provider():
+    """Test that an erroring provider is skipped within the same attempt."""
+    primary = make_provider("github", side_effect=openai.APIConnectionError(request=MagicMock()))
+    secondary = make_provider("openai")
+    router = LLMRouter([primary, secondary])
+
+    response, model = await router.complete(ModelTier.LARGE, [], max_tokens=5, estimated=10)
+
+    assert response.choices[0].message.content == "positive"
+    assert model == "openai-large"
+    assert secondary._client.chat.completions.create.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_quota_exhaustion_takes_provider_out_of_rotation():
+    """Test that an exhausted quota opens the provider's circuit for the reset time."""
+    breaker = CircuitBreaker("github", failure_threshold=5, recovery_seconds=30)
+    primary = make_provider(
+        "github", side_effect=rate_limit_error({"retry-after": "3600"}), breaker=breaker
+    )
+    secondary = make_provider("openai")
+    router = LLMRouter([primary, secondary])
+
+    await router.complete(ModelTier.LARGE, [], max_tokens=5, estimated=10)
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.retry_in() > 3500
+    assert router.candidates(ModelTier.LARGE)[0] is secondary
+
+
+@pytest.mark.asyncio
+async def test_all_providers_failing_raises_retryable_error():
+    """Test that the retryable error wins so the retry policy backs off."""
+    router = LLMRouter(
+        [
+            make_provider("github", side_effect=TimeoutError()),
+            make_provider("local", side_effect=ValueError("bad request")),
+        ]
+    )
+
+    with pytest.raises(TimeoutError):
+        await router.complete(ModelTier.LARGE, [], max_tokens=5, estimated=10)
+
+
+def test_prefers_faster_provider_once_measured(monkeypatch):
+    """Test that measured providers are ordered by p50 latency."""
+    from app.integrations import llm_router
+
+    monkeypatch.setattr(llm_router.settings, "LLM_LATENCY_MIN_SAMPLES", 3)
+    slow, fast = make_provider("github"), make_provider("local")
+    for _ in range(3):
+        slow.latency[ModelTier.SMALL].record(0.8)
+        fast.latency[ModelTier.SMALL].record(0.1)
+    router = LLMRouter([slow, fast])
+
+    assert router.candidates(ModelTier.SMALL) == [fast, slow]
+    # The large tier has no samples yet, so the configured order holds
+    assert router.candidates(ModelTier.LARGE) == [slow, fast]
+
+
+@pytest.mark.asyncio
+async def test_repeatedly_failing_provider_is_demoted():
+    """Test that errors the breaker ignores still move a provider behind the others."""
+    from app.config import settings
+
+    primary = make_provider(
+        "github",
+        side_effect=openai.NotFoundError(
+            "model not found",
+            response=httpx.Response(404, request=httpx.Request("POST", "http://test")),
+            body=None,
+        ),
+    )
+    secondary = make_provider("openai")
+    router = LLMRouter([primary, secondary])
+
+    for _ in range(settings.LLM_DEMOTE_AFTER_FAILURES):
+        await router.complete(ModelTier.LARGE, [], max_tokens=5, estimated=10)
+    await router.complete(ModelTier.LARGE, [], max_tokens=5, estimated=10)
+
+    assert primary.demoted()
+    assert router.candidates(ModelTier.LARGE) == [secondary, primary]
+    assert primary._client.chat.completions.create.await_count == settings.LLM_DEMOTE_AFTER_FAILURES
+
+
+@pytest.mark.asyncio
+async def test_wait_until_available_times_out_when_all_open():
+    """Test that enrichment pauses give up while every circuit stays open."""
+    breaker = CircuitBreaker("github", failure_threshold=1, recovery_seconds=60)
+    breaker.trip(60, reason="test")
+    router = LLMRouter([make_provider("github", breaker=breaker)])
+
+    assert await router.wait_until_available(timeout=0.05) is False
+
+
+@pytest.mark.asyncio
+async def test_probe_cancelled_while_throttled_keeps_circuit_probing():
+    """Test that cancelling a half-open call during its limiter wait frees the probe."""
+    breaker = CircuitBreaker("github", failure_threshold=1, recovery_seconds=0.01)
+    breaker.trip(0.01, reason="test")
+    await asyncio.sleep(0.02)
+    provider = make_provider("github", breaker=breaker)
+
+    async def throttled(tokens: int) -> None:
+        await asyncio.sleep(10)
+
+    provider.limiter = MagicMock()
+    provider.limiter.acquire = throttled
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(
+            provider.complete(ModelTier.LARGE, [], max_tokens=5, estimated=10), timeout=0.05
+        )
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert await LLMRouter([provider]).wait_until_available(timeout=0.05) is True
+
+
+def test_stats_report_each_providers_limiter_and_breaker(monkeypatch):
+    """Test that failover providers report their own rate limiter and circuit breaker."""
+    from app.integrations import llm_router
+
+    monkeypatch.setattr(llm_router.settings, "LLM_PROVIDERS", "github,openai")
+    monkeypatch.setattr(llm_router.settings, "GITHUB_TOKEN", "gh")
+    monkeypatch.setattr(llm_router.settings, "OPENAI_API_KEY", "sk")
+    primary_breaker = CircuitBreaker("llm", failure_threshold=1)
+    primary_breaker.trip(60, reason="test")
+
+    stats = LLMRouter(llm_router.configured_providers(breaker=primary_breaker)).stats()
+
+    assert [s["name"] for s in stats] == ["github", "openai"]
+    assert stats[0]["circuit_breaker"]["state"] == CircuitState.OPEN.value
+    assert stats[0]["rate_limit"] is None
+    assert stats[1]["circuit_breaker"]["state"] == CircuitState.CLOSED.value
+    assert stats[1]["rate_limit"]["acquired"] == 0
@@ -4,15 +4,36 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
+from app.integrations.llm import EnrichmentResult, SentimentResult
 from app.models.reddit import (
     CollectionRequest,
+    CollectionResponse,
     EnrichedPost,
     PostMetadata,
     Sentiment,
 )
 
 
+def async_cursor(docs):
+    """Build a mock Motor cursor that yields `docs`."""
+    cursor = MagicMock()
+    cursor.__aiter__.return_value = docs
+    return cursor
+
+
+def async_pages(*pages):
+    """Build a mock RedditSearchTool.iter_search_pages yielding `pages`."""
+
+    async def iter_search_pages(**kwargs):
+        for page in pages:
+            yield page
+
+    return iter_search_pages
+
+
 class TestProductDNAService:
     """Tests for ProductDNAService class."""
 
@@ -20,10 +41,13 @@ class TestProductDNAService:
     def mock_mongodb(self):
         """Create a mock MongoDB instance."""
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(
-            return_value=MagicMock(upserted_id="id1", modified_count=0)
+        mock_collection.bulk_write = AsyncMock(
+            side_effect=lambda operations, ordered: MagicMock(
+                upserted_count=len(operations), modified_count=0
+            )
         )
         mock_collection.create_index = AsyncMock()
+        mock_collection.find = MagicMock(return_value=async_cursor([]))
 
         mock_db = MagicMock()
         mock_db.__getitem__ = MagicMock(return_value=mock_collection)
@@ -64,17 +88,18 @@ class TestProductDNAService:
             },
         ]
 
-        # Mock sentiment result
-        mock_sentiment = MagicMock()
-        mock_sentiment.sentiment.value = "positive"
+        # Mock enrichment result
+        mock_enrichment = EnrichmentResult(
+            sentiment=SentimentResult(sentiment="positive", confidence=0.9),
+            summary="Test summary.",
+        )
 
         # Create mock services
         mock_reddit = MagicMock()
-        mock_reddit.search_subreddits.return_value = mock_raw_posts
+        mock_reddit.iter_search_pages = async_pages(mock_raw_posts)
 
         mock_llm = AsyncMock()
-        mock_llm.analyze_sentiment = AsyncMock(return_value=mock_sentiment)
-        mock_llm.generate_summary = AsyncMock(return_value="Test summary.")
+        mock_llm.analyze_post = AsyncMock(return_value=mock_enrichment)
 
         from app.services.product_dna import ProductDNAService
 
@@ -147,14 +172,18 @@ class TestProductDNAService:
             keywords=["test"],
         )
 
-        stored = await service._store_posts([enriched_post])
+        stored, errors = await service._store_posts([enriched_post])
 
         assert stored == 1
-        mock_mongodb.update_one.assert_called_once()
+        assert errors == []
+        mock_mongodb.bulk_write.assert_called_once()
 
-        # Verify upsert=True was used
-        call_kwargs = mock_mongodb.update_one.call_args[1]
-        assert call_kwargs["upsert"] is True
+        # Verify an unordered bulk upsert was used
+        operations = mock_mongodb.bulk_write.call_args[0][0]
+        assert operations == [
+            UpdateOne({"post_id": "test123"}, {"$set": enriched_post.model_dump()}, upsert=True)
+        ]
+        assert mock_mongodb.bulk_write.call_args[1]["ordered"] is False
 
     @pytest.mark.asyncio
     async def test_ensure_indexes(self, mock_mongodb):
@@ -165,8 +194,17 @@ class TestProductDNAService:
 
         await service.ensure_indexes()
 
-        # Verify all indexes were created
-        assert mock_mongodb.create_index.call_count == 4
+        # Verify the declared indexes were created in one call
+        mock_mongodb.create_indexes.assert_called_once()
+        models = mock_mongodb.create_indexes.call_args[0][0]
+        keys = [list(model.document["key"].items()) for model in models]
+        assert [("post_id", 1)] in keys
+        assert [
+            ("sentiment", 1),
+            ("metadata.subreddit", 1),
+            ("enriched_at", -1),
+            ("post_id", -1),
+        ] in keys
 
     @pytest.mark.asyncio
     async def test_enrichment_error_handling(self):
@@ -187,10 +225,10 @@ class TestProductDNAService:
         ]
 
         mock_reddit = MagicMock()
-        mock_reddit.search_subreddits.return_value = mock_raw_posts
+        mock_reddit.iter_search_pages = async_pages(mock_raw_posts)
 
         mock_llm = AsyncMock()
-        mock_llm.analyze_sentiment = AsyncMock(side_effect=Exception("LLM Error"))
+        mock_llm.analyze_post = AsyncMock(side_effect=Exception("LLM Error"))
 
         from app.services.product_dna import ProductDNAService
 
@@ -204,3 +242,634 @@ class TestProductDNAService:
         assert result.posts_collected == 1
         assert result.posts_enriched == 0
         assert len(result.errors) == 1
+
+    @pytest.mark.asyncio
+    async def test_enrichment_respects_concurrency_limit(self, mock_mongodb):
+        """Test that no more than ENRICHMENT_CONCURRENCY posts are enriched at once."""
+        import asyncio
+
+        from app.config import settings
+        from app.services.product_dna import ProductDNAService
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_analyze(title, body):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return EnrichmentResult(
+                sentiment=SentimentResult(sentiment="neutral"), summary="Summary."
+            )
+
+        mock_llm = AsyncMock()
+        mock_llm.analyze_post = AsyncMock(side_effect=slow_analyze)
+
+        raw_posts = [
+            {"post_id": f"post{i}", "title": f"Title {i}", "created_utc": datetime.now(UTC)}
+            for i in range(10)
+        ]
+        mock_reddit = MagicMock()
+        mock_reddit.iter_search_pages = async_pages(raw_posts)
+        service = ProductDNAService(reddit=mock_reddit, llm=mock_llm)
+
+        with patch.object(settings, "ENRICHMENT_CONCURRENCY", 3):
+            result = await service.collect_and_enrich(CollectionRequest(keywords=["test"]))
+
+        assert result.posts_enriched == 10
+        assert result.errors == []
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_enrichment_timeout_reported_as_error(self):
+        """Test that a post exceeding the per-post timeout is reported, not stored."""
+        import asyncio
+
+        from app.services.product_dna import ProductDNAService
+
+        async def analyze(title, body):
+            if title == "slow":
+                await asyncio.sleep(1)
+            return EnrichmentResult(
+                sentiment=SentimentResult(sentiment="positive"), summary="Summary."
+            )
+
+        mock_llm = AsyncMock()
+        mock_llm.analyze_post = AsyncMock(side_effect=analyze)
+
+        service = ProductDNAService(reddit=MagicMock(), llm=mock_llm)
+
+        slow, slow_error = await service._enrich_one(
+            {"post_id": "slow1", "title": "slow"}, ["test"], timeout=0.05
+        )
+        fast, fast_error = await service._enrich_one(
+            {"post_id": "fast1", "title": "fast"}, ["test"], timeout=0.05
+        )
+
+        assert slow is None
+        assert "slow1" in slow_error
+        assert fast.post_id == "fast1"
+        assert fast_error is None
+
+    @pytest.mark.asyncio
+    async def test_known_posts_skip_enrichment(self, mock_mongodb):
+        """Test that unchanged stored posts are skipped and changed ones refreshed."""
+        from app.services.product_dna import ProductDNAService, content_hash
+
+        raw_posts = [
+            {"post_id": "same", "title": "Same", "body": "Unchanged"},
+            {"post_id": "edited", "title": "Edited", "body": "New body"},
+            {"post_id": "fresh", "title": "Fresh", "body": "Never seen"},
+            {"post_id": "degraded", "title": "Degraded", "body": "Unchanged"},
+        ]
+        mock_mongodb.find.return_value = async_cursor(
+            [
+                {"post_id": "same", "content_hash": content_hash("Same", "Unchanged")},
+                {"post_id": "edited", "content_hash": content_hash("Edited", "Old body")},
+                {
+                    "post_id": "degraded",
+                    "content_hash": content_hash("Degraded", "Unchanged"),
+                    "enrichment_status": "fallback",
+                },
+            ]
+        )
+
+        service = ProductDNAService(reddit=MagicMock(), llm=AsyncMock())
+
+        to_enrich, counts, known = await service._filter_known_posts(raw_posts)
+
+        assert [post["post_id"] for post in to_enrich] == ["edited", "fresh", "degraded"]
+        assert counts == {"new": 1, "refreshed": 2, "skipped": 1}
+        assert set(known) == {"edited", "degraded"}
+        query = mock_mongodb.find.call_args[0][0]
+        assert query == {"post_id": {"$in": ["same", "edited", "fresh", "degraded"]}}
+
+    @pytest.mark.asyncio
+    async def test_reenrich_degraded_repairs_fallback_records(self, mock_mongodb):
+        """Test that fallback records are re-enriched and only real results are written."""
+        from app.services.product_dna import ProductDNAService
+
+        created = datetime(2024, 1, 1, tzinfo=UTC)
+        stored = [
+            {
+                "post_id": post_id,
+                "title": post_id.title(),
+                "body": "Body",
+                "sentiment": "neutral",
+                "keywords": ["seo"],
+                "metadata": {"subreddit": "marketing", "created_utc": created},
+            }
+            for post_id in ("repaired", "still", "error")
+        ]
+        mock_mongodb.find.return_value = async_cursor(stored)
+
+        async def analyze_post(title, body):
+            if title == "Error":
+                raise RuntimeError("LLM down")
+            return EnrichmentResult(
+                sentiment=SentimentResult(sentiment="positive", confidence=0.7),
+                summary="Summary.",
+                fallback=title == "Still",
+            )
+
+        mock_llm = MagicMock()
+        mock_llm.analyze_post = AsyncMock(side_effect=analyze_post)
+        rollups = MagicMock()
+        rollups.reclassify = AsyncMock()
+
+        service = ProductDNAService(reddit=MagicMock(), llm=mock_llm, rollups=rollups)
+        counts = await service.reenrich_degraded()
+
+        assert counts == {"scanned": 3, "repaired": 1, "still_degraded": 1, "failed": 1}
+        assert mock_mongodb.find.call_args[0][0] == {"enrichment_status": "fallback"}
+        operations = mock_mongodb.bulk_write.call_args[0][0]
+        assert [op._filter["post_id"] for op in operations] == ["repaired"]
+        assert operations[0]._doc["$set"]["enrichment_status"] == "complete"
+        assert operations[0]._doc["$set"]["sentiment"] == "positive"
+        assert list(rollups.reclassify.call_args[0][0]) == [(stored[0], "positive")]
+
+    @pytest.mark.asyncio
+    async def test_store_posts_chunks_and_maps_bulk_errors(self, mock_mongodb):
+        """Test that storage is chunked and bulk write errors map to posts."""
+        from app.config import settings
+        from app.services.product_dna import ProductDNAService
+
+        def make_post(post_id):
+            return EnrichedPost(
+                post_id=post_id,
+                title="Title",
+                sentiment=Sentiment.NEUTRAL,
+                summary="Summary.",
+                metadata=PostMetadata(
+                    url="https://reddit.com/test",
+                    subreddit="marketing",
+                    created_utc=datetime.now(UTC),
+                ),
+            )
+
+        bulk_error = BulkWriteError(
+            {
+                "nUpserted": 1,
+                "nModified": 0,
+                "upserted": [{"index": 0, "_id": "mongo-id-2"}],
+                "writeErrors": [{"index": 1, "errmsg": "duplicate key"}],
+            }
+        )
+        mock_mongodb.bulk_write = AsyncMock(
+            side_effect=[
+                MagicMock(upserted_count=1, modified_count=1, upserted_ids={0: "mongo-id-0"}),
+                bulk_error,
+            ]
+        )
+        rollups = MagicMock()
+        rollups.record = AsyncMock()
+
+        service = ProductDNAService(rollups=rollups)
+        posts = [make_post(f"post{i}") for i in range(4)]
+
+        with patch.object(settings, "MONGO_BULK_CHUNK_SIZE", 2):
+            stored, errors = await service._store_posts(posts)
+
+        assert mock_mongodb.bulk_write.call_count == 2
+        assert stored == 3
+        assert len(errors) == 1
+        assert "post3" in errors[0]
+        # Only inserted posts are counted into the rollups
+        rollups.record.assert_called_once_with([posts[0], posts[2]])
+
+    @pytest.mark.asyncio
+    async def test_store_posts_moves_rollups_of_updated_posts(self, mock_mongodb):
+        """Test that re-enriched posts whose sentiment changed are reclassified."""
+        from app.services.product_dna import ProductDNAService
+
+        def make_post(post_id, sentiment):
+            return EnrichedPost(
+                post_id=post_id,
+                title="Title",
+                sentiment=sentiment,
+                summary="Summary.",
+                metadata=PostMetadata(
+                    url="https://reddit.com/test",
+                    subreddit="marketing",
+                    created_utc=datetime.now(UTC),
+                ),
+            )
+
+        mock_mongodb.bulk_write = AsyncMock(
+            return_value=MagicMock(upserted_count=1, modified_count=2, upserted_ids={0: "id"})
+        )
+        rollups = MagicMock()
+        rollups.record = AsyncMock()
+        rollups.reclassify = AsyncMock()
+        previous = {
+            "edited": {"post_id": "edited", "sentiment": "neutral", "keywords": ["seo"]},
+            "same": {"post_id": "same", "sentiment": "positive", "keywords": ["seo"]},
+        }
+        posts = [
+            make_post("fresh", Sentiment.NEUTRAL),
+            make_post("edited", Sentiment.NEGATIVE),
+            make_post("same", Sentiment.POSITIVE),
+        ]
+
+        service = ProductDNAService(rollups=rollups)
+        await service._store_posts(posts, previous=previous)
+
+        rollups.record.assert_called_once_with([posts[0]])
+        # reclassify skips pairs whose sentiment is unchanged
+        assert rollups.reclassify.call_args[0][0] == [
+            (
+                {"post_id": "edited", "sentiment": "neutral", "keywords": ["seo"]},
+                "negative",
+            ),
+            ({"post_id": "same", "sentiment": "positive", "keywords": ["seo"]}, "positive"),
+        ]
+        assert previous == {}
+
+    @pytest.mark.asyncio
+    async def test_pipeline_streams_posts_into_batched_writes(self, mock_mongodb):
+        """Test that posts are stored in small batches as they are enriched."""
+        from app.config import settings
+        from app.services.product_dna import ProductDNAService
+
+        pages = [
+            [
+                {"post_id": f"p{page}-{i}", "title": f"Title {i}", "created_utc": datetime.now(UTC)}
+                for i in range(3)
+            ]
+            for page in range(2)
+        ]
+        mock_reddit = MagicMock()
+        mock_reddit.iter_search_pages = async_pages(*pages)
+
+        mock_llm = AsyncMock()
+        mock_llm.analyze_post = AsyncMock(
+            return_value=EnrichmentResult(
+                sentiment=SentimentResult(sentiment="neutral"), summary="Summary."
+            )
+        )
+
+        events = []
+
+        async def on_event(event, data):
+            events.append(event)
+
+        service = ProductDNAService(reddit=mock_reddit, llm=mock_llm)
+        request = CollectionRequest(keywords=["test"], limit=6)
+
+        with (
+            patch.object(settings, "PIPELINE_STORE_BATCH_SIZE", 2),
+            patch.object(settings, "ENRICHMENT_CONCURRENCY", 1),
+        ):
+            result = await service.collect_and_enrich(request, on_event=on_event)
+
+        assert result.posts_collected == 6
+        assert result.posts_stored == 6
+        assert len(result.sample) == 3
+        assert mock_mongodb.bulk_write.call_count == 3
+        assert mock_mongodb.find.call_count == 2  # One dedup lookup per page
+        assert events.count("collected") == 6
+        assert events.count("stored") == 6
+
+    @pytest.mark.asyncio
+    async def test_incremental_collection_stops_at_watermark(self, mock_mongodb):
+        """Test that incremental runs page newest first and skip posts already seen."""
+        from app.config import settings
+        from app.models.reddit import CollectionWatermark
+        from app.services.product_dna import ProductDNAService
+
+        newest = datetime(2024, 3, 5, 12, 0)
+        watermarks = AsyncMock()
+        watermarks.get.return_value = CollectionWatermark(
+            query_key="test@marketing",
+            keywords=["test"],
+            subreddits=["marketing"],
+            newest_created_utc=newest,
+            seen_ids=["seen"],
+            updated_at=newest,
+        )
+        search_kwargs = {}
+
+        async def iter_search_pages(**kwargs):
+            search_kwargs.update(kwargs)
+            yield [
+                {"post_id": "fresh", "title": "Fresh", "created_utc": datetime(2024, 3, 5, 13)},
+                {"post_id": "seen", "title": "Seen", "created_utc": newest},
+            ]
+
+        mock_reddit = MagicMock()
+        mock_reddit.iter_search_pages = iter_search_pages
+        mock_llm = AsyncMock()
+        mock_llm.analyze_post = AsyncMock(
+            return_value=EnrichmentResult(
+                sentiment=SentimentResult(sentiment="neutral"), summary="Summary."
+            )
+        )
+
+        service = ProductDNAService(reddit=mock_reddit, llm=mock_llm, watermarks=watermarks)
+        request = CollectionRequest(keywords=["test"], subreddits=["marketing"], incremental=True)
+
+        with patch.object(settings, "WATERMARK_OVERLAP_SECONDS", 60):
+            result = await service.collect_and_enrich(request)
+
+        assert search_kwargs["sort"] == "new"
+        assert search_kwargs["since"] == datetime(2024, 3, 5, 11, 59)
+        # Seen posts in the overlap do not use up the limit
+        assert search_kwargs["limit"] == request.limit + 1
+        assert result.posts_collected == 1
+        assert result.posts_seen == 1
+        tracker = watermarks.save.call_args[0][2]
+        assert tracker.advanced() == (datetime(2024, 3, 5, 13), ["fresh", "seen"])
+
+    @pytest.mark.asyncio
+    async def test_incremental_collection_stops_at_limit_without_advancing(self, mock_mongodb):
+        """Test that a run hitting its limit stops paging and keeps the watermark time."""
+        from app.models.reddit import CollectionWatermark
+        from app.services.product_dna import ProductDNAService
+
+        newest = datetime(2024, 3, 5, 12, 0)
+        watermarks = AsyncMock()
+        watermarks.get.return_value = CollectionWatermark(
+            query_key="test@marketing",
+            keywords=["test"],
+            subreddits=["marketing"],
+            newest_created_utc=newest,
+            seen_ids=[],
+            updated_at=newest,
+        )
+        pages = [
+            [
+                {"post_id": f"p{page}-{i}", "title": "T", "created_utc": datetime(2024, 3, 6)}
+                for i in range(3)
+            ]
+            for page in range(2)
+        ]
+        mock_reddit = MagicMock()
+        mock_reddit.iter_search_pages = async_pages(*pages)
+        mock_llm = AsyncMock()
+        mock_llm.analyze_post = AsyncMock(
+            return_value=EnrichmentResult(
+                sentiment=SentimentResult(sentiment="neutral"), summary="Summary."
+            )
+        )
+
+        service = ProductDNAService(reddit=mock_reddit, llm=mock_llm, watermarks=watermarks)
+        request = CollectionRequest(keywords=["test"], limit=2, incremental=True)
+
+        result = await service.collect_and_enrich(request)
+
+        assert result.posts_collected == 2
+        tracker = watermarks.save.call_args[0][2]
+        assert not tracker.complete
+        assert tracker.advanced() == (newest, ["p0-1", "p0-0"])
+
+    @pytest.mark.asyncio
+    async def test_collect_stream_endpoint_emits_events_then_summary(self, client):
+        """Test that the streaming endpoint emits per-post events and a final summary."""
+        import json
+
+        from app.services.product_dna import ProductDNAService
+
+        async def fake_pipeline(request, on_event):
+            await on_event("collected", {"post_id": "p1"})
+            await on_event("enriched", {"post_id": "p1", "sentiment": "positive"})
+            await on_event("stored", {"post_id": "p1"})
+            return CollectionResponse(
+                success=True, posts_collected=1, posts_enriched=1, posts_stored=1
+            )
+
+        service = ProductDNAService(reddit=MagicMock(), llm=AsyncMock())
+        service.collect_and_enrich = AsyncMock(side_effect=fake_pipeline)
+
+        with patch("app.routers.product_dna.product_dna_service", service):
+            response = await client.post(
+                "/api/v1/product-dna/collect/stream", json={"keywords": ["test"]}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [event["event"] for event in events] == [
+            "collected",
+            "enriched",
+            "stored",
+            "summary",
+        ]
+        assert events[-1]["result"]["posts_stored"] == 1
+
+    @pytest.mark.asyncio
+    async def test_collect_events_closing_early_cancels_run(self):
+        """Test that abandoning the event stream cancels the collection."""
+        import asyncio
+
+        from app.services.product_dna import ProductDNAService
+
+        cancelled = asyncio.Event()
+
+        async def endless_pipeline(request, on_event):
+            await on_event("collected", {"post_id": "p1"})
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        service = ProductDNAService(reddit=MagicMock(), llm=AsyncMock())
+        service.collect_and_enrich = AsyncMock(side_effect=endless_pipeline)
+
+        events = service.collect_events(CollectionRequest(keywords=["test"]))
+        first = await events.__anext__()
+        await asyncio.wait_for(events.aclose(), timeout=1)
+
+        # The run has finished cancelling by the time the stream is closed
+        assert cancelled.is_set()
+        assert first == {"event": "collected", "post_id": "p1"}
+
+    @pytest.mark.asyncio
+    async def test_collect_events_cancel_with_full_queue_does_not_hang(self):
+        """Test that a client leaving while the event queue is full still ends the run."""
+        import asyncio
+
+        from app.config import settings
+        from app.services.product_dna import ProductDNAService
+
+        async def chatty_pipeline(request, on_event):
+            for index in range(100):
+                await on_event("collected", {"post_id": f"p{index}"})
+
+        service = ProductDNAService(reddit=MagicMock(), llm=AsyncMock())
+        service.collect_and_enrich = AsyncMock(side_effect=chatty_pipeline)
+
+        with patch.object(settings, "PIPELINE_QUEUE_SIZE", 2):
+            events = service.collect_events(CollectionRequest(keywords=["test"]))
+            await events.__anext__()
+            await asyncio.sleep(0.01)
+            await asyncio.wait_for(events.aclose(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_keyset_pagination_resumes_after_cursor(self, mock_mongodb):
+        """Test that the cursor filters strictly after the last (enriched_at, post_id)."""
+        from app.services.product_dna import ProductDNAService, decode_cursor
+
+        last_seen = datetime(2025, 12, 15, 10, 0, 0)
+
+        def stored_doc(post_id):
+            return {
+                "_id": "mongo-id",
+                "post_id": post_id,
+                "title": "Title",
+                "sentiment": "neutral",
+                "summary": "Summary.",
+                "metadata": {
+                    "url": "https://reddit.com/test",
+                    "subreddit": "marketing",
+                    "created_utc": last_seen,
+                },
+                "enriched_at": last_seen,
+            }
+
+        find_chain = async_cursor([stored_doc("b"), stored_doc("a")])
+        find_chain.sort.return_value.skip.return_value.limit.return_value = find_chain
+        mock_mongodb.find.return_value = find_chain
+
+        service = ProductDNAService()
+        posts, next_cursor = await service.get_product_dna_page(limit=2)
+
+        assert [post.post_id for post in posts] == ["b", "a"]
+        assert decode_cursor(next_cursor) == (last_seen, "a")
+
+        await service.get_product_dna_page(
+            sentiment=Sentiment.POSITIVE, limit=2, cursor=next_cursor
+        )
+
+        query = mock_mongodb.find.call_args[0][0]
+        assert query["sentiment"] == "positive"
+        assert query["$or"] == [
+            {"enriched_at": {"$lt": last_seen}},
+            {"enriched_at": last_seen, "post_id": {"$lt": "a"}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_summary_view_projects_fields(self, mock_mongodb):
+        """Test that the summary view fetches only list fields and skips the body."""
+        from app.models.reddit import ProductDNASummary
+        from app.services.product_dna import VIEW_PROJECTIONS, ProductDNAService
+
+        enriched_at = datetime(2024, 1, 1, tzinfo=UTC)
+        find_chain = async_cursor(
+            [
+                {
+                    "post_id": "a",
+                    "title": "Title",
+                    "sentiment": "negative",
+                    "confidence": 0.8,
+                    "summary": "Summary.",
+                    "metadata": {"subreddit": "marketing", "url": "https://reddit.com/a"},
+                    "enriched_at": enriched_at,
+                }
+            ]
+        )
+        find_chain.sort.return_value.skip.return_value.limit.return_value = find_chain
+        mock_mongodb.find.return_value = find_chain
+
+        posts = await ProductDNAService().get_product_dna(view="summary")
+
+        projection = mock_mongodb.find.call_args[0][1]
+        assert projection == VIEW_PROJECTIONS["summary"]
+        assert "body" not in projection
+        assert posts == [
+            ProductDNASummary(
+                post_id="a",
+                title="Title",
+                sentiment=Sentiment.NEGATIVE,
+                confidence=0.8,
+                summary="Summary.",
+                subreddit="marketing",
+                url="https://reddit.com/a",
+                enriched_at=enriched_at,
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_endpoint_summary_view(self, client):
+        """Test that view=summary returns slim records."""
+        from app.models.reddit import ProductDNASummary
+
+        summary = ProductDNASummary(
+            post_id="a",
+            title="Title",
+            sentiment=Sentiment.POSITIVE,
+            summary="Summary.",
+            subreddit="marketing",
+            url="https://reddit.com/a",
+            enriched_at=datetime(2024, 1, 1),
+        )
+        with patch("app.routers.product_dna.product_dna_service") as mock_service:
+            mock_service.get_product_dna_page = AsyncMock(return_value=([summary], None))
+            response = await client.get("/api/v1/product-dna/", params={"view": "summary"})
+
+        assert response.status_code == 200
+        assert mock_service.get_product_dna_page.call_args.kwargs["view"] == "summary"
+        assert set(response.json()[0]) == set(ProductDNASummary.model_fields)
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_400(self, client):
+        """Test that a malformed cursor is rejected as a bad request."""
+        response = await client.get("/api/v1/product-dna/", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_stats_single_aggregation_cached_until_write(self, mock_mongodb):
+        """Test that stats come from one $facet pass and are cached until posts are stored."""
+        from app.services.product_dna import ProductDNAService
+
+        last = datetime(2024, 1, 1, tzinfo=UTC)
+        facets = {
+            "total": [{"count": 3}],
+            "by_sentiment": [{"_id": "positive", "count": 2}, {"_id": "neutral", "count": 1}],
+            "by_subreddit": [{"_id": "marketing", "count": 3}],
+            "last_collection": [{"_id": None, "enriched_at": last}],
+        }
+        mock_mongodb.aggregate = MagicMock(side_effect=lambda pipeline: async_cursor([facets]))
+
+        service = ProductDNAService()
+        stats = await service.get_stats()
+        again = await service.get_stats()
+
+        assert mock_mongodb.aggregate.call_count == 1
+        assert "$facet" in mock_mongodb.aggregate.call_args[0][0][0]
+        assert again is stats
+        assert stats.total_posts == 3
+        assert stats.by_sentiment == {"positive": 2, "neutral": 1}
+        assert stats.by_subreddit == {"marketing": 3}
+        assert stats.last_collection == last
+
+        post = EnrichedPost(
+            post_id="new",
+            title="Title",
+            sentiment=Sentiment.NEUTRAL,
+            summary="Summary.",
+            metadata=PostMetadata(
+                url="https://reddit.com/test", subreddit="marketing", created_utc=last
+            ),
+        )
+        await service._store_posts([post])
+        await service.get_stats()
+
+        assert mock_mongodb.aggregate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stats_empty_collection(self, mock_mongodb):
+        """Test that an empty collection yields zeroed stats."""
+        from app.services.product_dna import ProductDNAService
+
+        empty = {"total": [], "by_sentiment": [], "by_subreddit": [], "last_collection": []}
+        mock_mongodb.aggregate = MagicMock(return_value=async_cursor([empty]))
+
+        stats = await ProductDNAService().get_stats()
+
+        assert stats.total_posts == 0
+        assert stats.by_sentiment == {}
+        assert stats.last_collection is None
@@ -0,0 +1,109 @@
+"""Tests for the shared token-bucket rate limiter."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import openai
+import pytest
+
+from app.integrations.rate_limiter import (
+    RateLimiter,
+    RedisTokenBucket,
+    TokenBucket,
+    parse_duration,
+    retry_delay,
+)
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    """Test that a full bucket serves its capacity at once, then waits 1/rate each."""
+    bucket = TokenBucket(rate=10, capacity=3)
+
+    waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1, abs=0.01)
+    assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_bucket_pause_delays_reservations():
+    """Test that a pause holds back reservations even when tokens are available."""
+    bucket = TokenBucket(rate=10, capacity=10)
+    bucket.pause(2)
+
+    assert bucket.reserve() == pytest.approx(2, abs=0.05)
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"Retry-After": "7"}, 7.0),
+        ({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "1m30s"}, 90.0),
+        ({"x-ratelimit-remaining-tokens": "0", "x-ratelimit-reset-tokens": "250ms"}, 0.25),
+        ({"x-ratelimit-remaining-requests": "12", "x-ratelimit-reset-requests": "1s"}, 0.0),
+        ({"X-Ratelimit-Remaining": "0.0", "X-Ratelimit-Reset": "42"}, 42.0),
+        ({}, 0.0),
+    ],
+)
+def test_retry_delay_from_headers(headers, expected):
+    """Test Retry-After, OpenAI and Reddit rate-limit header parsing."""
+    assert retry_delay(headers) == pytest.approx(expected)
+
+
+def test_parse_duration():
+    """Test OpenAI reset duration formats."""
+    assert parse_duration("6m0s") == 360
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("1h2m3.5s") == pytest.approx(3723.5)
+
+
+@pytest.mark.asyncio
+async def test_limiter_settles_token_estimate():
+    """Test that unused estimated tokens are returned to the token bucket."""
+    limiter = RateLimiter(
+        "test", requests_per_minute=6000, tokens_per_minute=600, burst_seconds=1, backend="memory"
+    )
+
+    await limiter.acquire(tokens=10)
+    await limiter.settle(estimated=10, actual=4)
+
+    # 10 tokens capacity: 4 spent, so 6 more fit without waiting
+    assert limiter.tokens.reserve(6) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_redis_bucket_falls_back_to_local():
+    """Test that an unreachable Redis degrades to in-process limiting."""
+    bucket = RedisTokenBucket("rate_limit:test:requests", rate=10, capacity=1)
+
+    with patch.object(bucket, "_get_redis", side_effect=ConnectionError("down")):
+        assert await bucket.reserve() == 0.0
+        assert await bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_llm_rate_limit_error_pauses_limiter():
+    """Test that a 429 from the LLM API feeds its headers back into the limiter."""
+    from app.integrations.llm import LLMService
+    from app.integrations.retry import RetryPolicy
+
+    limiter = MagicMock()
+    limiter.acquire = AsyncMock()
+    limiter.observe = AsyncMock()
+    response = httpx.Response(
+        429,
+        headers={"retry-after": "3"},
+        request=httpx.Request("POST", "https://example.test/chat/completions"),
+    )
+
+    service = LLMService(api_key="test", limiter=limiter, retry=RetryPolicy(attempts=1))
+    client = service.providers[0]._client = AsyncMock()
+    client.chat.completions.create = AsyncMock(
+        side_effect=openai.RateLimitError("rate limited", response=response, body=None)
+    )
+
+    with pytest.raises(openai.RateLimitError):
+        await service._complete([{"role": "user", "content": "x" * 40}], max_tokens=5)
+
+    assert limiter.acquire.call_args[0][0] == 15
+    assert limiter.observe.call_args[0][0]["retry-after"] == "3"
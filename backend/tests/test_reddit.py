@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestRedditSearchTool:
     """Tests for RedditSearchTool class."""
@@ -92,3 +94,244 @@ class TestRedditSearchTool:
 
         assert post_data["author"] == "[deleted]"
         assert post_data["external_url"] == "https://example.com"
+
+    @pytest.mark.asyncio
+    async def test_search_subreddits_async_matches_sync_shape(self):
+        """Test that the async search runs PRAW off-loop and returns the same dicts."""
+        import threading
+
+        mock_submission = MagicMock()
+        mock_submission.id = "async123"
+        mock_submission.title = "Async Post"
+        mock_submission.selftext = "Body"
+        mock_submission.score = 10
+        mock_submission.permalink = "/r/marketing/comments/async123"
+        mock_submission.subreddit.display_name = "marketing"
+        mock_submission.author = None
+        mock_submission.created_utc = 1702656000.0
+        mock_submission.num_comments = 1
+        mock_submission.upvote_ratio = 0.5
+        mock_submission.is_self = True
+
+        search_threads = []
+
+        def search(*args, **kwargs):
+            search_threads.append(threading.current_thread())
+            return [mock_submission]
+
+        from app.integrations.reddit import RedditSearchTool
+
+        tool = RedditSearchTool(
+            client_id="test_id", client_secret="test_secret", user_agent="test_agent"
+        )
+        tool._reddit = MagicMock()
+        tool._reddit.subreddit.return_value.search.side_effect = search
+
+        posts = await tool.search_subreddits_async(keywords=["async"], subreddits=["marketing"])
+
+        assert posts == [tool._extract_post_data(mock_submission)]
+        assert search_threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_praw_thread(self):
+        """Test that concurrent PRAW calls never run on more than one thread."""
+        import asyncio
+        import threading
+        import time
+
+        from app.integrations.reddit import RedditSearchTool
+
+        tool = RedditSearchTool(
+            client_id="test_id", client_secret="test_secret", user_agent="test_agent"
+        )
+        tool._reddit = MagicMock()
+        threads = set()
+        running = 0
+        overlapped = False
+
+        def blocking_call():
+            nonlocal running, overlapped
+            running += 1
+            overlapped = overlapped or running > 1
+            threads.add(threading.current_thread())
+            time.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(tool._run_in_thread(blocking_call) for _ in range(4)))
+
+        assert len(threads) == 1
+        assert not overlapped
+
+    @pytest.mark.asyncio
+    async def test_async_rate_limit_does_not_block_event_loop(self):
+        """Test that async rate limiting yields to other tasks instead of sleeping."""
+        import asyncio
+
+        from app.integrations.rate_limiter import RateLimiter
+        from app.integrations.reddit import RedditSearchTool
+
+        # 20 requests/second with a burst of one: the second request waits 50ms
+        limiter = RateLimiter("test", requests_per_minute=1200, burst_seconds=0.001)
+        tool = RedditSearchTool(
+            client_id="test_id",
+            client_secret="test_secret",
+            user_agent="test_agent",
+            limiter=limiter,
+        )
+        await tool._rate_limit_async()
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await tool._rate_limit_async()
+        task.cancel()
+
+        assert ticks > 1
+        assert limiter.stats()["throttled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_iter_search_pages_streams_in_pages(self):
+        """Test that streamed search yields pages and stops at the limit."""
+
+        def make_submission(index):
+            submission = MagicMock()
+            submission.id = f"post{index}"
+            submission.selftext = ""
+            submission.author = None
+            submission.created_utc = 1702656000.0
+            submission.is_self = True
+            return submission
+
+        from app.integrations.rate_limiter import RateLimiter
+        from app.integrations.reddit import RedditSearchTool
+
+        tool = RedditSearchTool(
+            client_id="test_id",
+            client_secret="test_secret",
+            user_agent="test_agent",
+            limiter=RateLimiter("test", requests_per_minute=60000),
+        )
+        tool._reddit = MagicMock()
+        tool._reddit.subreddit.return_value.search.return_value = iter(
+            [make_submission(i) for i in range(10)]
+        )
+
+        pages = [
+            page
+            async for page in tool.iter_search_pages(
+                keywords=["test"], subreddits=["marketing"], limit=7, page_size=3
+            )
+        ]
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert pages[0][0]["post_id"] == "post0"
+        assert pages[2][0]["post_id"] == "post6"
+
+    @pytest.mark.asyncio
+    async def test_fanout_merges_dedupes_and_ranks(self):
+        """Test that fan-out searches run per keyword, dedupe and stop at the limit."""
+
+        def make_submission(post_id, score):
+            submission = MagicMock()
+            submission.id = post_id
+            submission.score = score
+            submission.selftext = ""
+            submission.author = None
+            submission.created_utc = 1702656000.0
+            submission.is_self = True
+            return submission
+
+        from app.integrations.rate_limiter import RateLimiter
+        from app.integrations.reddit import RedditSearchTool
+
+        results = {
+            "alpha": [make_submission(f"a{i}", 1) for i in range(3)],
+            "beta": [make_submission("b0", 50), make_submission("a1", 1), make_submission("b1", 0)],
+            "gamma": RuntimeError("search failed"),
+        }
+
+        def search(query, **kwargs):
+            # PRAW listings are lazy: request errors surface while iterating
+            if isinstance(results[query], Exception):
+                yield from ()
+                raise results[query]
+            yield from results[query] + [make_submission(f"{query}-x{i}", 0) for i in range(9)]
+
+        tool = RedditSearchTool(
+            client_id="test_id",
+            client_secret="test_secret",
+            user_agent="test_agent",
+            limiter=RateLimiter("test", requests_per_minute=60000),
+        )
+        tool._reddit = MagicMock()
+        tool._reddit.subreddit.return_value.search.side_effect = search
+
+        pages = [
+            page
+            async for page in tool.iter_search_pages(
+                keywords=["alpha", "beta", "gamma"],
+                subreddits=["marketing"],
+                limit=4,
+                page_size=3,
+                fanout="keywords",
+            )
+        ]
+
+        ids = [post["post_id"] for page in pages for post in page]
+        # a1 was found by both searches; b0 outranks a0 on score at the same rank
+        assert ids == ["a1", "b0", "a0", "a2"]
+        assert [len(page) for page in pages] == [3, 1]
+        # One page per search was enough to reach the limit
+        assert tool._reddit.subreddit.return_value.search.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_search_pages_stops_at_since(self):
+        """Test that newest-first searches stop at the first post older than `since`."""
+        from datetime import datetime
+
+        from app.integrations.rate_limiter import RateLimiter
+        from app.integrations.reddit import RedditSearchTool
+
+        def make_submission(index):
+            submission = MagicMock()
+            submission.id = f"post{index}"
+            submission.selftext = ""
+            submission.author = None
+            submission.created_utc = 1702656000.0 - index * 3600
+            submission.is_self = True
+            return submission
+
+        tool = RedditSearchTool(
+            client_id="test_id",
+            client_secret="test_secret",
+            user_agent="test_agent",
+            limiter=RateLimiter("test", requests_per_minute=60000),
+        )
+        tool._reddit = MagicMock()
+        search = tool._reddit.subreddit.return_value.search
+        search.return_value = iter([make_submission(i) for i in range(10)])
+
+        pages = [
+            page
+            async for page in tool.iter_search_pages(
+                keywords=["test"],
+                subreddits=["marketing"],
+                limit=10,
+                page_size=2,
+                sort="new",
+                since=datetime.utcfromtimestamp(1702656000.0 - 4 * 3600),
+            )
+        ]
+
+        assert [[post["post_id"] for post in page] for page in pages] == [
+            ["post0", "post1"],
+            ["post2", "post3"],
+            ["post4"],
+        ]
+        assert search.call_args[1]["sort"] == "new"
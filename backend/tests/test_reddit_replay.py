@@ -0,0 +1,132 @@
+"""Tests for Reddit record/replay."""
+
+import gzip
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.integrations.reddit_replay import (
+    RedditRecorder,
+    RedditReplay,
+    read_records,
+    read_records_async,
+    write_records,
+)
+from benchmarks.corpus import synthetic_records
+
+
+def make_post(post_id: str, subreddit: str = "marketing", title: str = "Post") -> dict:
+    """Raw post shaped like RedditSearchTool._extract_post_data output."""
+    return {
+        "post_id": post_id,
+        "title": title,
+        "body": "",
+        "subreddit": subreddit,
+        "created_utc": datetime(2024, 5, 1, 12, 30),
+    }
+
+
+@pytest.mark.asyncio
+async def test_recorder_passes_pages_through_and_snapshots_them(tmp_path):
+    """Test that recorded pages replay with datetimes and comments restored."""
+    pages = [[make_post("a"), make_post("b")], [make_post("c")]]
+
+    async def iter_search_pages(**kwargs):
+        for page in pages:
+            yield page
+
+    tool = MagicMock()
+    tool.iter_search_pages = iter_search_pages
+    tool.get_top_comments_async = AsyncMock(
+        return_value=[{"comment_id": "x", "body": "Nice", "created_utc": datetime(2024, 5, 2)}]
+    )
+    path = tmp_path / "recording.jsonl.gz"
+    recorder = RedditRecorder(path, tool=tool, comments_per_post=1)
+
+    seen = [page async for page in recorder.iter_search_pages(keywords=["crm"], limit=3)]
+
+    assert seen == pages
+    records = list(read_records(path))
+    assert [r["post"]["post_id"] for r in records] == ["a", "b", "c"]
+    assert records[0]["post"]["created_utc"] == datetime(2024, 5, 1, 12, 30)
+    assert records[0]["comments"][0]["created_utc"] == datetime(2024, 5, 2)
+    assert "fetch_ms" in records[0]
+    with gzip.open(path, "rt") as f:
+        assert json.loads(f.readline())["post"]["created_utc"] == "2024-05-01T12:30:00"
+
+
+@pytest.mark.asyncio
+async def test_replay_filters_and_pages_up_to_limit(tmp_path):
+    """Test subreddit/keyword filtering, page sizes and the limit."""
+    path = tmp_path / "corpus.jsonl.gz"
+    write_records(
+        path,
+        [
+            {"post": make_post(f"p{i}", "marketing" if i % 2 else "other", f"crm tip {i}")}
+            for i in range(10)
+        ]
+        + [{"post": make_post("nomatch", "marketing", "unrelated")}],
+    )
+    replay = RedditReplay(path, speed=0, match_keywords=True)
+
+    pages = [
+        page
+        async for page in replay.iter_search_pages(
+            keywords=["CRM"], subreddits=["Marketing"], limit=4, page_size=3
+        )
+    ]
+
+    assert [[p["post_id"] for p in page] for page in pages] == [["p1", "p3", "p5"], ["p7"]]
+
+
+@pytest.mark.asyncio
+async def test_async_reader_decodes_off_the_event_loop(tmp_path):
+    """Test that async reads return every record, decoded on worker threads."""
+    import threading
+
+    path = tmp_path / "corpus.jsonl.gz"
+    write_records(path, [{"post": make_post(f"p{i}")} for i in range(5)])
+    loop_thread = threading.get_ident()
+    reader_threads = set()
+
+    def tracking_decode(item):
+        reader_threads.add(threading.get_ident())
+
+    with patch("app.integrations.reddit_replay._decode", side_effect=tracking_decode):
+        records = [record async for record in read_records_async(path, chunk_size=2)]
+
+    assert [record["post"]["post_id"] for record in records] == [f"p{i}" for i in range(5)]
+    assert reader_threads and loop_thread not in reader_threads
+
+
+@pytest.mark.asyncio
+async def test_replay_paces_pages_by_recorded_fetch_time(tmp_path):
+    """Test that each page sleeps for its posts' recorded fetch time over speed."""
+    path = tmp_path / "corpus.jsonl.gz"
+    write_records(path, [{"post": make_post(f"p{i}"), "fetch_ms": 100} for i in range(4)])
+    replay = RedditReplay(path, speed=2)
+
+    with patch("app.integrations.reddit_replay.asyncio.sleep", new=AsyncMock()) as sleep:
+        async for _ in replay.iter_search_pages(keywords=["x"], limit=4, page_size=2):
+            pass
+
+    assert [c.args[0] for c in sleep.await_args_list] == [0.1, 0.1]
+
+
+@pytest.mark.asyncio
+async def test_synthetic_corpus_replays_comments(tmp_path):
+    """Test that generated corpora are deterministic and serve comments."""
+    path = tmp_path / "synthetic.jsonl.gz"
+    write_records(path, synthetic_records(5, seed=3, comments=2))
+    replay = RedditReplay(path, speed=0)
+
+    posts = [
+        post async for page in replay.iter_search_pages(keywords=["x"], limit=5) for post in page
+    ]
+    comments = await replay.get_top_comments_async(posts[0]["post_id"], limit=1)
+
+    assert [p["title"] for p in posts] == [r["post"]["title"] for r in synthetic_records(5, seed=3)]
+    assert len(comments) == 1
+    assert isinstance(comments[0]["created_utc"], datetime)
@@ -0,0 +1,73 @@
+"""Tests for the LLM retry policy."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import openai
+import pytest
+
+from app.integrations.retry import RetryPolicy
+
+
+def rate_limit_error(retry_after: str | None = None) -> openai.RateLimitError:
+    """Build a 429 error as raised by the OpenAI client."""
+    headers = {"retry-after": retry_after} if retry_after else {}
+    response = httpx.Response(
+        429, headers=headers, request=httpx.Request("POST", "https://example.test")
+    )
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors_until_success():
+    """Test that transient errors are retried within the attempt budget."""
+    func = AsyncMock(side_effect=[rate_limit_error(), TimeoutError(), "ok"])
+    policy = RetryPolicy(attempts=3, base_delay=0.001, max_delay=0.01, deadline=5)
+
+    assert await policy.run(func) == "ok"
+    assert func.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_raises_immediately():
+    """Test that permanent errors are not retried."""
+    func = AsyncMock(side_effect=ValueError("bad request"))
+    policy = RetryPolicy(attempts=5, base_delay=0.001, deadline=5)
+
+    with pytest.raises(ValueError):
+        await policy.run(func)
+    assert func.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_attempt_budget_exhausted_raises_last_error():
+    """Test that the last error surfaces once attempts run out."""
+    func = AsyncMock(side_effect=rate_limit_error())
+    policy = RetryPolicy(attempts=2, base_delay=0.001, max_delay=0.01, deadline=5)
+
+    with pytest.raises(openai.RateLimitError):
+        await policy.run(func)
+    assert func.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_deadline_cuts_off_slow_attempts():
+    """Test that a hanging call is abandoned when the deadline expires."""
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    policy = RetryPolicy(attempts=5, base_delay=0.001, deadline=0.05)
+
+    with pytest.raises(TimeoutError):
+        await policy.run(hang)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_header_sets_minimum_delay():
+    """Test that Retry-After lengthens the jittered backoff, which otherwise stays capped."""
+    policy = RetryPolicy(attempts=3, base_delay=0.1, max_delay=0.2, deadline=60)
+
+    assert policy.backoff(1, rate_limit_error("5")) == 5.0
+    assert all(policy.backoff(10) <= 0.2 for _ in range(20))
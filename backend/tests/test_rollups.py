@@ -0,0 +1,124 @@
+"""Tests for Product DNA trend rollups."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.reddit import EnrichedPost, PostMetadata, Sentiment, TrendPoint
+from app.services.rollups import RollupService, bucket_start
+
+
+def make_post(post_id, sentiment, created_utc, keywords):
+    """Build an enriched post in r/marketing."""
+    return EnrichedPost(
+        post_id=post_id,
+        title="Title",
+        sentiment=sentiment,
+        summary="Summary.",
+        metadata=PostMetadata(
+            url="https://reddit.com/test", subreddit="marketing", created_utc=created_utc
+        ),
+        keywords=keywords,
+    )
+
+
+class TestRollupService:
+    """Tests for RollupService class."""
+
+    @pytest.fixture
+    def mock_rollups_collection(self):
+        """Mock the product_dna_rollups MongoDB collection."""
+        mock_collection = AsyncMock()
+        with patch("app.services.rollups.mongodb") as mock_mongo:
+            mock_mongo.get_collection.return_value = mock_collection
+            yield mock_collection
+
+    def test_bucket_start_truncates(self):
+        """Test that timestamps are truncated to hour and day buckets."""
+        moment = datetime(2024, 3, 5, 14, 37, 12)
+
+        assert bucket_start(moment, "hour") == datetime(2024, 3, 5, 14)
+        assert bucket_start(moment, "day") == datetime(2024, 3, 5)
+
+    @pytest.mark.asyncio
+    async def test_record_merges_increments_per_bucket(self, mock_rollups_collection):
+        """Test that posts in the same bucket become one $inc upsert per key."""
+        posts = [
+            make_post("a", Sentiment.POSITIVE, datetime(2024, 3, 5, 14, 5), ["seo"]),
+            make_post("b", Sentiment.NEGATIVE, datetime(2024, 3, 5, 14, 50), ["seo", "ads"]),
+        ]
+
+        touched = await RollupService().record(posts)
+
+        # 2 granularities x (all keywords, seo, ads)
+        assert touched == 6
+        operations = mock_rollups_collection.bulk_write.call_args[0][0]
+        docs = {
+            (op._filter["granularity"], op._filter["keyword"]): op._doc["$inc"] for op in operations
+        }
+        assert docs[("hour", None)] == {"total": 2, "positive": 1, "negative": 1}
+        assert docs[("day", "seo")] == {"total": 2, "positive": 1, "negative": 1}
+        assert docs[("day", "ads")] == {"total": 1, "negative": 1}
+
+    @pytest.mark.asyncio
+    async def test_rebuild_streams_source_in_chunks(self, mock_rollups_collection):
+        """Test that a rebuild fills a fresh collection per chunk and swaps it in."""
+        docs = [
+            {
+                "sentiment": "neutral",
+                "keywords": [],
+                "metadata": {"subreddit": "marketing", "created_utc": datetime(2024, 3, d)},
+            }
+            for d in range(1, 6)
+        ]
+        source_cursor = MagicMock()
+        source_cursor.__aiter__.return_value = docs
+        source = MagicMock()
+        source.find.return_value.batch_size.return_value = source_cursor
+
+        processed = await RollupService().rebuild(source, chunk_size=2)
+
+        assert processed == 5
+        mock_rollups_collection.delete_many.assert_called_once_with({})
+        mock_rollups_collection.create_indexes.assert_called_once()
+        assert mock_rollups_collection.bulk_write.call_count == 3
+        mock_rollups_collection.rename.assert_called_once_with(
+            "product_dna_rollups", dropTarget=True
+        )
+        source.find.return_value.batch_size.assert_called_once_with(2)
+
+    @pytest.mark.asyncio
+    async def test_get_trends_reads_rollups(self, mock_rollups_collection):
+        """Test that trends are grouped per bucket from the rollup collection."""
+        bucket = datetime(2024, 3, 5)
+        aggregate_cursor = MagicMock()
+        aggregate_cursor.__aiter__.return_value = [
+            {"_id": bucket, "total": 3, "positive": 2, "neutral": 1, "negative": 0}
+        ]
+        mock_rollups_collection.aggregate = MagicMock(return_value=aggregate_cursor)
+
+        points = await RollupService().get_trends(granularity="day", subreddit="marketing")
+
+        match = mock_rollups_collection.aggregate.call_args[0][0][0]["$match"]
+        assert match == {"granularity": "day", "keyword": None, "subreddit": "marketing"}
+        assert points == [
+            TrendPoint(
+                bucket=bucket, total=3, by_sentiment={"positive": 2, "neutral": 1, "negative": 0}
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_trends_endpoint(self, client):
+        """Test that GET /trends validates granularity and returns points."""
+        with patch("app.routers.product_dna.rollup_service") as mock_service:
+            mock_service.get_trends = AsyncMock(return_value=[])
+            response = await client.get(
+                "/api/v1/product-dna/trends", params={"granularity": "hour", "keyword": "seo"}
+            )
+            invalid = await client.get("/api/v1/product-dna/trends", params={"granularity": "week"})
+
+        assert response.status_code == 200
+        assert response.json() == []
+        assert mock_service.get_trends.call_args.kwargs["keyword"] == "seo"
+        assert invalid.status_code == 422
@@ -0,0 +1,222 @@
+"""Tests for scheduled collections."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.jobs import CollectionJob, JobStatus
+from app.models.reddit import CollectionRequest
+from app.models.schedules import CollectionSchedule, ScheduleCreate
+
+
+def make_schedule_doc(**fields):
+    """Stored schedule document that is due now."""
+    return {
+        "schedule_id": "sched1",
+        "name": "Hourly SEO",
+        "request": CollectionRequest(keywords=["seo"], incremental=True).model_dump(),
+        "interval_seconds": 3600,
+        "jitter_seconds": 60,
+        "enabled": True,
+        "next_run_at": datetime.utcnow() - timedelta(seconds=1),
+        **fields,
+    }
+
+
+class TestScheduleService:
+    """Tests for ScheduleService class."""
+
+    @pytest.fixture
+    def mock_schedules_collection(self):
+        """Mock the collection_schedules MongoDB collection."""
+        mock_collection = AsyncMock()
+        with patch("app.services.schedules.mongodb") as mock_mongo:
+            mock_mongo.get_collection.return_value = mock_collection
+            yield mock_collection
+
+    @pytest.mark.asyncio
+    async def test_create_spreads_first_run_within_jitter(self, mock_schedules_collection):
+        """Test that a new schedule is due within its jitter window, unlocked."""
+        from app.services.schedules import ScheduleService
+
+        before = datetime.utcnow()
+        schedule = await ScheduleService(jobs=MagicMock()).create(
+            ScheduleCreate(
+                name="Hourly SEO",
+                request=CollectionRequest(keywords=["seo"]),
+                interval_seconds=3600,
+                jitter_seconds=120,
+            )
+        )
+
+        assert before <= schedule.next_run_at <= datetime.utcnow() + timedelta(seconds=120)
+        doc = mock_schedules_collection.insert_one.call_args[0][0]
+        assert doc["schedule_id"] == schedule.schedule_id
+        assert doc["locked_by"] is None
+
+    @pytest.mark.asyncio
+    async def test_dispatch_claims_lock_and_queues_tagged_job(self, mock_schedules_collection):
+        """Test that a due schedule is locked, queued as a job and moved one interval on."""
+        from app.services.schedules import ScheduleService
+
+        mock_schedules_collection.find_one_and_update.return_value = make_schedule_doc()
+        jobs = AsyncMock()
+        jobs.enqueue.return_value = CollectionJob(
+            job_id="job1", status=JobStatus.QUEUED, request=CollectionRequest(keywords=["seo"])
+        )
+        service = ScheduleService(jobs=jobs)
+
+        dispatched = await service.dispatch_due()
+
+        claim_filter, claim_update = mock_schedules_collection.find_one_and_update.call_args[0]
+        assert claim_filter["enabled"] is True
+        assert claim_update["$set"]["locked_by"] == service.instance_id
+        jobs.enqueue.assert_called_once()
+        assert jobs.enqueue.call_args[1] == {"schedule_id": "sched1"}
+        assert jobs.enqueue.call_args[0][0].incremental is True
+
+        release_filter, release = mock_schedules_collection.update_one.call_args[0]
+        assert release_filter == {"schedule_id": "sched1", "locked_by": service.instance_id}
+        assert release["$set"]["last_job_id"] == "job1"
+        assert release["$set"]["locked_by"] is None
+        assert release["$inc"] == {"runs": 1}
+        delay = dispatched.next_run_at - datetime.utcnow()
+        assert timedelta(seconds=3600 - 61) <= delay <= timedelta(seconds=3600 + 60)
+
+    @pytest.mark.asyncio
+    async def test_dispatch_skips_while_previous_job_active(self, mock_schedules_collection):
+        """Test that a schedule does not overlap its own still-running job."""
+        from app.services.schedules import ScheduleService
+
+        mock_schedules_collection.find_one_and_update.return_value = make_schedule_doc(
+            last_job_id="job0"
+        )
+        jobs = AsyncMock()
+        jobs.get_job.return_value = CollectionJob(
+            job_id="job0", status=JobStatus.RUNNING, request=CollectionRequest(keywords=["seo"])
+        )
+
+        await ScheduleService(jobs=jobs).dispatch_due()
+
+        jobs.enqueue.assert_not_called()
+        release = mock_schedules_collection.update_one.call_args[0][1]
+        assert release["$inc"] == {"skipped_runs": 1}
+        assert "last_job_id" not in release["$set"]
+
+    @pytest.mark.asyncio
+    async def test_failed_enqueue_leaves_schedule_due(self, mock_schedules_collection):
+        """Test that a schedule whose job could not be queued is retried next tick."""
+        from app.services.schedules import ScheduleService
+
+        mock_schedules_collection.find_one_and_update.return_value = make_schedule_doc()
+        jobs = AsyncMock()
+        jobs.enqueue.side_effect = RuntimeError("mongo down")
+
+        with pytest.raises(RuntimeError):
+            await ScheduleService(jobs=jobs).dispatch_due()
+
+        release = mock_schedules_collection.update_one.call_args[0][1]
+        assert release == {"$set": {"locked_by": None, "lock_expires_at": None}}
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_returns_none(self, mock_schedules_collection):
+        """Test that dispatch is a no-op when no schedule can be claimed."""
+        from app.services.schedules import ScheduleService
+
+        mock_schedules_collection.find_one_and_update.return_value = None
+        jobs = AsyncMock()
+
+        assert await ScheduleService(jobs=jobs).dispatch_due() is None
+        jobs.enqueue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_schedule_endpoint_returns_201(self, client):
+        """Test that POST /schedules stores and returns the schedule."""
+        created = CollectionSchedule(**make_schedule_doc())
+        with patch("app.routers.schedules.schedule_service") as mock_service:
+            mock_service.create = AsyncMock(return_value=created)
+            response = await client.post(
+                "/api/v1/product-dna/schedules",
+                json={
+                    "name": "Hourly SEO",
+                    "request": {"keywords": ["seo"]},
+                    "interval_seconds": 3600,
+                },
+            )
+
+        assert response.status_code == 201
+        assert response.json()["schedule_id"] == "sched1"
+
+    @pytest.mark.asyncio
+    async def test_schedule_interval_has_a_floor(self, client):
+        """Test that schedules cannot run more often than once a minute."""
+        response = await client.post(
+            "/api/v1/product-dna/schedules",
+            json={"name": "Too often", "request": {"keywords": ["seo"]}, "interval_seconds": 5},
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_schedule_runs_endpoint_lists_jobs(self, client):
+        """Test that GET /schedules/{id}/runs returns the schedule's jobs."""
+        job = CollectionJob(
+            job_id="job1",
+            status=JobStatus.COMPLETED,
+            request=CollectionRequest(keywords=["seo"]),
+            schedule_id="sched1",
+        )
+        with patch("app.routers.schedules.schedule_service") as mock_service:
+            mock_service.history = AsyncMock(return_value=[job])
+            response = await client.get("/api/v1/product-dna/schedules/sched1/runs?limit=5")
+
+        assert response.status_code == 200
+        assert response.json()[0]["schedule_id"] == "sched1"
+        mock_service.history.assert_called_once_with("sched1", limit=5)
+
+    @pytest.mark.asyncio
+    async def test_get_unknown_schedule_returns_404(self, client):
+        """Test that GET /schedules/{id} returns 404 for unknown schedules."""
+        with patch("app.routers.schedules.schedule_service") as mock_service:
+            mock_service.get = AsyncMock(return_value=None)
+            response = await client.get("/api/v1/product-dna/schedules/missing")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_update_rejects_nulls_for_required_fields(self, client):
+        """Test that PATCH cannot null out fields a stored schedule needs."""
+        with patch("app.routers.schedules.schedule_service") as mock_service:
+            mock_service.update = AsyncMock()
+            response = await client.patch(
+                "/api/v1/product-dna/schedules/sched1",
+                json={"interval_seconds": None, "enabled": None, "request": None},
+            )
+
+        assert response.status_code == 422
+        mock_service.update.assert_not_called()
+
+    def test_update_allows_resetting_jitter(self):
+        """Test that jitter_seconds can be cleared back to the default spread."""
+        from app.models.schedules import ScheduleUpdate
+
+        update = ScheduleUpdate(jitter_seconds=None, enabled=False)
+
+        assert update.model_dump(exclude_unset=True) == {"jitter_seconds": None, "enabled": False}
+
+    @pytest.mark.asyncio
+    async def test_dispatch_disables_invalid_schedule(self, mock_schedules_collection):
+        """Test that a stored schedule that no longer validates is disabled and unlocked."""
+        from app.services.schedules import ScheduleService
+
+        mock_schedules_collection.find_one_and_update.return_value = make_schedule_doc(
+            interval_seconds=None
+        )
+        jobs = AsyncMock()
+
+        assert await ScheduleService(jobs=jobs).dispatch_due() is None
+
+        jobs.enqueue.assert_not_called()
+        release = mock_schedules_collection.update_one.call_args[0][1]
+        assert release == {"$set": {"enabled": False, "locked_by": None, "lock_expires_at": None}}
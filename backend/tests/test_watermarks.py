@@ -0,0 +1,117 @@
+"""Tests for incremental collection watermarks."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.config import settings
+from app.models.reddit import CollectionWatermark
+from app.services.watermarks import WatermarkService, WatermarkTracker, query_key
+
+NOW = datetime(2024, 3, 5, 12, 0)
+
+
+def make_post(post_id, minutes_ago):
+    """Raw post created `minutes_ago` before NOW."""
+    return {"post_id": post_id, "created_utc": NOW - timedelta(minutes=minutes_ago)}
+
+
+def make_watermark(seen_ids, newest=NOW):
+    """Watermark for the ["seo"] query in the default subreddits."""
+    return CollectionWatermark(
+        query_key=query_key(["seo"], None),
+        keywords=["seo"],
+        subreddits=["marketing"],
+        newest_created_utc=newest,
+        seen_ids=seen_ids,
+        updated_at=newest,
+    )
+
+
+class TestWatermarks:
+    """Tests for WatermarkTracker and WatermarkService."""
+
+    @pytest.fixture
+    def mock_watermarks_collection(self):
+        """Mock the collection_watermarks MongoDB collection."""
+        mock_collection = AsyncMock()
+        with patch("app.services.watermarks.mongodb") as mock_mongo:
+            mock_mongo.get_collection.return_value = mock_collection
+            yield mock_collection
+
+    def test_query_key_ignores_order_and_case(self):
+        """Test that equivalent queries share a watermark."""
+        assert query_key(["SEO", "ads"], ["Marketing", "SaaS"]) == query_key(
+            ["ads", "seo"], ["saas", "marketing"]
+        )
+        assert query_key(["seo"], None) != query_key(["seo"], ["marketing"])
+
+    def test_first_run_has_no_cutoff(self):
+        """Test that a query without a watermark scans its whole time window."""
+        tracker = WatermarkTracker(None)
+
+        assert tracker.cutoff is None
+        assert tracker.advanced() is None
+
+    def test_tracker_overlaps_and_merges_seen_ids(self):
+        """Test the overlap cutoff and that seen IDs keep the newest posts."""
+        tracker = WatermarkTracker(make_watermark(["old1", "old2"]), max_ids=3)
+
+        with patch.object(settings, "WATERMARK_OVERLAP_SECONDS", 600):
+            assert tracker.cutoff == NOW - timedelta(minutes=10)
+        assert tracker.is_seen("old1")
+        assert not tracker.is_seen("new1")
+
+        for post in (make_post("new2", -5), make_post("new1", -10), make_post("late", 5)):
+            tracker.observe(post)
+
+        newest, seen_ids = tracker.advanced()
+        assert newest == NOW + timedelta(minutes=10)
+        assert seen_ids == ["new1", "new2", "late"]
+
+    def test_tracker_never_moves_watermark_back(self):
+        """Test that late-indexed posts alone do not lower the watermark."""
+        tracker = WatermarkTracker(make_watermark(["old1"]))
+        tracker.observe(make_post("late", 5))
+
+        newest, seen_ids = tracker.advanced()
+        assert newest == NOW
+        assert seen_ids == ["late", "old1"]
+
+    @pytest.mark.asyncio
+    async def test_save_upserts_by_query_key(self, mock_watermarks_collection):
+        """Test that saving a run upserts one document per normalized query."""
+        tracker = WatermarkTracker(None)
+        tracker.observe(make_post("p1", 0))
+
+        watermark = await WatermarkService().save(["SEO"], ["marketing"], tracker)
+
+        assert watermark.newest_created_utc == NOW
+        query, update = mock_watermarks_collection.update_one.call_args[0]
+        assert query == {"query_key": "seo@marketing"}
+        assert update["$set"]["seen_ids"] == ["p1"]
+        assert mock_watermarks_collection.update_one.call_args[1]["upsert"] is True
+
+    def test_run_stopped_at_limit_keeps_watermark_time(self):
+        """Test that an incomplete run keeps paging down to the old cutoff next time."""
+        tracker = WatermarkTracker(make_watermark(["old1"]))
+        page = [make_post("new1", -30), make_post("old1", 0), make_post("new2", -20)]
+
+        assert tracker.search_limit(2) == 3
+        unseen, seen = tracker.take(page, room=1)
+
+        assert [post["post_id"] for post in unseen] == ["new1"]
+        assert seen == 1
+        assert not tracker.complete
+        newest, seen_ids = tracker.advanced()
+        assert newest == NOW
+        assert seen_ids == ["new1", "old1"]
+
+        # The next run skips what this one collected and continues downwards
+        next_run = WatermarkTracker(make_watermark(seen_ids, newest=newest))
+        unseen, seen = next_run.take(page, room=5)
+        assert [post["post_id"] for post in unseen] == ["new2"]
+        assert seen == 2
+        assert next_run.complete
+        assert next_run.advanced()[0] == NOW + timedelta(minutes=30)